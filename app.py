@@ -18,7 +18,6 @@ Version: 3.1 FINALE - Évolution corrigée + Footer CCOUSP/MINSANTE
 """
 
 import streamlit as st
-import streamlit.components.v1 as components
 import pandas as pd
 from datetime import datetime
 
@@ -28,7 +27,7 @@ from utils.data_loader import charger_toutes_les_donnees
 from utils.data_processor import obtenir_statistiques_globales
 from utils.helpers import formater_nombre, obtenir_evolution_temporelle
 from utils.logger import setup_logger, log_chargement_donnees, log_erreur
-from components.layout import apply_custom_css, page_header
+from components.layout import apply_custom_css, force_hamburger_visible, page_header
 from components.sidebar import render_sidebar
 from components.metrics import metric_row
 from utils.charts import (
@@ -54,72 +53,7 @@ st.set_page_config(
 
 apply_custom_css()
 
-components.html("""
-<script>
-function forceHamburgerAlwaysVisible() {
-    const selectors = [
-        '[data-testid="collapsedControl"]',
-        'button[kind="icon"]',
-        '[class*="collapsedControl"]'
-    ];
-    
-    let btn = null;
-    for (const selector of selectors) {
-        btn = parent.document.querySelector(selector);
-        if (btn) break;
-    }
-    
-    if (btn) {
-        btn.style.cssText = `
-            display: block !important;
-            visibility: visible !important;
-            opacity: 1 !important;
-            position: fixed !important;
-            top: 4.2rem !important;
-            left: 0.8rem !important;
-            z-index: 9999999999 !important;
-            width: 52px !important;
-            height: 52px !important;
-            background: linear-gradient(135deg, #007A33 0%, #00a844 100%) !important;
-            border-radius: 10px !important;
-            border: 3px solid white !important;
-            box-shadow: 0 4px 16px rgba(0, 122, 51, 0.5) !important;
-            cursor: pointer !important;
-            transition: all 0.2s ease !important;
-            pointer-events: auto !important;
-        `;
-        
-        btn.setAttribute('aria-hidden', 'false');
-        
-        if (btn.parentElement) {
-            btn.parentElement.style.cssText = `
-                display: block !important;
-                visibility: visible !important;
-                opacity: 1 !important;
-            `;
-        }
-    }
-}
-
-setInterval(forceHamburgerAlwaysVisible, 100);
-
-const observer = new MutationObserver(forceHamburgerAlwaysVisible);
-observer.observe(parent.document.body, { 
-    childList: true, 
-    subtree: true,
-    attributes: true,
-    attributeFilter: ['style', 'class', 'aria-hidden']
-});
-
-forceHamburgerAlwaysVisible();
-
-parent.document.addEventListener('click', function(e) {
-    setTimeout(forceHamburgerAlwaysVisible, 50);
-    setTimeout(forceHamburgerAlwaysVisible, 200);
-    setTimeout(forceHamburgerAlwaysVisible, 500);
-});
-</script>
-""", height=0)
+force_hamburger_visible()
 
 logger = setup_logger('app')
 logger.info("=== Page d'accueil chargée ===")
@@ -144,7 +78,9 @@ page_header(
 # CHARGEMENT DONNÉES
 # ==============================================================================
 
-@st.cache_data(ttl=settings.CACHE_CONFIG['ttl'])
+# st.cache_resource : les DataFrames sont partagés sans copie (pas d'aller-retour
+# pickle à chaque rerun) ; ils sont en lecture seule sur cette page.
+@st.cache_resource(ttl=settings.CACHE_CONFIG['weekly_data_ttl'])
 def load_data():
     try:
         donnees = charger_toutes_les_donnees()
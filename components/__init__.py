@@ -23,6 +23,7 @@ Version: 2.0
 # ============================================================================
 from components.layout import (
     apply_custom_css,
+    force_hamburger_visible,
     page_header,
     section_header,
     page_footer,
@@ -61,18 +62,28 @@ from components.tables import (
 )
 
 # ============================================================================
-# CHARTS - Wrappers de graphiques réutilisables
+# CHARTS - Wrappers de graphiques réutilisables (import paresseux)
 # ============================================================================
-from components.charts import (
-    graphique_evolution_semaines,
-    graphique_top_categories,
-    graphique_repartition_regroupements,
-    graphique_comparaison_semaines,
-    graphique_evolution_journaliere,
-    graphique_comparaison_mensuelle,
-    afficher_graphique,
-    graphique_avec_export
-)
+# components.charts importe utils.charts : il n'est chargé qu'au premier
+# accès à un wrapper, et non à chaque import de components.layout & co.
+_CHART_NAMES = frozenset({
+    'graphique_evolution_semaines',
+    'graphique_top_categories',
+    'graphique_repartition_regroupements',
+    'graphique_comparaison_semaines',
+    'graphique_evolution_journaliere',
+    'graphique_comparaison_mensuelle',
+    'afficher_graphique',
+    'graphique_avec_export'
+})
+
+
+def __getattr__(name):
+    """Résout à la demande les wrappers de components.charts (PEP 562)."""
+    if name in _CHART_NAMES:
+        from components import charts
+        return getattr(charts, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Version du module
 __version__ = '2.0'
@@ -82,6 +93,7 @@ __author__ = 'Fred - AIMS Cameroon'
 __all__ = [
     # Layout
     'apply_custom_css',
+    'force_hamburger_visible',
     'page_header',
     'section_header',
     'page_footer',
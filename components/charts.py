@@ -204,11 +204,9 @@ def graphique_comparaison_semaines(df_appels, semaines_list, categories=None):
     else:
         # Comparaison par catégories
         comparison_data = []
-        reverse_labels = {v: k for k, v in settings.LABELS_CATEGORIES.items()}
-        
         for categorie_label in categories:
-            if categorie_label in reverse_labels:
-                categorie_code = reverse_labels[categorie_label]
+            if categorie_label in settings.LABELS_CATEGORIES_INV:
+                categorie_code = settings.LABELS_CATEGORIES_INV[categorie_label]
                 row_data = {'Catégorie': categorie_label}
                 
                 for semaine in semaines_list:
@@ -7,6 +7,7 @@ l'ensemble de l'application Streamlit.
 
 Composants disponibles :
 - apply_custom_css() : Charge le CSS centralisé
+- force_hamburger_visible() : Script unique du bouton hamburger
 - page_header() : Header de page avec bannière Cameroun
 - section_header() : Header de section avec bordure jaune
 - page_footer() : Footer standard MINSANTE
@@ -25,6 +26,7 @@ Version: 2.0
 """
 
 import streamlit as st
+import streamlit.components.v1 as components
 from pathlib import Path
 import sys
 
@@ -37,6 +39,12 @@ from config import settings
 # FONCTION 1 : CHARGER LE CSS CENTRALISÉ
 # ==============================================================================
 
+@st.cache_resource(show_spinner=False)
+def _lire_css(chemin_css, mtime):
+    """Lit styles.css une fois par version du fichier (clé : date de modification)."""
+    with open(chemin_css, 'r', encoding='utf-8') as f:
+        return f.read()
+
 def apply_custom_css():
     """
     Charge le fichier CSS centralisé dans la page Streamlit.
@@ -62,23 +70,88 @@ def apply_custom_css():
         # Chemin vers le fichier CSS
         css_file = settings.BASE_DIR / 'config' / 'styles.css'
         
-        if css_file.exists():
-            # Lire le contenu du CSS
-            with open(css_file, 'r', encoding='utf-8') as f:
-                css_content = f.read()
-            
-            # Injecter dans Streamlit
-            st.markdown(f'<style>{css_content}</style>', unsafe_allow_html=True)
-            
-            return True
-        else:
+        # Un seul stat() : existence et date de modification (clé du cache)
+        try:
+            css_mtime = css_file.stat().st_mtime
+        except FileNotFoundError:
             st.warning(f"⚠️ Fichier CSS introuvable : {css_file}")
             return False
+        
+        # Lire le contenu du CSS (en cache tant que le fichier ne change pas)
+        css_content = _lire_css(str(css_file), css_mtime)
+        
+        # Injecter dans Streamlit
+        st.markdown(f'<style>{css_content}</style>', unsafe_allow_html=True)
+        
+        return True
             
     except Exception as e:
         st.error(f"❌ Erreur lors du chargement du CSS : {str(e)}")
         return False
 
+# ==============================================================================
+# FONCTION 1 BIS : BOUTON HAMBURGER TOUJOURS VISIBLE
+# ==============================================================================
+
+# Le style du bouton est porté une seule fois par config/styles.css (sélecteur
+# [data-testid="collapsedControl"], injecté par apply_custom_css) : la cascade
+# CSS suffit à le garder visible. Le script ne fait plus qu'une passe unique
+# (querySelector + aria-hidden), retentée sur quelques frames si le bouton
+# n'est pas encore monté, puis s'arrête : ni minuterie ni MutationObserver.
+_HAMBURGER_SCRIPT = """
+<script>
+(function() {
+    const selecteur = '[data-testid="collapsedControl"], [class*="collapsedControl"]';
+    const doc = parent.document;
+    let essais = 30;
+    
+    function reveler() {
+        const btn = doc.querySelector(selecteur);
+        if (btn) {
+            btn.setAttribute('aria-hidden', 'false');
+            return;
+        }
+        // Bouton pas encore rendu : nouvel essai à la frame suivante, borné
+        if (--essais > 0) requestAnimationFrame(reveler);
+    }
+    
+    reveler();
+})();
+</script>
+"""
+
+@st.cache_resource(show_spinner=False)
+def _injecter_script_hamburger():
+    """
+    Émet l'iframe du script hamburger, construite une seule fois par processus.
+    
+    Les éléments émis dans une fonction en cache sont rejoués par Streamlit
+    aux appels suivants : l'iframe reste montée sans reconstruire l'élément.
+    """
+    components.html(_HAMBURGER_SCRIPT, height=0)
+
+def force_hamburger_visible():
+    """
+    Garantit que le bouton hamburger de la sidebar reste accessible.
+    
+    Le style (display, visibility, position...) est appliqué une fois pour
+    toutes par le CSS centralisé chargé via apply_custom_css() ; aucune
+    réécriture de style.cssText côté navigateur. Le script injecté se limite
+    à retirer aria-hidden du bouton en une passe, retentée au plus sur
+    quelques frames si le bouton n'est pas encore monté.
+    
+    Note:
+        Pas de drapeau st.session_state pour n'injecter qu'une fois :
+        Streamlit démonte l'iframe dès qu'un rerun ne la réémet pas. À
+        contenu identique, l'iframe est conservée et le script n'est pas
+        réexécuté.
+    
+    Example:
+        >>> apply_custom_css()
+        >>> force_hamburger_visible()
+    """
+    _injecter_script_hamburger()
+
 # ==============================================================================
 # FONCTION 2 : HEADER DE PAGE PRINCIPAL
 # ==============================================================================
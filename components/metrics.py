@@ -533,13 +533,17 @@ def gauge_metric(
 # FONCTION BONUS 2 : STAT CARD COMPACTE
 # ==============================================================================
 
-def stat_card_compact(stats_dict, title=None):
+def stat_card_compact(stats_dict, title=None, columns=2):
     """
     Affiche plusieurs statistiques dans une carte compacte.
     
+    La carte est un seul élément Streamlit (un st.markdown), quel que soit
+    le nombre de statistiques : à préférer à une rangée de st.metric.
+    
     Args:
         stats_dict (dict): Dictionnaire {label: valeur}
         title (str, optional): Titre de la carte
+        columns (int): Nombre de colonnes de la grille (2 par défaut)
     
     Example:
         >>> stats = {
@@ -575,7 +579,7 @@ def stat_card_compact(stats_dict, title=None):
         '''
     
     # Grille de statistiques
-    html += '<div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 15px;">'
+    html += f'<div style="display: grid; grid-template-columns: repeat({columns}, 1fr); gap: 15px;">'
     
     for label, value in stats_dict.items():
         html += f'''
@@ -28,6 +28,7 @@ import streamlit as st
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
+import hashlib
 import sys
 
 # Import de la configuration
@@ -47,7 +48,9 @@ def display_dataframe_formatted(
     height=600,
     use_container_width=True,
     hide_index=True,
-    title=None
+    title=None,
+    page_size=None,
+    key=None
 ):
     """
     Affiche un DataFrame avec formatage automatique.
@@ -66,6 +69,9 @@ def display_dataframe_formatted(
         use_container_width (bool): Utiliser toute la largeur du conteneur
         hide_index (bool): Masquer l'index
         title (str, optional): Titre du tableau
+        page_size (int, optional): Lignes par page (pagination si dépassé)
+        key (str, optional): Clé du sélecteur de page (obligatoire si
+            plusieurs tableaux paginés sur la même page)
     
     Returns:
         None (affiche directement dans Streamlit)
@@ -79,8 +85,24 @@ def display_dataframe_formatted(
     
     Note:
         Cette fonction remplace les appels répétés à st.dataframe()
-        avec formatage manuel.
+        avec formatage manuel. Avec page_size, seule la page courante est
+        formatée et envoyée au navigateur.
     """
+    # === PAGINATION ===
+    if page_size and len(df) > page_size:
+        nb_pages = -(-len(df) // page_size)
+        page = st.number_input(
+            f"Page (sur {nb_pages}) :",
+            min_value=1,
+            max_value=nb_pages,
+            value=1,
+            step=1,
+            key=key
+        )
+        debut = (page - 1) * page_size
+        df = df.iloc[debut:debut + page_size]
+        st.caption(f"Lignes {debut + 1} à {debut + len(df)}")
+    
     # Copier le DataFrame pour ne pas modifier l'original
     df_display = df.copy()
     
@@ -117,6 +139,34 @@ def display_dataframe_formatted(
 # FONCTION 2 : BOUTONS D'EXPORT MULTIFORMATS
 # ==============================================================================
 
+def _empreinte_df(df):
+    """
+    Empreinte légère d'un DataFrame (clé de cache des exports).
+    
+    Un hachage vectorisé des lignes reste bien moins coûteux que la
+    sérialisation CSV/Excel qu'il permet d'éviter. Les hachages de lignes
+    sont digérés dans l'ordre (blake2b) : un simple tri des lignes, qui
+    change le fichier exporté, change aussi l'empreinte.
+    """
+    hachages = pd.util.hash_pandas_object(df, index=True).to_numpy()
+    return (
+        df.shape,
+        tuple(df.columns),
+        tuple(df.dtypes.astype(str)),
+        hashlib.blake2b(hachages.tobytes(), digest_size=16).hexdigest()
+    )
+
+# Les octets exportés peuvent peser lourd : nombre d'entrées borné
+@st.cache_data(ttl=settings.CACHE_CONFIG['ttl'], max_entries=20, show_spinner=False)
+def _csv_bytes(empreinte, _df):
+    """CSV encodé, mis en cache par empreinte (le DataFrame n'est pas haché)."""
+    return convert_df_to_csv(_df)
+
+@st.cache_data(ttl=settings.CACHE_CONFIG['ttl'], max_entries=20, show_spinner=False)
+def _excel_bytes(empreinte, _df, sheet_name):
+    """Excel encodé, mis en cache par empreinte (le DataFrame n'est pas haché)."""
+    return convert_df_to_excel(_df, sheet_name=sheet_name)
+
 def export_buttons(
     df,
     filename_prefix="export",
@@ -165,6 +215,10 @@ def export_buttons(
     # Créer les colonnes
     cols = st.columns(columns)
     
+    # Empreinte unique : les reruns sans changement de filtre réutilisent
+    # les octets déjà sérialisés
+    empreinte = _empreinte_df(df)
+    
     # === EXPORT CSV ===
     if 'csv' in formats:
         col_index = formats.index('csv')
@@ -177,7 +231,7 @@ def export_buttons(
                 filename_csv = f"{filename_prefix}.csv"
             
             # Convertir en CSV
-            csv_data = convert_df_to_csv(df)
+            csv_data = _csv_bytes(empreinte, df)
             
             # Bouton de téléchargement
             st.download_button(
@@ -201,7 +255,7 @@ def export_buttons(
                 filename_excel = f"{filename_prefix}.xlsx"
             
             # Convertir en Excel
-            excel_data = convert_df_to_excel(df, sheet_name='Données')
+            excel_data = _excel_bytes(empreinte, df, 'Données')
             
             # Bouton de téléchargement
             st.download_button(
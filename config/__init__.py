@@ -36,6 +36,7 @@ from config.settings import (
     # Catégories et labels
     CATEGORIES_APPELS,
     LABELS_CATEGORIES,
+    LABELS_CATEGORIES_INV,
     REGROUPEMENTS,
     LABELS_REGROUPEMENTS,
     
@@ -73,6 +74,7 @@ __all__ = [
     'BACKUPS_DIR',
     'CATEGORIES_APPELS',
     'LABELS_CATEGORIES',
+    'LABELS_CATEGORIES_INV',
     'REGROUPEMENTS',
     'LABELS_REGROUPEMENTS',
     'COULEURS_CAMEROUN',
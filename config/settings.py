@@ -22,6 +22,7 @@ Version: 2.1 - Ajout chargement drapeau
 
 import os
 from pathlib import Path
+from types import MappingProxyType
 import base64
 
 # ==============================================================================
@@ -37,6 +38,7 @@ LOGS_DIR = BASE_DIR / "logs"
 ASSETS_DIR = BASE_DIR / "assets"
 OUTPUTS_DIR = BASE_DIR / "outputs"
 BACKUPS_DIR = DATA_DIR / "backups"
+CACHE_DIR = DATA_DIR / "_cache"  # Copies Parquet des fichiers Excel (recréées à la demande)
 
 # Création automatique des répertoires si nécessaire
 for directory in [DATA_DIR, LOGS_DIR, ASSETS_DIR, OUTPUTS_DIR, BACKUPS_DIR]:
@@ -162,6 +164,9 @@ LABELS_CATEGORIES = {
     "HARCELEMENTS_JOUR": "Appels de Harcèlement"
 }
 
+# Correspondance inverse label → code (lecture seule, calculée une fois)
+LABELS_CATEGORIES_INV = MappingProxyType({v: k for k, v in LABELS_CATEGORIES.items()})
+
 # ==============================================================================
 # REGROUPEMENTS THÉMATIQUES (5 GROUPES)
 # ==============================================================================
@@ -341,6 +346,10 @@ GRAPH_CONFIG = {
 
 CACHE_CONFIG = {
     'ttl': 3600,  # Time To Live : 1 heure (3600 secondes)
+    # TTL par type de ressource, alignés sur la cadence réelle de mise à jour
+    'weekly_data_ttl': 6 * 3600,  # Données hebdomadaires : 6 heures
+    'report_ttl': 7 * 86400,  # Rapports générés : 7 jours
+    'listing_ttl': 30,  # Listes de fichiers sur disque : 30 secondes
     'max_entries': 100,  # Nombre maximum d'entrées en cache
     'show_spinner': True,
     'spinner_text': '🔄 Chargement des données en cours...'
@@ -561,6 +570,14 @@ HELP_TEXTS = {
     """
 }
 
+# ==============================================================================
+# CONFIGURATION DE L'INTERFACE
+# ==============================================================================
+
+UX_CONFIG = {
+    'celebrate': False  # Animations décoratives (st.balloons) après un succès
+}
+
 # ==============================================================================
 # CONFIGURATION AVANCÉE (OPTIONNEL)
 # ==============================================================================
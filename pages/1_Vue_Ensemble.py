@@ -16,16 +16,15 @@ Version: 3.0 FINALE - Footer CCOUSP/MINSANTE intégré
 """
 
 import streamlit as st
-import streamlit.components.v1 as components
 import pandas as pd
 
 # Imports de la nouvelle architecture
 from config import settings
 from utils.data_loader import charger_toutes_les_donnees
 from utils.data_processor import calculer_totaux_semaine, calculer_variations
-from utils.helpers import obtenir_derniere_semaine, obtenir_semaine_precedente, formater_nombre, extraire_numero_semaine
+from utils.helpers import formater_nombre
 from utils.logger import setup_logger
-from components.layout import apply_custom_css, page_header, section_header, page_footer
+from components.layout import apply_custom_css, force_hamburger_visible, page_header, section_header, page_footer
 from components.sidebar import render_sidebar
 from components.tables import export_buttons
 
@@ -53,72 +52,7 @@ st.set_page_config(
 
 apply_custom_css()
 
-components.html("""
-<script>
-function forceHamburgerAlwaysVisible() {
-    const selectors = [
-        '[data-testid="collapsedControl"]',
-        'button[kind="icon"]',
-        '[class*="collapsedControl"]'
-    ];
-    
-    let btn = null;
-    for (const selector of selectors) {
-        btn = parent.document.querySelector(selector);
-        if (btn) break;
-    }
-    
-    if (btn) {
-        btn.style.cssText = `
-            display: block !important;
-            visibility: visible !important;
-            opacity: 1 !important;
-            position: fixed !important;
-            top: 4.2rem !important;
-            left: 0.8rem !important;
-            z-index: 9999999999 !important;
-            width: 52px !important;
-            height: 52px !important;
-            background: linear-gradient(135deg, #007A33 0%, #00a844 100%) !important;
-            border-radius: 10px !important;
-            border: 3px solid white !important;
-            box-shadow: 0 4px 16px rgba(0, 122, 51, 0.5) !important;
-            cursor: pointer !important;
-            transition: all 0.2s ease !important;
-            pointer-events: auto !important;
-        `;
-        
-        btn.setAttribute('aria-hidden', 'false');
-        
-        if (btn.parentElement) {
-            btn.parentElement.style.cssText = `
-                display: block !important;
-                visibility: visible !important;
-                opacity: 1 !important;
-            `;
-        }
-    }
-}
-
-setInterval(forceHamburgerAlwaysVisible, 100);
-
-const observer = new MutationObserver(forceHamburgerAlwaysVisible);
-observer.observe(parent.document.body, { 
-    childList: true, 
-    subtree: true,
-    attributes: true,
-    attributeFilter: ['style', 'class', 'aria-hidden']
-});
-
-forceHamburgerAlwaysVisible();
-
-parent.document.addEventListener('click', function(e) {
-    setTimeout(forceHamburgerAlwaysVisible, 50);
-    setTimeout(forceHamburgerAlwaysVisible, 200);
-    setTimeout(forceHamburgerAlwaysVisible, 500);
-});
-</script>
-""", height=0)
+force_hamburger_visible()
 
 logger = setup_logger('vue_ensemble')
 logger.info("=== Page Vue d'Ensemble chargée ===")
@@ -143,9 +77,12 @@ page_header(
 # CHARGEMENT DES DONNÉES
 # ==============================================================================
 
-@st.cache_data(ttl=settings.CACHE_CONFIG['ttl'])
+# st.cache_resource : les DataFrames sont partagés sans copie (pas d'aller-retour
+# pickle à chaque rerun) ; ils sont en lecture seule, toute transformation
+# passe par une copie explicite (voir df_hebdo_sorted).
+@st.cache_resource(ttl=settings.CACHE_CONFIG['weekly_data_ttl'])
 def load_data():
-    """Charge toutes les données avec cache."""
+    """Charge toutes les données avec cache (objet partagé, non copié)."""
     return charger_toutes_les_donnees()
 
 try:
@@ -165,8 +102,10 @@ except Exception as e:
 # DÉTERMINER LES SEMAINES À ANALYSER
 # ==============================================================================
 
-semaine_actuelle = obtenir_derniere_semaine(df_hebdo)
-semaine_precedente = obtenir_semaine_precedente(df_hebdo, semaine_actuelle)
+# Semaines triées une seule fois au chargement (pas de tri Python à chaque rerun)
+semaines_triees = donnees['semaines_asc']
+semaine_actuelle = semaines_triees[-1] if semaines_triees else None
+semaine_precedente = semaines_triees[-2] if len(semaines_triees) > 1 else None
 
 if not semaine_actuelle:
     st.error("❌ Impossible de déterminer la dernière semaine")
@@ -393,9 +332,8 @@ if semaine_precedente:
 section_header("Évolution Temporelle", icon="📈")
 
 # Filtrer les 10 dernières semaines
-df_hebdo_sorted = df_hebdo.copy()
-df_hebdo_sorted['_sort'] = df_hebdo_sorted['Semaine épidémiologique'].apply(extraire_numero_semaine)
-df_hebdo_sorted = df_hebdo_sorted.sort_values('_sort').tail(10).reset_index(drop=True)
+# Semaine catégorielle ordonnée : tri vectorisé sur les codes, sans clé Python
+df_hebdo_sorted = df_hebdo.sort_values('Semaine épidémiologique').tail(10).reset_index(drop=True)
 
 if len(df_hebdo_sorted) > 0:
     fig_evolution = creer_graphique_evolution(
@@ -17,17 +17,16 @@ Version: 3.0 FINALE - Footer CCOUSP/MINSANTE + Graphiques corrigés
 """
 
 import streamlit as st
-import streamlit.components.v1 as components
 import pandas as pd
 import plotly.graph_objects as go
 
 # Imports de la nouvelle architecture
 from config import settings
 from utils.data_loader import charger_toutes_les_donnees
-from utils.data_processor import calculer_totaux_semaine, comparer_periodes
-from utils.helpers import extraire_numero_semaine, formater_nombre
+from utils.data_processor import calculer_totaux_semaine, comparer_periodes, sommer_categories_par_semaine
+from utils.helpers import formater_nombre
 from utils.logger import setup_logger, log_export
-from components.layout import apply_custom_css, page_header, section_header
+from components.layout import apply_custom_css, force_hamburger_visible, page_header, section_header
 from components.sidebar import render_sidebar
 from components.tables import export_buttons
 
@@ -38,6 +37,10 @@ from utils.charts import (
     creer_graphique_camembert
 )
 
+# Libellés des catégories pour les sélecteurs (calculés une seule fois)
+CAT_LABELS = tuple(settings.LABELS_CATEGORIES[cat] for cat in settings.CATEGORIES_APPELS)
+CAT_LABELS_DEFAULT = CAT_LABELS[:3]
+
 # ==============================================================================
 # CONFIGURATION DE LA PAGE
 # ==============================================================================
@@ -55,72 +58,7 @@ st.set_page_config(
 
 apply_custom_css()
 
-components.html("""
-<script>
-function forceHamburgerAlwaysVisible() {
-    const selectors = [
-        '[data-testid="collapsedControl"]',
-        'button[kind="icon"]',
-        '[class*="collapsedControl"]'
-    ];
-    
-    let btn = null;
-    for (const selector of selectors) {
-        btn = parent.document.querySelector(selector);
-        if (btn) break;
-    }
-    
-    if (btn) {
-        btn.style.cssText = `
-            display: block !important;
-            visibility: visible !important;
-            opacity: 1 !important;
-            position: fixed !important;
-            top: 4.2rem !important;
-            left: 0.8rem !important;
-            z-index: 9999999999 !important;
-            width: 52px !important;
-            height: 52px !important;
-            background: linear-gradient(135deg, #007A33 0%, #00a844 100%) !important;
-            border-radius: 10px !important;
-            border: 3px solid white !important;
-            box-shadow: 0 4px 16px rgba(0, 122, 51, 0.5) !important;
-            cursor: pointer !important;
-            transition: all 0.2s ease !important;
-            pointer-events: auto !important;
-        `;
-        
-        btn.setAttribute('aria-hidden', 'false');
-        
-        if (btn.parentElement) {
-            btn.parentElement.style.cssText = `
-                display: block !important;
-                visibility: visible !important;
-                opacity: 1 !important;
-            `;
-        }
-    }
-}
-
-setInterval(forceHamburgerAlwaysVisible, 100);
-
-const observer = new MutationObserver(forceHamburgerAlwaysVisible);
-observer.observe(parent.document.body, { 
-    childList: true, 
-    subtree: true,
-    attributes: true,
-    attributeFilter: ['style', 'class', 'aria-hidden']
-});
-
-forceHamburgerAlwaysVisible();
-
-parent.document.addEventListener('click', function(e) {
-    setTimeout(forceHamburgerAlwaysVisible, 50);
-    setTimeout(forceHamburgerAlwaysVisible, 200);
-    setTimeout(forceHamburgerAlwaysVisible, 500);
-});
-</script>
-""", height=0)
+force_hamburger_visible()
 
 logger = setup_logger('analyse_epidemiologique')
 logger.info("=== Page Analyse Épidémiologique chargée ===")
@@ -145,11 +83,26 @@ page_header(
 # CHARGEMENT DES DONNÉES
 # ==============================================================================
 
-@st.cache_data(ttl=settings.CACHE_CONFIG['ttl'])
+@st.cache_resource(ttl=settings.CACHE_CONFIG['weekly_data_ttl'])
 def load_data():
-    """Charge toutes les données avec cache."""
+    """
+    Charge toutes les données avec cache (objets partagés, sans copie).
+    
+    Les DataFrames retournés sont en lecture seule : toute modification
+    doit se faire sur une copie explicite.
+    """
     return charger_toutes_les_donnees()
 
+@st.cache_resource(ttl=settings.CACHE_CONFIG['weekly_data_ttl'], show_spinner=False)
+def load_matrice_semaines():
+    """Totaux semaines × catégories, calculés une seule fois (lecture seule)."""
+    return sommer_categories_par_semaine(load_data()['appels'])
+
+@st.cache_data(ttl=settings.CACHE_CONFIG['weekly_data_ttl'], show_spinner=False)
+def comparer_periodes_cache(semaines):
+    """Tableau comparatif des regroupements, mis en cache par tuple de semaines."""
+    return comparer_periodes(load_data()['appels'], list(semaines))
+
 try:
     donnees = load_data()
     df_appels = donnees['appels']
@@ -180,12 +133,8 @@ if mode == "📊 Analyse d'une Semaine":
     
     section_header("Sélection de la Semaine", icon="📅")
     
-    # Liste des semaines disponibles (triée)
-    semaines_disponibles = sorted(
-        df_appels['Semaine épidémiologique'].unique(),
-        key=extraire_numero_semaine,
-        reverse=True
-    )
+    # Liste des semaines disponibles (triée au chargement)
+    semaines_disponibles = donnees['semaines_desc']
     
     semaine_selectionnee = st.selectbox(
         "Sélectionnez une semaine épidémiologique :",
@@ -308,12 +257,8 @@ else:  # Comparaison
     
     section_header("Sélection des Semaines", icon="🔄")
     
-    # Liste des semaines disponibles (triée)
-    semaines_disponibles = sorted(
-        df_appels['Semaine épidémiologique'].unique(),
-        key=extraire_numero_semaine,
-        reverse=True
-    )
+    # Liste des semaines disponibles (triée au chargement)
+    semaines_disponibles = donnees['semaines_desc']
     
     col1, col2 = st.columns(2)
     
@@ -337,7 +282,7 @@ else:  # Comparaison
         st.stop()
     
     # Trier les semaines sélectionnées
-    semaines_selectionnees = sorted(semaines_selectionnees, key=extraire_numero_semaine)
+    semaines_selectionnees = [s for s in donnees['semaines_asc'] if s in semaines_selectionnees]
     
     # === COMPARAISON DES TOTAUX ===
     section_header("Comparaison des Totaux", icon="📊")
@@ -375,33 +320,18 @@ else:  # Comparaison
     # Sélection des catégories à comparer
     categories_a_comparer = st.multiselect(
         "Sélectionnez les catégories à comparer :",
-        [settings.LABELS_CATEGORIES[cat] for cat in settings.CATEGORIES_APPELS],
-        default=[settings.LABELS_CATEGORIES[cat] for cat in settings.CATEGORIES_APPELS[:3]]
+        CAT_LABELS,
+        default=CAT_LABELS_DEFAULT
     )
     
     if categories_a_comparer:
-        # Créer le dictionnaire inverse
-        reverse_labels = {v: k for k, v in settings.LABELS_CATEGORIES.items()}
+        # Préparer les données pour comparaison (lecture dans la matrice précalculée)
+        codes_categories = [settings.LABELS_CATEGORIES_INV[label] for label in categories_a_comparer]
+        matrice = load_matrice_semaines().reindex(columns=codes_categories, fill_value=0)
         
-        # Préparer les données pour comparaison
-        comparison_data = []
-        
-        for categorie_label in categories_a_comparer:
-            categorie_code = reverse_labels[categorie_label]
-            
-            row_data = {'Catégorie': categorie_label}
-            
-            for semaine in semaines_selectionnees:
-                df_sem = df_appels[df_appels['Semaine épidémiologique'] == semaine]
-                if categorie_code in df_sem.columns:
-                    total = int(df_sem[categorie_code].sum())
-                    row_data[semaine] = total
-                else:
-                    row_data[semaine] = 0
-            
-            comparison_data.append(row_data)
-        
-        df_comparison = pd.DataFrame(comparison_data)
+        df_comparison = pd.DataFrame({'Catégorie': categories_a_comparer})
+        for semaine in semaines_selectionnees:
+            df_comparison[semaine] = matrice.loc[semaine].to_numpy()
         
         # Tableau de comparaison
         st.dataframe(df_comparison, use_container_width=True, hide_index=True)
@@ -409,9 +339,6 @@ else:  # Comparaison
         # === GRAPHIQUE BARRES GROUPÉES (VERSION CORRIGÉE) ===
         st.markdown("#### Visualisation Graphique")
         
-        # Créer le graphique manuellement avec go.Figure()
-        fig_multi = go.Figure()
-        
         # Couleurs pour les semaines
         couleurs = [
             settings.COULEURS_CAMEROUN['vert'],
@@ -421,15 +348,20 @@ else:  # Comparaison
             '#6c757d'
         ]
         
-        # Ajouter une trace pour chaque semaine
-        for i, semaine in enumerate(semaines_selectionnees):
-            if semaine in df_comparison.columns:
-                fig_multi.add_trace(go.Bar(
-                    name=semaine,
-                    x=df_comparison['Catégorie'],
-                    y=df_comparison[semaine],
-                    marker_color=couleurs[i % len(couleurs)]
-                ))
+        # Construire toutes les traces (une par semaine) en une seule fois
+        x_categories = df_comparison['Catégorie'].values
+        traces = [
+            go.Bar(
+                name=semaine,
+                x=x_categories,
+                y=df_comparison[semaine].values,
+                marker_color=couleurs[i % len(couleurs)]
+            )
+            for i, semaine in enumerate(semaines_selectionnees)
+            if semaine in df_comparison.columns
+        ]
+        
+        fig_multi = go.Figure(data=traces)
         
         # Configuration du layout
         fig_multi.update_layout(
@@ -457,19 +389,27 @@ else:  # Comparaison
     
     # === EXPORT ===
     with st.expander("💾 Exporter les Données Comparatives"):
-        # Créer un DataFrame complet de comparaison
-        df_export = comparer_periodes(df_appels, semaines_selectionnees)
+        semaines_export = tuple(semaines_selectionnees)
         
-        if len(df_export) > 0:
-            export_buttons(
-                df_export,
-                filename_prefix="comparaison_semaines",
-                formats=['csv', 'excel']
-            )
-            
-            logger.info(f"Export comparaison : {len(semaines_selectionnees)} semaines")
+        # Le tableau n'est calculé qu'à la demande (et mis en cache)
+        if st.button("📊 Préparer l'export", key="btn_export_comparaison"):
+            st.session_state.export_comparaison = semaines_export
+        
+        if st.session_state.get('export_comparaison') != semaines_export:
+            st.caption("Cliquez sur le bouton pour générer le tableau comparatif.")
         else:
-            st.warning("Aucune donnée à exporter")
+            df_export = comparer_periodes_cache(semaines_export)
+            
+            if len(df_export) > 0:
+                export_buttons(
+                    df_export,
+                    filename_prefix="comparaison_semaines",
+                    formats=['csv', 'excel']
+                )
+                
+                logger.info(f"Export comparaison : {len(semaines_selectionnees)} semaines")
+            else:
+                st.warning("Aucune donnée à exporter")
 
 # ==============================================================================
 # INFORMATIONS COMPLÉMENTAIRES
@@ -15,7 +15,6 @@ Version: 3.2 FINALE - Correction suffixe _sum + Footer CCOUSP/MINSANTE
 """
 
 import streamlit as st
-import streamlit.components.v1 as components
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
@@ -24,9 +23,9 @@ import plotly.graph_objects as go
 from config import settings
 from utils.data_loader import charger_toutes_les_donnees
 from utils.data_processor import regrouper_par_mois
-from utils.helpers import extraire_numero_semaine, formater_nombre
+from utils.helpers import formater_nombre
 from utils.logger import setup_logger
-from components.layout import apply_custom_css, page_header, section_header
+from components.layout import apply_custom_css, force_hamburger_visible, page_header, section_header
 from components.sidebar import render_sidebar
 from components.metrics import metric_row
 from components.tables import export_buttons
@@ -38,6 +37,10 @@ from utils.charts import (
     creer_graphique_variation
 )
 
+# Libellés des catégories pour les sélecteurs (calculés une seule fois)
+CAT_LABELS = tuple(settings.LABELS_CATEGORIES[cat] for cat in settings.CATEGORIES_APPELS)
+CAT_LABELS_DEFAULT = CAT_LABELS[:3]
+
 # ==============================================================================
 # CONFIGURATION DE LA PAGE
 # ==============================================================================
@@ -55,72 +58,7 @@ st.set_page_config(
 
 apply_custom_css()
 
-components.html("""
-<script>
-function forceHamburgerAlwaysVisible() {
-    const selectors = [
-        '[data-testid="collapsedControl"]',
-        'button[kind="icon"]',
-        '[class*="collapsedControl"]'
-    ];
-    
-    let btn = null;
-    for (const selector of selectors) {
-        btn = parent.document.querySelector(selector);
-        if (btn) break;
-    }
-    
-    if (btn) {
-        btn.style.cssText = `
-            display: block !important;
-            visibility: visible !important;
-            opacity: 1 !important;
-            position: fixed !important;
-            top: 4.2rem !important;
-            left: 0.8rem !important;
-            z-index: 9999999999 !important;
-            width: 52px !important;
-            height: 52px !important;
-            background: linear-gradient(135deg, #007A33 0%, #00a844 100%) !important;
-            border-radius: 10px !important;
-            border: 3px solid white !important;
-            box-shadow: 0 4px 16px rgba(0, 122, 51, 0.5) !important;
-            cursor: pointer !important;
-            transition: all 0.2s ease !important;
-            pointer-events: auto !important;
-        `;
-        
-        btn.setAttribute('aria-hidden', 'false');
-        
-        if (btn.parentElement) {
-            btn.parentElement.style.cssText = `
-                display: block !important;
-                visibility: visible !important;
-                opacity: 1 !important;
-            `;
-        }
-    }
-}
-
-setInterval(forceHamburgerAlwaysVisible, 100);
-
-const observer = new MutationObserver(forceHamburgerAlwaysVisible);
-observer.observe(parent.document.body, { 
-    childList: true, 
-    subtree: true,
-    attributes: true,
-    attributeFilter: ['style', 'class', 'aria-hidden']
-});
-
-forceHamburgerAlwaysVisible();
-
-parent.document.addEventListener('click', function(e) {
-    setTimeout(forceHamburgerAlwaysVisible, 50);
-    setTimeout(forceHamburgerAlwaysVisible, 200);
-    setTimeout(forceHamburgerAlwaysVisible, 500);
-});
-</script>
-""", height=0)
+force_hamburger_visible()
 
 logger = setup_logger('comparaisons')
 logger.info("=== Page Comparaisons chargée ===")
@@ -145,15 +83,32 @@ page_header(
 # CHARGEMENT DES DONNÉES
 # ==============================================================================
 
-@st.cache_data(ttl=settings.CACHE_CONFIG['ttl'])
-def load_data():
-    """Charge toutes les données avec cache."""
-    return charger_toutes_les_donnees()
+@st.cache_resource(ttl=settings.CACHE_CONFIG['weekly_data_ttl'], show_spinner=False)
+def _load_all():
+    """Charge les données hebdomadaires une seule fois (objet partagé, non copié)."""
+    return charger_toutes_les_donnees(ressources=('hebdomadaire',))
+
+# Les DataFrames ci-dessous sont partagés (st.cache_resource, sans copie) :
+# ils sont en lecture seule, toute modification passe par une copie explicite.
+
+@st.cache_resource(ttl=settings.CACHE_CONFIG['weekly_data_ttl'])
+def load_hebdo():
+    """Charge les données hebdomadaires avec cache."""
+    return _load_all()['hebdomadaire']
+
+@st.cache_resource(ttl=settings.CACHE_CONFIG['weekly_data_ttl'])
+def load_hebdo_indexe():
+    """Données hebdomadaires indexées et triées par semaine épidémiologique."""
+    return _load_all()['hebdomadaire'].set_index('Semaine épidémiologique').sort_index()
+
+@st.cache_resource(ttl=settings.CACHE_CONFIG['weekly_data_ttl'])
+def load_mois():
+    """Regroupement mensuel des données hebdomadaires partagées (lecture seule)."""
+    return regrouper_par_mois(load_hebdo())
 
 try:
-    donnees = load_data()
-    df_appels = donnees['appels']
-    df_hebdo = donnees['hebdomadaire']
+    # Seules les données hebdomadaires sont communes aux trois onglets
+    df_hebdo = load_hebdo()
     
 except Exception as e:
     st.error(settings.MESSAGES['error']['data_inconsistency'])
@@ -176,15 +131,14 @@ type_comparaison = st.radio(
 # COMPARAISON HEBDOMADAIRE
 # ==============================================================================
 
-if type_comparaison == "Comparaison Hebdomadaire":
+@st.fragment
+def _hebdo_fragment(df_hebdo):
+    """Comparaison hebdomadaire (rerun limité à ce fragment)."""
     
     section_header("Comparaison Hebdomadaire", icon="📅")
     
-    # Trier les semaines
-    semaines_disponibles = sorted(
-        df_appels['Semaine épidémiologique'].unique(),
-        key=extraire_numero_semaine
-    )
+    # Semaines disponibles (triées une seule fois au chargement)
+    semaines_disponibles = list(_load_all()['semaines_asc'])
     
     col1, col2 = st.columns(2)
     
@@ -206,14 +160,8 @@ if type_comparaison == "Comparaison Hebdomadaire":
             index=len(semaines_fin) - 1
         )
     
-    # Filtrer les semaines dans la plage
-    idx_fin = semaines_disponibles.index(periode_fin)
-    semaines_periode = semaines_disponibles[index_debut:idx_fin+1]
-    
-    # Filtrer et trier le DataFrame
-    df_periode = df_hebdo[df_hebdo['Semaine épidémiologique'].isin(semaines_periode)].copy()
-    df_periode['_sort'] = df_periode['Semaine épidémiologique'].apply(extraire_numero_semaine)
-    df_periode = df_periode.sort_values('_sort').drop('_sort', axis=1).reset_index(drop=True)
+    # Plage de semaines : simple tranche sur l'index catégoriel trié
+    df_periode = load_hebdo_indexe().loc[periode_debut:periode_fin].reset_index()
     
     if len(df_periode) > 0:
         
@@ -281,27 +229,23 @@ if type_comparaison == "Comparaison Hebdomadaire":
         # === TOP CATÉGORIES (VERSION FINALE CORRIGÉE) ===
         section_header("Top 10 des Catégories sur la Période", icon="🏆")
         
-        categories_periode = {}
+        # Les colonnes dans df_periode ont le format: CATEGORIE_JOUR_sum
+        colonnes_sum = [
+            f"{categorie}_sum" for categorie in settings.CATEGORIES_APPELS
+            if f"{categorie}_sum" in df_periode.columns
+        ]
         
-        # Parcourir les catégories
-        for categorie in settings.CATEGORIES_APPELS:
-            # Les colonnes dans df_periode ont le format: CATEGORIE_JOUR_sum
-            col_name = f"{categorie}_sum"
-            
-            # Vérifier si la colonne existe
-            if col_name in df_periode.columns:
-                total = int(df_periode[col_name].sum())
-                
-                # Ne garder que les catégories avec total > 0
-                if total > 0:
-                    # Récupérer le label depuis settings
-                    label = settings.LABELS_CATEGORIES.get(categorie, categorie)
-                    categories_periode[label] = total
+        # Une seule réduction sur toutes les catégories
+        totaux = df_periode[colonnes_sum].sum()
+        totaux.index = [settings.LABELS_CATEGORIES.get(col[:-4], col[:-4]) for col in colonnes_sum]
+        
+        # Ne garder que les catégories avec total > 0
+        categories_periode = totaux[totaux > 0]
         
         # Vérifier qu'on a des données
-        if categories_periode:
+        if not categories_periode.empty:
             # Trier et garder le top 10
-            top_10 = dict(sorted(categories_periode.items(), key=lambda x: x[1], reverse=True)[:10])
+            top_10 = categories_periode.nlargest(10).astype(int).to_dict()
             
             fig_top = creer_graphique_barres(
                 data=top_10,
@@ -326,7 +270,9 @@ if type_comparaison == "Comparaison Hebdomadaire":
 # COMPARAISON MENSUELLE
 # ==============================================================================
 
-elif type_comparaison == "Comparaison Mensuelle":
+@st.fragment
+def _mensuel_fragment(df_hebdo):
+    """Comparaison mensuelle (rerun limité à ce fragment)."""
     
     section_header("Comparaison Mensuelle", icon="📅")
     
@@ -335,7 +281,7 @@ elif type_comparaison == "Comparaison Mensuelle":
     )
     
     # Regrouper par mois
-    df_mois = regrouper_par_mois(df_hebdo)
+    df_mois = load_mois()
     
     # === VUE D'ENSEMBLE ===
     section_header("Vue d'Ensemble Mensuelle", icon="📊")
@@ -356,7 +302,8 @@ elif type_comparaison == "Comparaison Mensuelle":
     section_header("Comparaison des Mois", icon="📈")
     
     fig_mois = creer_graphique_barres(
-        data=dict(zip(df_mois['Mois'], df_mois['TOTAL_APPELS_SEMAINE'])),
+        x=df_mois['Mois'].to_numpy(),
+        y=df_mois['TOTAL_APPELS_SEMAINE'].to_numpy(),
         titre="Nombre d'appels par mois",
         orientation='v',
         show_values=True,
@@ -381,16 +328,11 @@ elif type_comparaison == "Comparaison Mensuelle":
     
     categories_a_comparer = st.multiselect(
         "Sélectionnez les catégories à comparer :",
-        [settings.LABELS_CATEGORIES[cat] for cat in settings.CATEGORIES_APPELS],
-        default=[settings.LABELS_CATEGORIES[cat] for cat in settings.CATEGORIES_APPELS[:3]]
+        CAT_LABELS,
+        default=CAT_LABELS_DEFAULT
     )
     
     if categories_a_comparer:
-        reverse_labels = {v: k for k, v in settings.LABELS_CATEGORIES.items()}
-        
-        # Créer le graphique manuellement avec go.Figure()
-        fig_multi = go.Figure()
-        
         # Couleurs
         couleurs = [
             settings.COULEURS_CAMEROUN['vert'],
@@ -400,18 +342,27 @@ elif type_comparaison == "Comparaison Mensuelle":
             '#6c757d'
         ]
         
-        # Ajouter une trace pour chaque catégorie
-        for i, cat_label in enumerate(categories_a_comparer):
-            cat_code = reverse_labels[cat_label]
-            col_name = cat_code.replace('_JOUR', '_SEMAINE')
-            
-            if col_name in df_mois.columns:
-                fig_multi.add_trace(go.Bar(
-                    name=cat_label,
-                    x=df_mois['Mois'],
-                    y=df_mois[col_name],
-                    marker_color=couleurs[i % len(couleurs)]
-                ))
+        # Colonnes demandées (présentes dans df_mois), extraites en un seul bloc
+        demandees = [
+            (i, cat_label, settings.LABELS_CATEGORIES_INV[cat_label].replace('_JOUR', '_SEMAINE'))
+            for i, cat_label in enumerate(categories_a_comparer)
+        ]
+        demandees = [(i, label, col) for i, label, col in demandees if col in df_mois.columns]
+        valeurs = df_mois[[col for _, _, col in demandees]].to_numpy()
+        x_mois = df_mois['Mois'].to_numpy()
+        
+        # Construire toutes les traces (une par catégorie) en une seule fois
+        traces = [
+            go.Bar(
+                name=label,
+                x=x_mois,
+                y=valeurs[:, k],
+                marker_color=couleurs[i % len(couleurs)]
+            )
+            for k, (i, label, _) in enumerate(demandees)
+        ]
+        
+        fig_multi = go.Figure(data=traces)
         
         # Configuration du layout
         fig_multi.update_layout(
@@ -446,22 +397,29 @@ elif type_comparaison == "Comparaison Mensuelle":
 # ANALYSE DES TENDANCES
 # ==============================================================================
 
-else:  # Analyse des Tendances
+@st.fragment
+def _tendances_fragment(df_hebdo):
+    """Analyse des tendances (rerun limité à ce fragment)."""
     
     section_header("Analyse des Tendances", icon="📈")
     
-    # Trier par semaine
-    df_hebdo_sorted = df_hebdo.copy()
-    df_hebdo_sorted['_sort'] = df_hebdo_sorted['Semaine épidémiologique'].apply(extraire_numero_semaine)
-    df_hebdo_sorted = df_hebdo_sorted.sort_values('_sort').reset_index(drop=True)
+    # Trier par semaine : les codes de la catégorielle ordonnée suivent déjà
+    # l'ordre des numéros (réindexation par position, sans copie préalable)
+    ordre = df_hebdo['Semaine épidémiologique'].cat.codes.to_numpy().argsort(kind='stable')
+    df_hebdo_sorted = df_hebdo.iloc[ordre].reset_index(drop=True)
     
     # === VUE GLOBALE ===
     section_header("Vue Globale", icon="🌐")
     
     # Calculer la tendance (régression linéaire)
-    df_hebdo_sorted['num_semaine'] = range(1, len(df_hebdo_sorted) + 1)
-    coefficients = np.polyfit(df_hebdo_sorted['num_semaine'], df_hebdo_sorted['TOTAL_APPELS_SEMAINE'], 1)
-    tendance = coefficients[0]
+    df_hebdo_sorted['num_semaine'] = np.arange(1, len(df_hebdo_sorted) + 1)
+    # Pente des moindres carrés en forme fermée (pas de polyfit pour un degré 1)
+    x = df_hebdo_sorted['num_semaine'].to_numpy(dtype=np.float64)
+    y = df_hebdo_sorted['TOTAL_APPELS_SEMAINE'].to_numpy(dtype=np.float64)
+    n = x.size
+    sx, sy = x.sum(), y.sum()
+    denominateur = n * (x * x).sum() - sx * sx
+    tendance = (n * (x * y).sum() - sx * sy) / denominateur if denominateur != 0 else 0.0
     
     premiere_val = df_hebdo_sorted.iloc[0]['TOTAL_APPELS_SEMAINE']
     derniere_val = df_hebdo_sorted.iloc[-1]['TOTAL_APPELS_SEMAINE']
@@ -500,26 +458,27 @@ else:  # Analyse des Tendances
     # === ANALYSE DE VOLATILITÉ ===
     section_header("Analyse de Volatilité", icon="📊")
     
-    # Calculer les variations
-    df_hebdo_sorted['variation'] = df_hebdo_sorted['TOTAL_APPELS_SEMAINE'].diff()
-    df_hebdo_sorted['variation_pct'] = df_hebdo_sorted['TOTAL_APPELS_SEMAINE'].pct_change() * 100
+    # Calculer les variations (un seul passage numpy)
+    variations = np.diff(y)
+    df_hebdo_sorted['variation'] = np.concatenate(([np.nan], variations))
+    
+    var_max = variations.max()
+    var_min = variations.min()
+    var_moy = variations.mean()
+    volatilite = variations.std(ddof=1)
     
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        var_max = df_hebdo_sorted['variation'].max()
         st.metric("Plus Grande Hausse", f"{int(var_max):+}")
     
     with col2:
-        var_min = df_hebdo_sorted['variation'].min()
         st.metric("Plus Grande Baisse", f"{int(var_min):+}")
     
     with col3:
-        var_moy = df_hebdo_sorted['variation'].mean()
         st.metric("Variation Moyenne", f"{int(var_moy):+}")
     
     with col4:
-        volatilite = df_hebdo_sorted['variation'].std()
         st.metric("Volatilité (σ)", formater_nombre(int(volatilite)))
     
     # Graphique des variations
@@ -535,6 +494,17 @@ else:  # Analyse des Tendances
     
     st.plotly_chart(fig_var, use_container_width=True, config=settings.PLOTLY_CONFIG)
 
+# ==============================================================================
+# AFFICHAGE DE LA COMPARAISON SÉLECTIONNÉE
+# ==============================================================================
+
+if type_comparaison == "Comparaison Hebdomadaire":
+    _hebdo_fragment(df_hebdo)
+elif type_comparaison == "Comparaison Mensuelle":
+    _mensuel_fragment(df_hebdo)
+else:  # Analyse des Tendances
+    _tendances_fragment(df_hebdo)
+
 # ==============================================================================
 # FIN DE LA PAGE
 # ==============================================================================
\ No newline at end of file
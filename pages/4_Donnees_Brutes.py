@@ -18,7 +18,6 @@ Version: 3.2 FINALE - Calendrier corrigé + Upload fonctionnel + Footer CCOUSP/M
 """
 
 import streamlit as st
-import streamlit.components.v1 as components
 import pandas as pd
 import os
 import shutil
@@ -29,8 +28,9 @@ from datetime import datetime
 from config import settings
 from utils.data_loader import charger_toutes_les_donnees, detecter_fichiers_data
 from utils.helpers import formater_nombre
+from utils.charts import vider_cache_figures
 from utils.logger import setup_logger, log_upload_fichier, log_export
-from components.layout import apply_custom_css, page_header, section_header
+from components.layout import apply_custom_css, force_hamburger_visible, page_header, section_header
 from components.sidebar import render_sidebar
 from components.metrics import metric_row
 from components.tables import display_dataframe_formatted, export_buttons
@@ -52,72 +52,7 @@ st.set_page_config(
 
 apply_custom_css()
 
-components.html("""
-<script>
-function forceHamburgerAlwaysVisible() {
-    const selectors = [
-        '[data-testid="collapsedControl"]',
-        'button[kind="icon"]',
-        '[class*="collapsedControl"]'
-    ];
-    
-    let btn = null;
-    for (const selector of selectors) {
-        btn = parent.document.querySelector(selector);
-        if (btn) break;
-    }
-    
-    if (btn) {
-        btn.style.cssText = `
-            display: block !important;
-            visibility: visible !important;
-            opacity: 1 !important;
-            position: fixed !important;
-            top: 4.2rem !important;
-            left: 0.8rem !important;
-            z-index: 9999999999 !important;
-            width: 52px !important;
-            height: 52px !important;
-            background: linear-gradient(135deg, #007A33 0%, #00a844 100%) !important;
-            border-radius: 10px !important;
-            border: 3px solid white !important;
-            box-shadow: 0 4px 16px rgba(0, 122, 51, 0.5) !important;
-            cursor: pointer !important;
-            transition: all 0.2s ease !important;
-            pointer-events: auto !important;
-        `;
-        
-        btn.setAttribute('aria-hidden', 'false');
-        
-        if (btn.parentElement) {
-            btn.parentElement.style.cssText = `
-                display: block !important;
-                visibility: visible !important;
-                opacity: 1 !important;
-            `;
-        }
-    }
-}
-
-setInterval(forceHamburgerAlwaysVisible, 100);
-
-const observer = new MutationObserver(forceHamburgerAlwaysVisible);
-observer.observe(parent.document.body, { 
-    childList: true, 
-    subtree: true,
-    attributes: true,
-    attributeFilter: ['style', 'class', 'aria-hidden']
-});
-
-forceHamburgerAlwaysVisible();
-
-parent.document.addEventListener('click', function(e) {
-    setTimeout(forceHamburgerAlwaysVisible, 50);
-    setTimeout(forceHamburgerAlwaysVisible, 200);
-    setTimeout(forceHamburgerAlwaysVisible, 500);
-});
-</script>
-""", height=0)
+force_hamburger_visible()
 
 logger = setup_logger('donnees_brutes')
 logger.info("=== Page Données Brutes chargée ===")
@@ -142,11 +77,104 @@ page_header(
 # CHARGEMENT DES DONNÉES
 # ==============================================================================
 
-@st.cache_data(ttl=settings.CACHE_CONFIG['ttl'])
+@st.cache_resource(ttl=settings.CACHE_CONFIG['weekly_data_ttl'])
 def load_data():
-    """Charge toutes les données avec cache."""
+    """
+    Charge toutes les données avec cache (objets partagés, sans copie).
+    
+    Les DataFrames retournés sont en lecture seule : toute modification
+    doit se faire sur une copie explicite.
+    """
     return charger_toutes_les_donnees()
 
+@st.cache_data(ttl=settings.CACHE_CONFIG['listing_ttl'], show_spinner=False)
+def _detecter_fichiers_cached():
+    """Détection des fichiers de données (rescan au plus une fois par listing_ttl)."""
+    return detecter_fichiers_data()
+
+def _cle_df_dates(df):
+    """Clé de cache en O(1) : forme, colonnes et bornes de la colonne DATE."""
+    if len(df) == 0:
+        return (df.shape, tuple(df.columns))
+    return (df.shape, tuple(df.columns), df['DATE'].iat[0].value, df['DATE'].iat[-1].value)
+
+@st.cache_data(
+    ttl=settings.CACHE_CONFIG['weekly_data_ttl'],
+    show_spinner=False,
+    hash_funcs={pd.DataFrame: _cle_df_dates}
+)
+def _build_cal_display(df):
+    """Calendrier formaté pour l'affichage (DATE en texte, colonnes renommées)."""
+    return df.assign(DATE=df['DATE'].dt.strftime('%d/%m/%Y')).rename(columns={
+        'Week_No': 'N° Semaine',
+        'Semaine épidémiologique': 'Label Semaine',
+        'Month': 'Mois',
+        'DATE': 'Date'
+    })
+
+@st.cache_data(ttl=settings.CACHE_CONFIG['listing_ttl'], show_spinner=False)
+def _infos_fichier(chemin):
+    """
+    Taille (Ko) et date de modification formatée d'un fichier.
+    
+    Returns:
+        tuple: (taille_ko, date_modif) ou None si le fichier n'existe pas
+    """
+    try:
+        stats = os.stat(chemin)
+    except OSError:
+        return None
+    return stats.st_size / 1024, datetime.fromtimestamp(stats.st_mtime).strftime('%d/%m/%Y %H:%M')
+
+@st.cache_data(ttl=settings.CACHE_CONFIG['listing_ttl'], show_spinner=False)
+def _list_backups_meta(backup_dir_str):
+    """
+    Métadonnées des sauvegardes, de la plus récente à la plus ancienne.
+    
+    Un seul os.scandir (DirEntry.stat() est mis en cache par entrée).
+    
+    Returns:
+        list: Tuples (nom, taille_ko, date_modif formatée)
+    """
+    entrees = []
+    for entree in os.scandir(backup_dir_str):
+        if entree.name.endswith('.xlsx') and '_backup_' in entree.name:
+            stats = entree.stat()
+            entrees.append((stats.st_mtime, entree.name, stats.st_size / 1024))
+    
+    entrees.sort(reverse=True)
+    return [
+        (nom, taille, datetime.fromtimestamp(mtime).strftime('%d/%m/%Y %H:%M'))
+        for mtime, nom, taille in entrees
+    ]
+
+def _apercu_excel(fichier, nb_lignes_apercu=10):
+    """
+    Lecture légère d'un Excel uploadé : en-têtes, aperçu et nombre de lignes.
+    
+    Le classeur n'est jamais parsé en entier : la copie sur disque
+    à la confirmation se fait octet par octet.
+    
+    Returns:
+        tuple: (colonnes, df_apercu, nb_lignes ou None si inconnu)
+    """
+    from openpyxl import load_workbook
+    
+    fichier.seek(0)
+    df_apercu = pd.read_excel(fichier, nrows=nb_lignes_apercu)
+    
+    # Dimensions lues dans les métadonnées de la feuille (mode lecture seule)
+    fichier.seek(0)
+    classeur = load_workbook(fichier, read_only=True)
+    try:
+        max_row = classeur.active.max_row
+    finally:
+        classeur.close()
+    fichier.seek(0)
+    
+    nb_lignes = max_row - 1 if max_row else None
+    return df_apercu.columns.tolist(), df_apercu, nb_lignes
+
 try:
     donnees = load_data()
     df_appels = donnees['appels']
@@ -183,11 +211,14 @@ with tab_consultation:
         
         section_header("Données Journalières", icon="📅")
         
+        # Bornes de dates calculées une seule fois par rerun
+        date_min, date_max = df_appels['DATE'].min(), df_appels['DATE'].max()
+        
         # Informations générales
         metrics = [
             {'label': 'Lignes', 'value': len(df_appels), 'icon': '📊'},
-            {'label': 'Date Début', 'value': df_appels['DATE'].min().strftime('%d/%m/%Y'), 'icon': '📅'},
-            {'label': 'Date Fin', 'value': df_appels['DATE'].max().strftime('%d/%m/%Y'), 'icon': '📅'},
+            {'label': 'Date Début', 'value': date_min.strftime('%d/%m/%Y'), 'icon': '📅'},
+            {'label': 'Date Fin', 'value': date_max.strftime('%d/%m/%Y'), 'icon': '📅'},
             {'label': 'Semaines', 'value': df_appels['Semaine épidémiologique'].nunique(), 'icon': '🗓️'}
         ]
         
@@ -199,38 +230,43 @@ with tab_consultation:
         col1, col2 = st.columns(2)
         
         with col1:
-            semaines_disponibles = ['Toutes'] + sorted(df_appels['Semaine épidémiologique'].unique().tolist())
+            # Semaines triées une seule fois par le chargeur (mises en cache)
+            semaines_disponibles = ['Toutes'] + list(donnees['semaines_asc'])
             semaine_filtre = st.selectbox("Filtrer par semaine :", semaines_disponibles)
         
         with col2:
             use_date_filter = st.checkbox("Filtrer par plage de dates")
         
-        df_filtered = df_appels.copy()
+        # Masque booléen composé : aucune copie tant qu'aucun filtre n'est actif
+        mask = None
         
         if semaine_filtre != 'Toutes':
-            df_filtered = df_filtered[df_filtered['Semaine épidémiologique'] == semaine_filtre]
+            mask = df_appels['Semaine épidémiologique'] == semaine_filtre
         
         if use_date_filter:
             col1, col2 = st.columns(2)
             with col1:
                 date_debut = st.date_input(
                     "Date de début :",
-                    value=df_appels['DATE'].min().date(),
-                    min_value=df_appels['DATE'].min().date(),
-                    max_value=df_appels['DATE'].max().date()
+                    value=date_min.date(),
+                    min_value=date_min.date(),
+                    max_value=date_max.date()
                 )
             with col2:
                 date_fin = st.date_input(
                     "Date de fin :",
-                    value=df_appels['DATE'].max().date(),
-                    min_value=df_appels['DATE'].min().date(),
-                    max_value=df_appels['DATE'].max().date()
+                    value=date_max.date(),
+                    min_value=date_min.date(),
+                    max_value=date_max.date()
                 )
             
-            df_filtered = df_filtered[
-                (df_filtered['DATE'].dt.date >= date_debut) & 
-                (df_filtered['DATE'].dt.date <= date_fin)
-            ]
+            # Comparaison directe sur datetime64 (pas d'objets date par ligne)
+            borne_debut = pd.Timestamp(date_debut)
+            borne_fin = pd.Timestamp(date_fin) + pd.Timedelta(days=1)
+            masque_dates = df_appels['DATE'].between(borne_debut, borne_fin, inclusive='left')
+            mask = masque_dates if mask is None else mask & masque_dates
+        
+        df_filtered = df_appels if mask is None else df_appels.loc[mask]
         
         st.info(f"📊 **{len(df_filtered)}** lignes correspondent aux critères")
         
@@ -248,19 +284,25 @@ with tab_consultation:
             )
         
         with col2:
-            nb_lignes = st.slider("Lignes à afficher :", 10, len(df_filtered), min(50, len(df_filtered)))
+            nb_lignes = st.selectbox("Lignes par page :", [25, 50, 100], index=1)
         
         if colonnes_a_afficher:
+            # Pagination : seule la page affichée est formatée et envoyée
             display_dataframe_formatted(
-                df_filtered[colonnes_a_afficher].head(nb_lignes),
-                height=600
+                df_filtered[colonnes_a_afficher],
+                height=600,
+                page_size=nb_lignes,
+                key="page_journ"
             )
         else:
             st.warning("⚠️ Sélectionnez au moins une colonne")
         
         # === STATISTIQUES ===
-        with st.expander("📊 Statistiques Descriptives"):
-            colonnes_numeriques = df_filtered.select_dtypes(include=['int64', 'float64']).columns.tolist()
+        # Case à cocher plutôt qu'expander : le corps d'un expander s'exécute
+        # même fermé, describe() n'est calculé que sur demande
+        if st.checkbox("📊 Afficher les statistiques descriptives", key="show_stats_journ"):
+            # Liste calculée au chargement (le filtrage conserve les dtypes)
+            colonnes_numeriques = donnees['colonnes_numeriques']['appels']
             
             if colonnes_numeriques:
                 stats = df_filtered[colonnes_numeriques].describe()
@@ -297,7 +339,7 @@ with tab_consultation:
         col1, col2 = st.columns(2)
         
         with col1:
-            semaines_disponibles = sorted(df_hebdo['Semaine épidémiologique'].unique().tolist())
+            semaines_disponibles = list(donnees['semaines_asc'])
             semaines_selectionnees = st.multiselect(
                 "Semaines à afficher (vide = toutes) :",
                 semaines_disponibles,
@@ -314,28 +356,27 @@ with tab_consultation:
                     value=0
                 )
         
-        df_hebdo_filtered = df_hebdo.copy()
+        mask_hebdo = None
         
         if semaines_selectionnees:
-            df_hebdo_filtered = df_hebdo_filtered[
-                df_hebdo_filtered['Semaine épidémiologique'].isin(semaines_selectionnees)
-            ]
+            mask_hebdo = df_hebdo['Semaine épidémiologique'].isin(semaines_selectionnees)
         
         if use_seuil:
-            df_hebdo_filtered = df_hebdo_filtered[
-                df_hebdo_filtered['TOTAL_APPELS_SEMAINE'] >= seuil_min
-            ]
+            masque_seuil = df_hebdo['TOTAL_APPELS_SEMAINE'] >= seuil_min
+            mask_hebdo = masque_seuil if mask_hebdo is None else mask_hebdo & masque_seuil
+        
+        df_hebdo_filtered = df_hebdo if mask_hebdo is None else df_hebdo.loc[mask_hebdo]
         
         st.info(f"📊 **{len(df_hebdo_filtered)}** semaines correspondent aux critères")
         
         # === AFFICHAGE ===
         st.markdown("### 📋 Tableau des Données Hebdomadaires")
         
-        display_dataframe_formatted(df_hebdo_filtered, height=600)
+        display_dataframe_formatted(df_hebdo_filtered, height=600, page_size=50, key="page_hebdo")
         
         # === STATISTIQUES ===
-        with st.expander("📊 Statistiques Descriptives"):
-            colonnes_numeriques = df_hebdo_filtered.select_dtypes(include=['int64', 'float64']).columns.tolist()
+        if st.checkbox("📊 Afficher les statistiques descriptives", key="show_stats_hebdo"):
+            colonnes_numeriques = donnees['colonnes_numeriques']['hebdomadaire']
             
             if colonnes_numeriques:
                 stats = df_hebdo_filtered[colonnes_numeriques].describe()
@@ -367,25 +408,15 @@ with tab_consultation:
         # === AFFICHAGE ===
         st.markdown("### 📋 Tableau du Calendrier")
         
-        # Préparer le DataFrame pour affichage
-        df_cal_display = df_calendrier.copy()
-        
-        # Formater la colonne DATE
-        df_cal_display['DATE'] = df_cal_display['DATE'].dt.strftime('%d/%m/%Y')
+        # Préparer le DataFrame pour affichage (mis en cache)
+        df_cal_display = _build_cal_display(df_calendrier)
         
-        # Renommer les colonnes
-        df_cal_display = df_cal_display.rename(columns={
-            'Week_No': 'N° Semaine',
-            'Semaine épidémiologique': 'Label Semaine',
-            'Month': 'Mois',
-            'DATE': 'Date'
-        })
-        
-        display_dataframe_formatted(df_cal_display, height=600)
+        display_dataframe_formatted(df_cal_display, height=600, page_size=50, key="page_cal")
         
         # === RECHERCHE ===
         with st.expander("🔍 Rechercher une semaine spécifique"):
-            semaines_uniques = sorted(df_calendrier['Semaine épidémiologique'].unique())
+            # Catégories déjà triées par numéro de semaine au chargement
+            semaines_uniques = list(df_calendrier['Semaine épidémiologique'].cat.categories)
             
             semaine_recherche = st.selectbox(
                 "Sélectionnez une semaine :",
@@ -422,6 +453,9 @@ with tab_gestion:
     
     section_header("Upload et Mise à Jour des Fichiers Excel", icon="📤")
     
+    # Un seul scan du dossier data/ par rerun (partagé par toutes les sections)
+    fichiers_detectes = _detecter_fichiers_cached()
+    
     st.info("""
     **📋 Instructions pour la mise à jour des données :**
 
@@ -442,8 +476,6 @@ with tab_gestion:
     
     st.markdown("### 📂 Fichiers Actuels")
     
-    fichiers_detectes = detecter_fichiers_data()
-    
     col1, col2 = st.columns(2)
     
     # Fichier Appels
@@ -452,15 +484,15 @@ with tab_gestion:
         
         fichier_appels = fichiers_detectes['appels']
         
-        if fichier_appels and os.path.exists(fichier_appels):
-            stats = os.stat(fichier_appels)
-            taille = stats.st_size / 1024
-            modif = datetime.fromtimestamp(stats.st_mtime)
+        infos = _infos_fichier(fichier_appels) if fichier_appels else None
+        
+        if infos:
+            taille, modif = infos
             
             st.success(f"✅ Fichier détecté")
             st.info(f"📂 `{os.path.basename(fichier_appels)}`")
             st.write(f"📏 Taille : {taille:.1f} Ko")
-            st.write(f"🕐 Modifié : {modif.strftime('%d/%m/%Y %H:%M')}")
+            st.write(f"🕐 Modifié : {modif}")
             
             with open(fichier_appels, "rb") as f:
                 st.download_button(
@@ -479,15 +511,15 @@ with tab_gestion:
         
         fichier_calendrier = fichiers_detectes['calendrier']
         
-        if fichier_calendrier and os.path.exists(fichier_calendrier):
-            stats = os.stat(fichier_calendrier)
-            taille = stats.st_size / 1024
-            modif = datetime.fromtimestamp(stats.st_mtime)
+        infos = _infos_fichier(fichier_calendrier) if fichier_calendrier else None
+        
+        if infos:
+            taille, modif = infos
             
             st.success(f"✅ Fichier détecté")
             st.info(f"📂 `{os.path.basename(fichier_calendrier)}`")
             st.write(f"📏 Taille : {taille:.1f} Ko")
-            st.write(f"🕐 Modifié : {modif.strftime('%d/%m/%Y %H:%M')}")
+            st.write(f"🕐 Modifié : {modif}")
             
             with open(fichier_calendrier, "rb") as f:
                 st.download_button(
@@ -504,8 +536,7 @@ with tab_gestion:
     # UPLOAD DE NOUVEAUX FICHIERS
     # ==============================================================================
     
-    st.markdown("---")
-    st.markdown("### 📤 Upload de Nouveaux Fichiers")
+    st.markdown("---\n\n### 📤 Upload de Nouveaux Fichiers")  # Séparateur + titre en un seul élément
     
     upload_tab1, upload_tab2 = st.tabs(["📊 Appels Journaliers", "📅 Calendrier"])
     
@@ -513,8 +544,7 @@ with tab_gestion:
     with upload_tab1:
         st.markdown("#### 📊 Mettre à jour le fichier des appels")
         
-        fichiers_detectes_upload = detecter_fichiers_data()
-        fichier_actuel_appels = fichiers_detectes_upload['appels']
+        fichier_actuel_appels = fichiers_detectes['appels']
         
         if fichier_actuel_appels:
             st.info(f"📂 **Fichier actuel :** `{os.path.basename(fichier_actuel_appels)}`")
@@ -528,18 +558,18 @@ with tab_gestion:
         
         if uploaded_appels:
             try:
-                df_new = pd.read_excel(uploaded_appels)
+                colonnes_new, df_new, nb_lignes_new = _apercu_excel(uploaded_appels)
                 st.success(f"✅ Fichier chargé : {uploaded_appels.name}")
                 
                 col1, col2 = st.columns(2)
                 with col1:
-                    st.metric("Lignes", len(df_new))
+                    st.metric("Lignes", nb_lignes_new if nb_lignes_new is not None else "—")
                 with col2:
-                    st.metric("Colonnes", len(df_new.columns))
+                    st.metric("Colonnes", len(colonnes_new))
                 
                 # Validation
                 colonnes_req = ['DATE'] + settings.CATEGORIES_APPELS
-                colonnes_manq = [c for c in colonnes_req if c not in df_new.columns]
+                colonnes_manq = [c for c in colonnes_req if c not in colonnes_new]
                 
                 if colonnes_manq:
                     st.error(f"❌ Colonnes manquantes : {', '.join(colonnes_manq)}")
@@ -547,7 +577,7 @@ with tab_gestion:
                     st.success("✅ Structure du fichier validée !")
                     
                     with st.expander("👁️ Prévisualiser (10 premières lignes)"):
-                        st.dataframe(df_new.head(10), use_container_width=True)
+                        st.dataframe(df_new, use_container_width=True)
                     
                     st.markdown("---")
                     
@@ -570,16 +600,21 @@ with tab_gestion:
                         # Sauvegarder le nouveau fichier
                         nouveau_chemin = fichier_actuel_appels if fichier_actuel_appels else str(settings.DATA_DIR / uploaded_appels.name)
                         
+                        # Copie par blocs de 64 Ko (pas de second tampon complet)
+                        uploaded_appels.seek(0)
                         with open(nouveau_chemin, "wb") as f:
-                            f.write(uploaded_appels.getbuffer())
+                            shutil.copyfileobj(uploaded_appels, f, length=65536)
                         
                         st.success(f"🎉 Fichier mis à jour : `{os.path.basename(nouveau_chemin)}`")
-                        st.balloons()
+                        if settings.UX_CONFIG.get('celebrate', False):
+                            st.balloons()
                         
-                        log_upload_fichier(uploaded_appels.name, len(uploaded_appels.getvalue()), success=True)
+                        log_upload_fichier(uploaded_appels.name, uploaded_appels.size, success=True)
                         
-                        # Effacer le cache
+                        # Effacer le cache (données copiées et ressources partagées)
                         st.cache_data.clear()
+                        st.cache_resource.clear()
+                        vider_cache_figures()
                         
                         st.info("💡 Rafraîchissez la page (F5) pour voir les changements.")
             
@@ -591,8 +626,7 @@ with tab_gestion:
     with upload_tab2:
         st.markdown("#### 📅 Mettre à jour le calendrier épidémiologique")
         
-        fichiers_detectes_upload = detecter_fichiers_data()
-        fichier_actuel_cal = fichiers_detectes_upload['calendrier']
+        fichier_actuel_cal = fichiers_detectes['calendrier']
         
         if fichier_actuel_cal:
             st.info(f"📂 **Fichier actuel :** `{os.path.basename(fichier_actuel_cal)}`")
@@ -606,18 +640,18 @@ with tab_gestion:
         
         if uploaded_cal:
             try:
-                df_new_cal = pd.read_excel(uploaded_cal)
+                colonnes_new, df_new_cal, nb_lignes_new = _apercu_excel(uploaded_cal)
                 st.success(f"✅ Fichier chargé : {uploaded_cal.name}")
                 
                 col1, col2 = st.columns(2)
                 with col1:
-                    st.metric("Lignes", len(df_new_cal))
+                    st.metric("Lignes", nb_lignes_new if nb_lignes_new is not None else "—")
                 with col2:
-                    st.metric("Colonnes", len(df_new_cal.columns))
+                    st.metric("Colonnes", len(colonnes_new))
                 
                 # Validation
                 colonnes_req_cal = ['DATE', 'Semaine épidémiologique']
-                colonnes_manq_cal = [c for c in colonnes_req_cal if c not in df_new_cal.columns]
+                colonnes_manq_cal = [c for c in colonnes_req_cal if c not in colonnes_new]
                 
                 if colonnes_manq_cal:
                     st.error(f"❌ Colonnes manquantes : {', '.join(colonnes_manq_cal)}")
@@ -625,7 +659,7 @@ with tab_gestion:
                     st.success("✅ Structure du fichier validée !")
                     
                     with st.expander("👁️ Prévisualiser (10 premières lignes)"):
-                        st.dataframe(df_new_cal.head(10), use_container_width=True)
+                        st.dataframe(df_new_cal, use_container_width=True)
                     
                     st.markdown("---")
                     
@@ -648,16 +682,21 @@ with tab_gestion:
                         # Sauvegarder le nouveau fichier
                         nouveau_chemin = fichier_actuel_cal if fichier_actuel_cal else str(settings.DATA_DIR / uploaded_cal.name)
                         
+                        # Copie par blocs de 64 Ko (pas de second tampon complet)
+                        uploaded_cal.seek(0)
                         with open(nouveau_chemin, "wb") as f:
-                            f.write(uploaded_cal.getbuffer())
+                            shutil.copyfileobj(uploaded_cal, f, length=65536)
                         
                         st.success(f"🎉 Fichier mis à jour : `{os.path.basename(nouveau_chemin)}`")
-                        st.balloons()
+                        if settings.UX_CONFIG.get('celebrate', False):
+                            st.balloons()
                         
-                        log_upload_fichier(uploaded_cal.name, len(uploaded_cal.getvalue()), success=True)
+                        log_upload_fichier(uploaded_cal.name, uploaded_cal.size, success=True)
                         
-                        # Effacer le cache
+                        # Effacer le cache (données copiées et ressources partagées)
                         st.cache_data.clear()
+                        st.cache_resource.clear()
+                        vider_cache_figures()
                         
                         st.info("💡 Rafraîchissez la page (F5) pour voir les changements.")
             
@@ -669,39 +708,58 @@ with tab_gestion:
     # HISTORIQUE DES SAUVEGARDES
     # ==============================================================================
     
-    st.markdown("---")
-    st.markdown("### 📚 Historique des Sauvegardes")
+    st.markdown("---\n\n### 📚 Historique des Sauvegardes")
     
     backup_dir = settings.DATA_DIR / "backups"
     
     if backup_dir.exists():
-        backups = sorted(backup_dir.glob("*_backup_*.xlsx"), key=os.path.getmtime, reverse=True)
+        # Métadonnées mises en cache (scan + strftime refaits après upload seulement)
+        backups = _list_backups_meta(str(backup_dir))
         
         if backups:
             st.success(f"✅ {len(backups)} sauvegarde(s) disponible(s)")
             
-            for backup in backups[:10]:  # Afficher les 10 dernières
-                stats = os.stat(backup)
-                taille = stats.st_size / 1024
-                modif = datetime.fromtimestamp(stats.st_mtime)
-                
-                col1, col2, col3, col4 = st.columns([3, 2, 2, 1])
+            backups_recents = backups[:10]  # Afficher les 10 dernières
+            
+            # Métadonnées uniquement : aucun fichier lu à l'affichage
+            for nom, taille, modif in backups_recents:
+                col1, col2, col3 = st.columns([3, 2, 2])
                 
                 with col1:
-                    st.write(f"📄 {backup.name}")
+                    st.write(f"📄 {nom}")
                 with col2:
                     st.write(f"📏 {taille:.1f} Ko")
                 with col3:
-                    st.write(f"🕐 {modif.strftime('%d/%m/%Y %H:%M')}")
-                with col4:
-                    with open(backup, "rb") as f:
-                        st.download_button(
-                            label="📥",
-                            data=f,
-                            file_name=backup.name,
-                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                            key=f"dl_backup_{backup.name}"
-                        )
+                    st.write(f"🕐 {modif}")
+            
+            # Un seul fichier lu : la sauvegarde choisie pour le téléchargement
+            col1, col2 = st.columns([3, 1])
+            
+            with col1:
+                backup_choisi = st.selectbox(
+                    "Sauvegarde à télécharger :",
+                    [nom for nom, _, _ in backups_recents],
+                    key="select_backup"
+                )
+            
+            with col2:
+                st.write("")
+                st.write("")
+                try:
+                    contenu_backup = (backup_dir / backup_choisi).read_bytes()
+                except OSError as e:
+                    # Sauvegarde supprimée ou illisible depuis le dernier listage
+                    _list_backups_meta.clear()
+                    st.warning(f"⚠️ Sauvegarde illisible : {str(e)}")
+                else:
+                    st.download_button(
+                        label="📥 Télécharger",
+                        data=contenu_backup,
+                        file_name=backup_choisi,
+                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                        key="dl_backup",
+                        use_container_width=True
+                    )
         else:
             st.info("ℹ️ Aucune sauvegarde disponible")
     else:
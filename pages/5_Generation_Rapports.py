@@ -22,19 +22,24 @@ Version: 4.1 - Correction Évolution Hebdomadaire
 """
 
 import streamlit as st
-import streamlit.components.v1 as components
 import os
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
+from types import MappingProxyType
+from enum import IntEnum
 import traceback
+import heapq
+from importlib.util import find_spec
 import pandas as pd
 
 # Imports de la nouvelle architecture
 from config import settings
 from utils.data_loader import charger_toutes_les_donnees
-from utils.helpers import extraire_numero_semaine, generer_nom_fichier
+from utils.helpers import generer_nom_fichier, fmt_fr
 from utils.logger import setup_logger, log_generation_rapport
-from components.layout import apply_custom_css, page_header, section_header
+from components.layout import apply_custom_css, force_hamburger_visible, page_header, section_header
+from components.metrics import stat_card_compact
 from components.sidebar import render_sidebar
 
 # ==============================================================================
@@ -48,12 +53,30 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# ==============================================================================
+# CONSTANTES DE LA PAGE
+# ==============================================================================
+
+# Modèle unique et libellés des modes (construits une fois, pas à chaque rerun)
+MODELE_RAPPORT = "MINSANTE_OPTIMISE"
+NB_SLIDES = 7
+
+class ModeRapport(IntEnum):
+    """Mode de sélection de la période (entier : comparaisons et clés de dict directes)."""
+    SEMAINE = 0
+    PERIODE = 1
+
+MODE_LABELS = MappingProxyType({
+    ModeRapport.SEMAINE: "📊 Sélection par Semaine Épidémiologique",
+    ModeRapport.PERIODE: "📅 Sélection par Période Personnalisée"
+})
+
 # ==============================================================================
 # INITIALISATION SESSION STATE
 # ==============================================================================
 
 if 'mode_selection' not in st.session_state:
-    st.session_state.mode_selection = "semaine"  # "semaine" ou "periode"
+    st.session_state.mode_selection = ModeRapport.SEMAINE
 
 if 'rapport_genere' not in st.session_state:
     st.session_state.rapport_genere = None
@@ -64,78 +87,16 @@ if 'date_debut' not in st.session_state:
 if 'date_fin' not in st.session_state:
     st.session_state.date_fin = None
 
+if 'erreur_generation' not in st.session_state:
+    st.session_state.erreur_generation = None
+
 # ==============================================================================
 # CSS + JAVASCRIPT
 # ==============================================================================
 
 apply_custom_css()
 
-components.html("""
-<script>
-function forceHamburgerAlwaysVisible() {
-    const selectors = [
-        '[data-testid="collapsedControl"]',
-        'button[kind="icon"]',
-        '[class*="collapsedControl"]'
-    ];
-    
-    let btn = null;
-    for (const selector of selectors) {
-        btn = parent.document.querySelector(selector);
-        if (btn) break;
-    }
-    
-    if (btn) {
-        btn.style.cssText = `
-            display: block !important;
-            visibility: visible !important;
-            opacity: 1 !important;
-            position: fixed !important;
-            top: 4.2rem !important;
-            left: 0.8rem !important;
-            z-index: 9999999999 !important;
-            width: 52px !important;
-            height: 52px !important;
-            background: linear-gradient(135deg, #007A33 0%, #00a844 100%) !important;
-            border-radius: 10px !important;
-            border: 3px solid white !important;
-            box-shadow: 0 4px 16px rgba(0, 122, 51, 0.5) !important;
-            cursor: pointer !important;
-            transition: all 0.2s ease !important;
-            pointer-events: auto !important;
-        `;
-        
-        btn.setAttribute('aria-hidden', 'false');
-        
-        if (btn.parentElement) {
-            btn.parentElement.style.cssText = `
-                display: block !important;
-                visibility: visible !important;
-                opacity: 1 !important;
-            `;
-        }
-    }
-}
-
-setInterval(forceHamburgerAlwaysVisible, 100);
-
-const observer = new MutationObserver(forceHamburgerAlwaysVisible);
-observer.observe(parent.document.body, { 
-    childList: true, 
-    subtree: true,
-    attributes: true,
-    attributeFilter: ['style', 'class', 'aria-hidden']
-});
-
-forceHamburgerAlwaysVisible();
-
-parent.document.addEventListener('click', function(e) {
-    setTimeout(forceHamburgerAlwaysVisible, 50);
-    setTimeout(forceHamburgerAlwaysVisible, 200);
-    setTimeout(forceHamburgerAlwaysVisible, 500);
-});
-</script>
-""", height=0)
+force_hamburger_visible()
 
 logger = setup_logger('generation_rapports')
 logger.info("=== Page Génération de Rapports v4.1 chargée ===")
@@ -144,13 +105,14 @@ logger.info("=== Page Génération de Rapports v4.1 chargée ===")
 # IMPORTS DES GÉNÉRATEURS POWERPOINT
 # ==============================================================================
 
-# Générateur OPTIMISÉ (Modèle Unique)
-try:
-    from utils.pptx_generator_minsante import generer_rapport_minsante
-    GENERATOR_AVAILABLE = True
-except Exception as e:
-    GENERATOR_AVAILABLE = False
-    logger.error(f"Générateur non disponible : {e}")
+# Générateur OPTIMISÉ (Modèle Unique) : simple sonde de disponibilité ici,
+# l'import réel (python-pptx) n'a lieu qu'à la génération
+GENERATOR_AVAILABLE = all(
+    find_spec(module) is not None
+    for module in ('utils.pptx_generator_minsante', 'pptx')
+)
+if not GENERATOR_AVAILABLE:
+    logger.error("Générateur non disponible : module utils.pptx_generator_minsante ou python-pptx introuvable")
 
 # ==============================================================================
 # SIDEBAR
@@ -172,20 +134,212 @@ page_header(
 # CHARGEMENT DES DONNÉES
 # ==============================================================================
 
-@st.cache_data(ttl=settings.CACHE_CONFIG['ttl'])
-def load_data():
-    """Charge toutes les données avec cache."""
-    return charger_toutes_les_donnees()
+# Fraîcheur : les données épidémiologiques sont hebdomadaires ; un import via
+# la page Données Brutes vide tous les caches, la TTL ne borne que l'imprévu.
+@st.cache_resource(ttl=settings.CACHE_CONFIG['weekly_data_ttl'], show_spinner=False)
+def _load_all():
+    """Charge les données une seule fois (objet partagé, non copié).
+    
+    L'agrégation hebdomadaire n'est pas utilisée ici : elle est sautée.
+    """
+    return charger_toutes_les_donnees(ressources=('appels', 'calendrier'))
+
+# Les DataFrames ci-dessous sont partagés (st.cache_resource, sans copie) :
+# ils sont en lecture seule, toute modification passe par une copie explicite.
+
+@st.cache_resource(ttl=settings.CACHE_CONFIG['weekly_data_ttl'])
+def load_appels():
+    """Charge les données journalières avec cache."""
+    return _load_all()['appels']
+
+@st.cache_resource(ttl=settings.CACHE_CONFIG['weekly_data_ttl'])
+def load_calendrier():
+    """Charge le calendrier épidémiologique avec cache."""
+    return _load_all()['calendrier']
+
+@st.cache_resource(ttl=settings.CACHE_CONFIG['weekly_data_ttl'])
+def calculer_empreinte_donnees():
+    """
+    Empreinte des données chargées (clé des caches de filtres et de rapports).
+    
+    Calculée une fois par chargement : dimensions, dernière date et hachage
+    vectorisé du contenu des appels et du calendrier. Contrairement au seul
+    total, elle change aussi si des appels sont reclassés entre catégories.
+    Les rapports utilisent toutes les semaines (slide Évolution) : l'empreinte
+    porte donc sur l'ensemble des données, pas sur la période choisie.
+    """
+    df_appels = load_appels()
+    df_calendrier = load_calendrier()
+    return (
+        df_appels.shape,
+        str(df_appels['DATE'].max()),
+        int(pd.util.hash_pandas_object(df_appels, index=False).sum()),
+        int(pd.util.hash_pandas_object(df_calendrier, index=False).sum())
+    )
+
+# Filtres en cache : clés légères (semaine ou bornes + empreinte des données),
+# le DataFrame partagé n'est jamais haché ; les reruns relisent la tranche.
+@st.cache_resource(ttl=settings.CACHE_CONFIG['weekly_data_ttl'])
+def _groupes_semaines():
+    """Index des lignes par semaine, construit une fois (get_group sans balayage)."""
+    return load_appels().groupby('Semaine épidémiologique', observed=True, sort=False)
+
+@st.cache_resource(ttl=settings.CACHE_CONFIG['weekly_data_ttl'])
+def resume_semaines():
+    """
+    Résumé par semaine (une ligne par semaine), calculé une fois.
+    
+    Les lignes suivent l'ordre de la liste déroulante (semaines_desc) ; la
+    semaine choisie y est lue par son libellé (.loc).
+    
+    Returns:
+        pd.DataFrame: Index semaine ; colonnes date_min, date_max, total, nb_jours
+    """
+    return _groupes_semaines().agg(
+        date_min=('DATE', 'min'),
+        date_max=('DATE', 'max'),
+        total=('TOTAL_APPELS_JOUR', 'sum'),
+        nb_jours=('DATE', 'size')
+    ).reindex(_load_all()['semaines_desc'])
+
+@st.cache_data(ttl=settings.CACHE_CONFIG['weekly_data_ttl'], show_spinner=False)
+def filtrer_par_periode(debut, fin, empreinte_donnees):
+    """
+    Lignes journalières comprises entre deux dates (incluses).
+    
+    Les appels sont triés par DATE au chargement : deux recherches
+    dichotomiques bornent une tranche contiguë, sans masque booléen.
+    """
+    df = load_appels()
+    dates = df['DATE']
+    debut_idx = dates.searchsorted(pd.Timestamp(debut), side='left')
+    fin_idx = dates.searchsorted(pd.Timestamp(fin), side='right')
+    return df.iloc[debut_idx:fin_idx]
+
+def semaine_a_la_date(date):
+    """
+    Semaine épidémiologique de la dernière ligne datée au plus tard de `date`.
+    
+    Les appels sont triés par DATE au chargement : recherche dichotomique
+    (searchsorted), sans masque sur toute la colonne.
+    """
+    df = load_appels()
+    idx = df['DATE'].searchsorted(date, side='right') - 1
+    return df['Semaine épidémiologique'].iat[idx] if idx >= 0 else None
+
+# Fraîcheur : le dossier outputs/ change à chaque génération (cache vidé
+# explicitement) ; la TTL courte couvre les fichiers ajoutés hors application.
+@st.cache_data(ttl=settings.CACHE_CONFIG['listing_ttl'], show_spinner=False)
+def lister_rapports(outputs_dir_str, limite=15):
+    """
+    Liste les rapports PPTX, du plus récent au plus ancien (métadonnées seules).
+    
+    Un seul os.scandir : DirEntry.stat() est mis en cache par entrée ; seules
+    les `limite` entrées affichées sont formatées et gardées en cache.
+    
+    Returns:
+        tuple: (nombre total de rapports, tuples (nom, chemin, taille_mb,
+            date_modif formatée) des plus récents), ou None si le dossier
+            n'existe pas
+    """
+    rapports = []
+    try:
+        with os.scandir(outputs_dir_str) as entrees:
+            for entree in entrees:
+                if entree.name.startswith("rapport_") and entree.name.endswith(".pptx"):
+                    stats = entree.stat()
+                    rapports.append((stats.st_mtime, entree.name, entree.path, stats.st_size / 1024 / 1024))
+    except FileNotFoundError:
+        return None
+    
+    recents = heapq.nlargest(limite, rapports)
+    return len(rapports), [
+        (nom, chemin, taille, datetime.fromtimestamp(mtime).strftime('%d/%m/%Y %H:%M'))
+        for mtime, nom, chemin, taille in recents
+    ]
+
+# Fraîcheur : un rapport ne dépend que de sa configuration et de l'empreinte
+# des données ; il reste valable tant que celles-ci ne changent pas.
+@st.cache_data(ttl=settings.CACHE_CONFIG['report_ttl'], show_spinner=False)
+def generer_rapport_cache(prefix, semaine, empreinte_donnees):
+    """
+    Génère le rapport PowerPoint, mis en cache par (préfixe, semaine, données).
+    
+    Un second clic avec la même configuration renvoie le fichier déjà
+    produit au lieu de relancer 20-40 s de génération. La durée et l'heure
+    de génération sont mesurées ici : sur un succès de cache, elles restent
+    celles de la génération d'origine.
+    
+    Args:
+        prefix (str): Préfixe du nom de fichier (semaine ou période)
+        semaine (str): Semaine épidémiologique du rapport
+        empreinte_donnees (tuple): Empreinte des données chargées
+    
+    Returns:
+        dict: {'fichier': chemin, 'nom': nom du fichier,
+            'duree': durée de génération (s), 'genere_a': horodatage (time.time())}
+    """
+    start_time = time.perf_counter()
+    
+    filename = generer_nom_fichier(
+        prefix,
+        extension='pptx',
+        include_timestamp=True
+    )
+    
+    # Dossier outputs/ créé une fois au chargement de config.settings
+    output_path = settings.OUTPUTS_DIR / filename
+    
+    # ✅ CORRECTION : Passer df_appels COMPLET (non filtré)
+    # Le générateur filtrera lui-même pour chaque slide selon le besoin :
+    # - Slide 2 (Faits saillants) : filtre sur semaine uniquement
+    # - Slide 3 (Comparaison) : filtre sur semaine vs semaine N-1
+    # - Slide 4 (Évolution) : utilise TOUTES les semaines (S5_2025 à S48_2025)
+    # - Slide 5 (Questions) : filtre sur semaine
+    # Import à la demande (le module reste ensuite dans sys.modules)
+    from utils.pptx_generator_minsante import generer_rapport_minsante
+    
+    output_file = generer_rapport_minsante(
+        df_appels=load_appels(),  # ✅ TOUTES les semaines (S5_2025 à S48_2025)
+        df_calendrier=load_calendrier(),
+        semaine=semaine,  # Semaine sélectionnée (ex: S48_2025)
+        output_path=str(output_path)
+    )
+    
+    # Octets non gardés ici : lire_rapport() les charge au téléchargement
+    if not os.path.isfile(output_file):
+        raise Exception("Le fichier n'a pas été créé")
+    
+    return {
+        'fichier': output_file,
+        'nom': filename,
+        'duree': time.perf_counter() - start_time,
+        'genere_a': time.time()
+    }
+
+@st.cache_data(ttl=settings.CACHE_CONFIG['report_ttl'], max_entries=5, show_spinner=False)
+def lire_rapport(chemin, mtime):
+    """
+    Contenu d'un rapport PPTX, lu une fois par version du fichier.
+    
+    La date de modification fait partie de la clé : les reruns réutilisent
+    les octets en mémoire tant que le fichier n'a pas changé.
+    
+    Raises:
+        FileNotFoundError: Si le fichier a été supprimé
+    """
+    return Path(chemin).read_bytes()
 
 try:
-    donnees = load_data()
-    df_appels = donnees['appels']
-    df_calendrier = donnees['calendrier']
-    df_hebdo = donnees['hebdomadaire']
+    donnees = _load_all()
+    df_appels = load_appels()
     
-    # Récupérer les dates min/max disponibles
-    date_min = df_appels['DATE'].min()
-    date_max = df_appels['DATE'].max()
+    # Récupérer les dates min/max disponibles (calculées une fois au chargement)
+    date_min = donnees['statistiques']['date_min']
+    date_max = donnees['statistiques']['date_max']
+    
+    # Empreinte des données (clé du cache des rapports), calculée une fois par chargement
+    empreinte_donnees = calculer_empreinte_donnees()
     
 except Exception as e:
     st.error(settings.MESSAGES['error']['data_inconsistency'])
@@ -219,25 +373,21 @@ col1, col2 = st.columns(2)
 with col1:
     if st.button("📊 Sélection par SEMAINE", 
                  use_container_width=True, 
-                 type="primary" if st.session_state.mode_selection == "semaine" else "secondary"):
-        st.session_state.mode_selection = "semaine"
+                 type="primary" if st.session_state.mode_selection == ModeRapport.SEMAINE else "secondary"):
+        st.session_state.mode_selection = ModeRapport.SEMAINE
         st.session_state.rapport_genere = None
         st.rerun()
 
 with col2:
     if st.button("📅 Sélection par PÉRIODE (Jour début - Jour fin)", 
                  use_container_width=True,
-                 type="primary" if st.session_state.mode_selection == "periode" else "secondary"):
-        st.session_state.mode_selection = "periode"
+                 type="primary" if st.session_state.mode_selection == ModeRapport.PERIODE else "secondary"):
+        st.session_state.mode_selection = ModeRapport.PERIODE
         st.session_state.rapport_genere = None
         st.rerun()
 
 # Afficher le mode sélectionné
-mode_label = {
-    "semaine": "📊 Sélection par Semaine Épidémiologique",
-    "periode": "📅 Sélection par Période Personnalisée"
-}
-st.success(f"✅ Mode actif : **{mode_label[st.session_state.mode_selection]}**")
+st.success(f"✅ Mode actif : **{MODE_LABELS[st.session_state.mode_selection]}**")
 
 st.markdown("---")
 
@@ -247,161 +397,167 @@ st.markdown("---")
 
 section_header("Configuration du Rapport", icon="⚙️")
 
-if st.session_state.mode_selection == "semaine":
-    # ========================================================================
-    # MODE SEMAINE ÉPIDÉMIOLOGIQUE
-    # ========================================================================
-    
-    st.markdown("### 📊 Sélection par Semaine Épidémiologique")
-    
-    col1, col2 = st.columns([2, 1])
-    
-    with col1:
-        # Sélection de la semaine
-        semaines_disponibles = sorted(
-            df_appels['Semaine épidémiologique'].unique(),
-            key=extraire_numero_semaine,
-            reverse=True
-        )
+@st.fragment
+def panneau_configuration(semaines, date_min, date_max, empreinte_donnees):
+    """
+    Panneau de configuration du rapport (semaine ou période) et récapitulatif.
+    
+    Fragment Streamlit : changer de semaine ou de dates ne réexécute que ce
+    panneau, pas le listage de outputs/ ni le reste de la page. Au rerun
+    complet (clic sur Générer), la configuration courante est renvoyée.
+    
+    Returns:
+        tuple: (data_debut, data_fin, mode_generation, periode_label, semaine_param)
+    """
+    if st.session_state.mode_selection == ModeRapport.SEMAINE:
+        # ========================================================================
+        # MODE SEMAINE ÉPIDÉMIOLOGIQUE
+        # ========================================================================
         
-        semaine_selectionnee = st.selectbox(
-            "📊 Sélectionnez la semaine épidémiologique :",
-            semaines_disponibles,
-            index=0,
-            help="La semaine sur laquelle portera le rapport"
-        )
+        st.markdown("### 📊 Sélection par Semaine Épidémiologique")
         
-        # Afficher les dates de la semaine
-        df_semaine_info = df_appels[df_appels['Semaine épidémiologique'] == semaine_selectionnee]
-        date_debut_semaine = df_semaine_info['DATE'].min()
-        date_fin_semaine = df_semaine_info['DATE'].max()
+        col1, col2 = st.columns([2, 1])
         
-        st.info(f"📅 Période : **{date_debut_semaine.strftime('%d/%m/%Y')}** au **{date_fin_semaine.strftime('%d/%m/%Y')}**")
-    
-    with col2:
-        # Statistiques de la semaine
-        st.markdown("**📊 Aperçu de la semaine :**")
-        total_appels = df_semaine_info['TOTAL_APPELS_JOUR'].sum()
-        nb_jours = len(df_semaine_info)
+        with col1:
+            # Sélection de la semaine (liste triée une seule fois au chargement) :
+            # le widget garde le libellé, pas une position qui deviendrait fausse
+            # si la liste des semaines change (nouvel import, liste plus courte)
+            semaine_selectionnee = st.selectbox(
+                "📊 Sélectionnez la semaine épidémiologique :",
+                semaines,
+                index=0,
+                key="semaine_rapport",
+                help="La semaine sur laquelle portera le rapport"
+            )
+            
+            # Afficher les dates de la semaine (lecture par libellé dans le résumé)
+            resume_semaine = resume_semaines().loc[semaine_selectionnee]
+            date_debut_semaine = resume_semaine['date_min']
+            date_fin_semaine = resume_semaine['date_max']
+            
+            st.info(f"📅 Période : **{date_debut_semaine.strftime('%d/%m/%Y')}** au **{date_fin_semaine.strftime('%d/%m/%Y')}**")
         
-        st.metric("Total Appels", f"{total_appels:,}".replace(",", " "))
-        st.metric("Jours de données", nb_jours)
-    
-    # Variables pour la génération
-    data_debut = date_debut_semaine
-    data_fin = date_fin_semaine
-    mode_generation = "semaine"
-    periode_label = semaine_selectionnee
-
-else:
-    # ========================================================================
-    # MODE PÉRIODE PERSONNALISÉE
-    # ========================================================================
-    
-    st.markdown("### 📅 Sélection par Période Personnalisée")
-    
-    st.info(f"""
-    📊 **Données disponibles :**  
-    Du **{date_min.strftime('%d/%m/%Y')}** au **{date_max.strftime('%d/%m/%Y')}**
-    
-    Sélectionnez n'importe quelle période dans cette plage.
-    """)
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Date de début
-        date_debut_input = st.date_input(
-            "📅 Date de DÉBUT",
-            value=date_max - timedelta(days=6),  # Par défaut : dernière semaine
-            min_value=date_min,
-            max_value=date_max,
-            help="Premier jour de la période",
-            format="DD/MM/YYYY"
-        )
+        with col2:
+            # Statistiques de la semaine (une seule carte)
+            total_appels = int(resume_semaine['total'])
+            nb_jours = int(resume_semaine['nb_jours'])
+            
+            stat_card_compact(
+                {"Total Appels": fmt_fr(total_appels), "Jours de données": nb_jours},
+                title="📊 Aperçu de la semaine"
+            )
         
-        st.session_state.date_debut = pd.to_datetime(date_debut_input)
+        # Variables pour la génération
+        data_debut = date_debut_semaine
+        data_fin = date_fin_semaine
+        mode_generation = ModeRapport.SEMAINE
+        periode_label = semaine_selectionnee
+        semaine_param = semaine_selectionnee
     
-    with col2:
-        # Date de fin
-        date_fin_input = st.date_input(
-            "📅 Date de FIN",
-            value=date_max,
-            min_value=date_min,
-            max_value=date_max,
-            help="Dernier jour de la période",
-            format="DD/MM/YYYY"
-        )
+    else:
+        # ========================================================================
+        # MODE PÉRIODE PERSONNALISÉE
+        # ========================================================================
         
-        st.session_state.date_fin = pd.to_datetime(date_fin_input)
-    
-    # Validation de la période
-    if st.session_state.date_debut > st.session_state.date_fin:
-        st.error("❌ **Erreur** : La date de début doit être antérieure ou égale à la date de fin")
-        st.stop()
-    
-    # Calculer la durée
-    duree_periode = (st.session_state.date_fin - st.session_state.date_debut).days + 1
-    
-    # Filtrer les données de la période
-    df_periode = df_appels[
-        (df_appels['DATE'] >= st.session_state.date_debut) & 
-        (df_appels['DATE'] <= st.session_state.date_fin)
-    ]
+        st.markdown("### 📅 Sélection par Période Personnalisée")
+        
+        st.info(f"""
+        📊 **Données disponibles :**  
+        Du **{date_min.strftime('%d/%m/%Y')}** au **{date_max.strftime('%d/%m/%Y')}**
+        
+        Sélectionnez n'importe quelle période dans cette plage.
+        """)
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # Date de début
+            date_debut_input = st.date_input(
+                "📅 Date de DÉBUT",
+                value=date_max - timedelta(days=6),  # Par défaut : dernière semaine
+                min_value=date_min,
+                max_value=date_max,
+                help="Premier jour de la période",
+                format="DD/MM/YYYY"
+            )
+            
+            st.session_state.date_debut = pd.to_datetime(date_debut_input)
+        
+        with col2:
+            # Date de fin
+            date_fin_input = st.date_input(
+                "📅 Date de FIN",
+                value=date_max,
+                min_value=date_min,
+                max_value=date_max,
+                help="Dernier jour de la période",
+                format="DD/MM/YYYY"
+            )
+            
+            st.session_state.date_fin = pd.to_datetime(date_fin_input)
+        
+        # Validation de la période
+        if st.session_state.date_debut > st.session_state.date_fin:
+            st.error("❌ **Erreur** : La date de début doit être antérieure ou égale à la date de fin")
+            st.stop()
+        
+        # Calculer la durée
+        duree_periode = (st.session_state.date_fin - st.session_state.date_debut).days + 1
+        
+        # Filtrer les données de la période
+        df_periode = filtrer_par_periode(st.session_state.date_debut, st.session_state.date_fin, empreinte_donnees)
+        
+        # Vérifier qu'il y a des données
+        if len(df_periode) == 0:
+            st.warning("⚠️ **Aucune donnée disponible pour cette période**")
+            st.stop()
+        
+        # Afficher les statistiques de la période
+        st.markdown("---")
+        st.markdown("### 📊 Aperçu de la Période Sélectionnée")
+        
+        # Une seule carte pour les quatre statistiques
+        total_appels_periode = df_periode['TOTAL_APPELS_JOUR'].sum()
+        moyenne_periode = int(df_periode['TOTAL_APPELS_JOUR'].mean())
+        nb_jours_data = len(df_periode)
+        
+        stat_card_compact({
+            "Durée": f"{duree_periode} jour(s)",
+            "Total Appels": fmt_fr(total_appels_periode),
+            "Moyenne/Jour": fmt_fr(moyenne_periode),
+            "Jours de données": nb_jours_data
+        }, columns=4)
+        
+        # Variables pour la génération
+        data_debut = st.session_state.date_debut
+        data_fin = st.session_state.date_fin
+        mode_generation = ModeRapport.PERIODE
+        periode_label = f"{data_debut.strftime('%d/%m/%Y')} au {data_fin.strftime('%d/%m/%Y')}"
+        # ✅ CORRECTION : semaine du rapport = semaine de la date de fin
+        # (dernier jour disponible de la période, non vide vérifié plus haut)
+        semaine_param = semaine_a_la_date(data_fin)
     
-    # Vérifier qu'il y a des données
-    if len(df_periode) == 0:
-        st.warning("⚠️ **Aucune donnée disponible pour cette période**")
-        st.stop()
+    # ========================================================================
+    # RÉCAPITULATIF DE LA CONFIGURATION
+    # ========================================================================
     
-    # Afficher les statistiques de la période
     st.markdown("---")
-    st.markdown("### 📊 Aperçu de la Période Sélectionnée")
-    
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric("Durée", f"{duree_periode} jour(s)")
-    
-    with col2:
-        total_appels_periode = df_periode['TOTAL_APPELS_JOUR'].sum()
-        st.metric("Total Appels", f"{total_appels_periode:,}".replace(",", " "))
+    st.markdown("### 📋 Récapitulatif de la Configuration")
     
-    with col3:
-        moyenne_periode = int(df_periode['TOTAL_APPELS_JOUR'].mean())
-        st.metric("Moyenne/Jour", f"{moyenne_periode:,}".replace(",", " "))
+    nb_jours_rapport = (data_fin - data_debut).days + 1
     
-    with col4:
-        nb_jours_data = len(df_periode)
-        st.metric("Jours de données", nb_jours_data)
+    stat_card_compact({
+        "Modèle": "MINSANTE Optimisé",
+        "Période": periode_label,
+        "Slides": NB_SLIDES,
+        "Jours": nb_jours_rapport
+    }, columns=4)
     
-    # Variables pour la génération
-    data_debut = st.session_state.date_debut
-    data_fin = st.session_state.date_fin
-    mode_generation = "periode"
-    periode_label = f"{data_debut.strftime('%d/%m/%Y')} au {data_fin.strftime('%d/%m/%Y')}"
-
-# ==============================================================================
-# RÉCAPITULATIF DE LA CONFIGURATION
-# ==============================================================================
+    return data_debut, data_fin, mode_generation, periode_label, semaine_param
 
-st.markdown("---")
-st.markdown("### 📋 Récapitulatif de la Configuration")
-
-col1, col2, col3, col4 = st.columns(4)
-
-with col1:
-    st.metric("Modèle", "MINSANTE Optimisé")
-
-with col2:
-    st.metric("Période", periode_label)
-
-with col3:
-    st.metric("Slides", "7")
-
-with col4:
-    nb_jours_rapport = (data_fin - data_debut).days + 1
-    st.metric("Jours", nb_jours_rapport)
+data_debut, data_fin, mode_generation, periode_label, semaine_param = panneau_configuration(
+    donnees['semaines_desc'], date_min, date_max, empreinte_donnees
+)
 
 # ==============================================================================
 # SECTION 3 : GÉNÉRATION DU RAPPORT
@@ -434,92 +590,85 @@ if st.button("🎯 GÉNÉRER LE RAPPORT POWERPOINT", type="primary", use_contain
     with st.spinner(f"⏳ Génération du rapport pour la période {periode_label} en cours..."):
         
         try:
-            start_time = datetime.now()
+            debut_clic = time.time()
             
             # Générer le nom de fichier
-            if mode_generation == "semaine":
+            if mode_generation == ModeRapport.SEMAINE:
                 prefix = f"rapport_MINSANTE_{periode_label}"
             else:
                 prefix = f"rapport_MINSANTE_{data_debut.strftime('%Y%m%d')}_{data_fin.strftime('%Y%m%d')}"
             
-            filename = generer_nom_fichier(
-                prefix,
-                extension='pptx',
-                include_timestamp=True
-            )
+            # Même configuration + mêmes données = rapport réutilisé depuis le cache
+            rapport = generer_rapport_cache(prefix, semaine_param, empreinte_donnees)
+            try:
+                # Un seul appel système : existence et taille du fichier
+                st_info = os.stat(rapport['fichier'])
+            except FileNotFoundError:
+                # Fichier supprimé depuis la mise en cache : régénérer
+                generer_rapport_cache.clear()
+                rapport = generer_rapport_cache(prefix, semaine_param, empreinte_donnees)
+                st_info = os.stat(rapport['fichier'])
+            output_file = rapport['fichier']
+            filename = rapport['nom']
+            duree = rapport['duree']
             
-            output_path = settings.OUTPUTS_DIR / filename
+            # Généré avant ce clic : rapport existant renvoyé par le cache
+            depuis_cache = rapport['genere_a'] < debut_clic
             
-            # S'assurer que le dossier outputs existe
-            settings.OUTPUTS_DIR.mkdir(parents=True, exist_ok=True)
+            # Stocker les infos du rapport dans session_state
+            st.session_state.erreur_generation = None
+            st.session_state.rapport_genere = {
+                'fichier': output_file,
+                'nom': filename,
+                'mtime': st_info.st_mtime,
+                'duree': duree,
+                'taille': st_info.st_size / 1024 / 1024,
+                'periode': periode_label,
+                'mode': mode_generation,
+                'depuis_cache': depuis_cache
+            }
             
-            # ✅ CORRECTION : Déterminer la semaine pour le rapport
-            if mode_generation == "semaine":
-                semaine_param = periode_label
+            if depuis_cache:
+                # Aucun fichier écrit : ni historique à rafraîchir, ni génération à journaliser
+                genere_le = datetime.fromtimestamp(rapport['genere_a']).strftime('%d/%m/%Y %H:%M')
+                st.info(f"♻️ Rapport existant réutilisé (généré le {genere_le} en {duree:.1f}s, mêmes données)")
             else:
-                # Pour mode période, on utilise la semaine de la date de fin
-                df_filtered = df_appels[
-                    (df_appels['DATE'] >= data_debut) & 
-                    (df_appels['DATE'] <= data_fin)
-                ]
-                semaine_param = df_filtered['Semaine épidémiologique'].iloc[-1] if len(df_filtered) > 0 else "CUSTOM"
-            
-            # ✅ CORRECTION : Passer df_appels COMPLET (non filtré)
-            # Le générateur filtrera lui-même pour chaque slide selon le besoin :
-            # - Slide 2 (Faits saillants) : filtre sur semaine_param uniquement
-            # - Slide 3 (Comparaison) : filtre sur semaine_param vs semaine N-1
-            # - Slide 4 (Évolution) : utilise TOUTES les semaines (S5_2025 à S48_2025)
-            # - Slide 5 (Questions) : filtre sur semaine_param
-            output_file = generer_rapport_minsante(
-                df_appels=df_appels,  # ✅ TOUTES les semaines (S5_2025 à S48_2025)
-                df_calendrier=df_calendrier,
-                semaine=semaine_param,  # Semaine sélectionnée (ex: S48_2025)
-                output_path=str(output_path)
-            )
-            
-            # Calculer la durée
-            duree = (datetime.now() - start_time).total_seconds()
-            
-            # Vérifier que le fichier existe
-            if Path(output_file).exists():
-                # Stocker les infos du rapport dans session_state
-                st.session_state.rapport_genere = {
-                    'fichier': output_file,
-                    'nom': filename,
-                    'duree': duree,
-                    'taille': Path(output_file).stat().st_size / 1024 / 1024,
-                    'periode': periode_label,
-                    'mode': mode_generation
-                }
+                # Le nouveau rapport doit apparaître dans l'historique
+                lister_rapports.clear()
                 
                 st.success(f"✅ Rapport généré avec succès en {duree:.1f}s !")
-                st.balloons()
+                if settings.UX_CONFIG.get('celebrate', False):
+                    st.balloons()
                 
                 # Logs
                 log_generation_rapport(
-                    modele="MINSANTE_OPTIMISE",
-                    nb_slides=7,
+                    modele=MODELE_RAPPORT,
+                    nb_slides=NB_SLIDES,
                     success=True,
                     duree=duree
                 )
-                
-            else:
-                raise Exception("Le fichier n'a pas été créé")
         
         except Exception as e:
             st.error(f"❌ Erreur lors de la génération : {str(e)}")
             
-            # Afficher le traceback pour le debugging
-            with st.expander("🔍 Détails de l'erreur"):
-                st.code(traceback.format_exc())
+            # Traceback gardé sous forme de texte (l'exception elle-même
+            # retiendrait ses frames en session) ; envoyé au navigateur
+            # seulement s'il est demandé
+            st.session_state.erreur_generation = ''.join(traceback.format_exception(e))
             
             log_generation_rapport(
-                modele="MINSANTE_OPTIMISE",
+                modele=MODELE_RAPPORT,
                 success=False,
                 message=str(e)
             )
             logger.error(f"Erreur génération rapport : {str(e)}")
 
+# Traceback de la dernière erreur de génération, pour le debugging
+if st.session_state.erreur_generation is not None:
+    with st.expander("🔍 Détails de l'erreur"):
+        if st.checkbox("Afficher la pile d'appels", key="afficher_traceback"):
+            st.code(st.session_state.erreur_generation)
+
 # ==============================================================================
 # SECTION 4 : TÉLÉCHARGEMENT
 # ==============================================================================
@@ -543,18 +692,20 @@ if st.session_state.rapport_genere:
     with col3:
         st.metric("⏱️ Temps de génération", f"{info['duree']:.1f}s")
     
-    # Bouton de téléchargement
-    with open(info['fichier'], 'rb') as f:
+    # Bouton de téléchargement (octets en cache par chemin + date de modification)
+    try:
         st.download_button(
             label="📥 TÉLÉCHARGER LE RAPPORT POWERPOINT",
-            data=f,
+            data=lire_rapport(info['fichier'], info['mtime']),
             file_name=info['nom'],
             mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
             use_container_width=True,
             type="primary"
         )
-    
-    st.success(f"✅ Rapport pour la période **{info['periode']}** prêt au téléchargement")
+        
+        st.success(f"✅ Rapport pour la période **{info['periode']}** prêt au téléchargement")
+    except FileNotFoundError:
+        st.warning("⚠️ Le fichier du rapport a été supprimé : relancez la génération")
 
 # ==============================================================================
 # SECTION 5 : HISTORIQUE DES RAPPORTS
@@ -562,58 +713,66 @@ if st.session_state.rapport_genere:
 
 st.markdown("---")
 
-with st.expander("📂 Historique des Rapports Générés", expanded=False):
-    
-    st.markdown("### 📁 Rapports Disponibles")
+@st.fragment
+def historique_rapports():
+    """
+    Historique des rapports : tableau unique, sélection et téléchargement.
     
-    # Lister les fichiers PPTX dans outputs/
-    if settings.OUTPUTS_DIR.exists():
-        fichiers_pptx = sorted(
-            settings.OUTPUTS_DIR.glob("rapport_*.pptx"),
-            key=lambda x: x.stat().st_mtime,
-            reverse=True
-        )
+    Fragment Streamlit : choisir un rapport dans la liste ne réexécute que
+    cette section, sans recharger les données ni le panneau de configuration.
+    """
+    with st.expander("📂 Historique des Rapports Générés", expanded=False):
+        
+        st.markdown("### 📁 Rapports Disponibles")
         
-        if fichiers_pptx:
-            st.info(f"📊 **{len(fichiers_pptx)} rapport(s) disponible(s)**")
+        # Lister les fichiers PPTX dans outputs/ (un scandir en cache, aucun fichier lu,
+        # absence du dossier détectée au même passage)
+        listing = lister_rapports(str(settings.OUTPUTS_DIR))
+        
+        if listing is not None:
+            nb_rapports, rapports_recents = listing
             
-            # Tableau des rapports
-            for idx, fichier in enumerate(fichiers_pptx[:15], 1):  # Limiter à 15 derniers
-                col1, col2, col3, col4, col5 = st.columns([1, 4, 2, 2, 1])
-                
-                stats = fichier.stat()
-                taille = stats.st_size / 1024 / 1024
-                date_modif = datetime.fromtimestamp(stats.st_mtime)
+            if nb_rapports:
+                st.info(f"📊 **{nb_rapports} rapport(s) disponible(s)**")
                 
-                with col1:
-                    st.write(f"**#{idx}**")
-                
-                with col2:
-                    st.write(f"📄 {fichier.name[:50]}...")
-                
-                with col3:
-                    st.write(f"📏 {taille:.2f} MB")
+                # Tableau des rapports : un seul élément au lieu de 15 lignes de colonnes
+                df_historique = pd.DataFrame(
+                    [(idx, nom, round(taille, 2), date_modif)
+                     for idx, (nom, _, taille, date_modif) in enumerate(rapports_recents, 1)],
+                    columns=['#', 'Fichier', 'Taille (MB)', 'Modifié']
+                )
+                st.dataframe(df_historique, use_container_width=True, hide_index=True)
                 
-                with col4:
-                    st.write(f"🕐 {date_modif.strftime('%d/%m/%Y %H:%M')}")
+                # Un seul rapport lu : celui choisi dans la liste (aucun par défaut)
+                chemins = {nom: chemin for nom, chemin, _, _ in rapports_recents}
+                rapport_choisi = st.selectbox(
+                    "Rapport à télécharger",
+                    options=list(chemins),
+                    index=None,
+                    placeholder="Choisir un rapport...",
+                    key="select_historique"
+                )
                 
-                with col5:
-                    with open(fichier, 'rb') as f:
+                if rapport_choisi:
+                    chemin_choisi = chemins[rapport_choisi]
+                    try:
                         st.download_button(
-                            "📥",
-                            data=f,
-                            file_name=fichier.name,
+                            f"📥 Télécharger {rapport_choisi}",
+                            data=lire_rapport(chemin_choisi, os.stat(chemin_choisi).st_mtime),
+                            file_name=rapport_choisi,
                             mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
-                            key=f"download_{idx}_{fichier.name}",
-                            help="Télécharger ce rapport"
+                            key="download_historique",
+                            use_container_width=True,
+                            type="primary"
                         )
-                
-                if idx < len(fichiers_pptx):
-                    st.markdown("---")
+                    except FileNotFoundError:
+                        st.warning(f"⚠️ {rapport_choisi} n'existe plus")
+            else:
+                st.info("📭 Aucun rapport généré pour le moment")
         else:
-            st.info("📭 Aucun rapport généré pour le moment")
-    else:
-        st.warning("⚠️ Dossier outputs/ introuvable")
+            st.warning("⚠️ Dossier outputs/ introuvable")
+
+historique_rapports()
 
 # ==============================================================================
 # SECTION 6 : GUIDE D'UTILISATION
@@ -0,0 +1,104 @@
+"""
+==============================================================================
+TESTS DU CACHE DES FIGURES (utils.charts)
+==============================================================================
+Vérifie la mémorisation des figures par empreinte : succès, échec,
+éviction LRU à _FIGURES_JSON_MAX et vidage par vider_cache_figures().
+
+Usage:
+    python -m pytest tests/test_charts.py
+
+Auteur: Fred - AIMS Cameroon / MINSANTE
+Date: Décembre 2025
+==============================================================================
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import plotly.graph_objects as go
+import pytest
+
+# Ajouter le projet au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils import charts
+
+
+@pytest.fixture
+def figure_comptee(monkeypatch):
+    """Constructeur de figure mémorisé qui compte ses constructions réelles."""
+    monkeypatch.setattr(charts, '_FIGURES_JSON_MAX', 2)
+    charts.vider_cache_figures()
+    appels = []
+
+    @charts._memoriser_figure
+    def construire(data, titre=""):
+        appels.append(titre)
+        return go.Figure(go.Bar(x=list(data.index), y=list(data.values)), layout_title_text=titre)
+
+    yield construire, appels
+    charts.vider_cache_figures()
+
+
+def test_succes_cache(figure_comptee):
+    """Mêmes données et paramètres : une seule construction, figures égales mais distinctes."""
+    construire, appels = figure_comptee
+    serie = pd.Series([1, 2, 3], index=['a', 'b', 'c'])
+
+    fig1 = construire(serie, titre="T")
+    fig2 = construire(serie.copy(), titre="T")
+
+    assert appels == ["T"]
+    assert fig1.to_json() == fig2.to_json()
+    assert fig1 is not fig2
+
+
+def test_echec_cache(figure_comptee):
+    """Données ou paramètres différents : nouvelle construction."""
+    construire, appels = figure_comptee
+    serie = pd.Series([1, 2, 3], index=['a', 'b', 'c'])
+
+    construire(serie, titre="T")
+    construire(serie, titre="U")
+    construire(pd.Series([1, 2, 4], index=['a', 'b', 'c']), titre="T")
+    construire(serie.iloc[::-1], titre="T")
+
+    assert appels == ["T", "U", "T", "T"]
+
+
+def test_eviction_max_entries(figure_comptee):
+    """Au-delà de _FIGURES_JSON_MAX, l'entrée la moins récemment utilisée est évincée."""
+    construire, appels = figure_comptee
+    serie = pd.Series([1, 2, 3], index=['a', 'b', 'c'])
+
+    construire(serie, titre="A")
+    construire(serie, titre="B")
+    construire(serie, titre="A")  # A redevient la plus récente
+    construire(serie, titre="C")  # évince B
+
+    assert len(charts._FIGURES_JSON) == 2
+    construire(serie, titre="A")
+    assert appels == ["A", "B", "C"]
+    construire(serie, titre="B")
+    assert appels == ["A", "B", "C", "B"]
+
+
+def test_vider_cache_figures(figure_comptee):
+    """Après vider_cache_figures(), la figure est reconstruite."""
+    construire, appels = figure_comptee
+    serie = pd.Series([1, 2, 3], index=['a', 'b', 'c'])
+
+    construire(serie, titre="T")
+    charts.vider_cache_figures()
+    assert len(charts._FIGURES_JSON) == 0
+
+    construire(serie, titre="T")
+    assert appels == ["T", "T"]
+
+
+def test_empreinte_valeurs_non_hachables():
+    """Listes d'éléments non hachables par pandas : repli sur repr, sans TypeError."""
+    assert charts._empreinte([{'a': 1}]) != charts._empreinte([{'a': 2}])
+    assert charts._empreinte([[1, 2], [3]]) == charts._empreinte([[1, 2], [3]])
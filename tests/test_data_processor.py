@@ -0,0 +1,80 @@
+"""
+==============================================================================
+TESTS DU MODULE DATA_PROCESSOR
+==============================================================================
+Vérifie les traitements vectorisés contre leur équivalent pandas direct.
+
+Usage:
+    python -m pytest tests/test_data_processor.py
+
+Auteur: Fred - AIMS Cameroon / MINSANTE
+Date: Décembre 2025
+==============================================================================
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Ajouter le projet au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.data_processor import sommer_categories_par_semaine
+
+
+def _appels_exemple():
+    """
+    Petites données journalières : S2_2025 est une catégorie sans aucune
+    ligne, et un jour n'a pas de semaine (code -1 dans la catégorielle).
+    """
+    semaines = pd.Categorical(
+        ['S1_2025', 'S1_2025', 'S3_2025', None, 'S3_2025', 'S1_2025'],
+        categories=['S1_2025', 'S2_2025', 'S3_2025'],
+        ordered=True
+    )
+    return pd.DataFrame({
+        'DATE': pd.date_range('2025-01-01', periods=6, freq='D'),
+        'Semaine épidémiologique': semaines,
+        'CSU_JOUR': np.array([3, 4, 5, 100, 1, 2], dtype=np.int32),
+        'PHARMACIE_JOUR': np.array([0, 7, 2, 100, 8, 1], dtype=np.int32)
+    })
+
+
+def test_sommer_categories_par_semaine_egal_groupby():
+    """Même résultat que le groupby-sum pandas, semaine vide et jour sans semaine compris."""
+    df = _appels_exemple()
+    colonnes = ['CSU_JOUR', 'PHARMACIE_JOUR']
+
+    resultat = sommer_categories_par_semaine(df, colonnes)
+    attendu = df.groupby('Semaine épidémiologique', observed=False)[colonnes].sum().astype(np.int64)
+
+    # Index comparés par libellés (catégoriel côté groupby, simple côté NumPy)
+    assert list(resultat.index) == list(attendu.index)
+    np.testing.assert_array_equal(resultat.to_numpy(), attendu.to_numpy())
+    assert list(resultat.columns) == colonnes
+    assert resultat.loc['S2_2025'].tolist() == [0, 0]
+    assert resultat.loc['S1_2025'].tolist() == [9, 8]
+
+
+def test_sommer_categories_par_semaine_colonnes_par_defaut():
+    """Sans `colonnes`, seules les catégories de settings présentes sont sommées."""
+    df = _appels_exemple()
+
+    resultat = sommer_categories_par_semaine(df)
+
+    assert list(resultat.columns) == ['CSU_JOUR', 'PHARMACIE_JOUR']
+    assert list(resultat.index) == ['S1_2025', 'S2_2025', 'S3_2025']
+
+
+def test_sommer_categories_par_semaine_semaines_non_categorielles():
+    """Une colonne de semaines en texte est convertie en catégorielle au préalable."""
+    df = _appels_exemple().dropna(subset=['Semaine épidémiologique'])
+    df['Semaine épidémiologique'] = df['Semaine épidémiologique'].astype(str)
+
+    resultat = sommer_categories_par_semaine(df, ['CSU_JOUR'])
+    attendu = df.groupby('Semaine épidémiologique')[['CSU_JOUR']].sum().astype(np.int64)
+
+    assert list(resultat.index) == list(attendu.index)
+    np.testing.assert_array_equal(resultat.to_numpy(), attendu.to_numpy())
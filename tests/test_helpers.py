@@ -0,0 +1,61 @@
+"""
+==============================================================================
+TESTS DU MODULE HELPERS
+==============================================================================
+Vérifie l'extraction vectorisée des numéros de semaine et le formatage
+des métriques (fmt_fr).
+
+Usage:
+    python -m pytest tests/test_helpers.py
+
+Auteur: Fred - AIMS Cameroon / MINSANTE
+Date: Décembre 2025
+==============================================================================
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Ajouter le projet au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.helpers import extraire_numero_semaine, extraire_numeros_semaines, fmt_fr
+
+
+def test_extraire_numeros_semaines_formats():
+    """Préfixe S ou s facultatif ; libellé non conforme ou manquant → 0."""
+    semaines = pd.Series(['S5_2025', 's12_2025', '7_2025', 'invalid', None, 'S123456_2025'])
+
+    numeros = extraire_numeros_semaines(semaines)
+
+    assert numeros.tolist() == [5, 12, 7, 0, 0, 0]
+    assert numeros.dtype == 'int16'
+    assert numeros.index.equals(semaines.index)
+
+
+def test_extraire_numeros_semaines_categoriel():
+    """Une colonne catégorielle donne les mêmes numéros que la version scalaire."""
+    labels = ['S10_2025', 'S5_2025', 'S48_2025', 'S1_2025']
+    semaines = pd.Series(pd.Categorical(labels))
+
+    assert extraire_numeros_semaines(semaines).tolist() == [extraire_numero_semaine(l) for l in labels]
+
+
+def test_fmt_fr_entiers():
+    """Entiers Python et NumPy : espaces comme séparateur de milliers."""
+    assert fmt_fr(0) == '0'
+    assert fmt_fr(1500) == '1 500'
+    assert fmt_fr(1234567) == '1 234 567'
+    assert fmt_fr(np.int64(1234567)) == '1 234 567'
+    assert fmt_fr(np.int32(-2500)) == '-2 500'
+
+
+def test_fmt_fr_flottants():
+    """Flottants Python et NumPy (ex. moyennes) : arrondis à l'unité, sans ValueError."""
+    assert fmt_fr(1234.4) == '1 234'
+    assert fmt_fr(1234.6) == '1 235'
+    assert fmt_fr(np.float64(98765.7)) == '98 766'
+    assert fmt_fr(np.float32(12.0)) == '12'
@@ -41,7 +41,8 @@ from utils.data_processor import (
     calculer_regroupements,
     obtenir_statistiques_globales,
     regrouper_par_mois,
-    comparer_periodes
+    comparer_periodes,
+    sommer_categories_par_semaine
 )
 
 # ============================================================================
@@ -49,6 +50,7 @@ from utils.data_processor import (
 # ============================================================================
 from utils.helpers import (
     extraire_numero_semaine,
+    extraire_numeros_semaines,
     obtenir_derniere_semaine,
     obtenir_semaine_precedente,
     obtenir_info_semaine_calendrier,
@@ -56,6 +58,7 @@ from utils.helpers import (
     convert_df_to_csv,
     convert_df_to_excel,
     formater_nombre,
+    fmt_fr,
     obtenir_mois_francais,
     formater_date_francais,
     formater_periode_semaine,
@@ -83,19 +86,32 @@ from utils.logger import (
 )
 
 # ============================================================================
-# CHARTS - Création de graphiques
+# CHARTS - Création de graphiques (import paresseux)
 # ============================================================================
-from utils.charts import (
-    creer_graphique_barres,
-    creer_graphique_camembert,
-    creer_graphique_ligne,
-    creer_graphique_barres_groupees,
-    creer_heatmap,
-    creer_graphique_evolution,
-    creer_graphique_variation,
-    creer_graphique_comparaison,
-    creer_graphique_distribution
-)
+# utils.charts (et ses imports plotly.express / graph_objects, son gabarit)
+# n'est chargé qu'au premier accès à une fonction de graphique : la page de
+# génération de rapports, qui n'en crée aucun, n'en paie pas le coût.
+# components/__init__.py fait de même pour components.charts.
+_CHART_NAMES = frozenset({
+    'creer_graphique_barres',
+    'creer_graphique_camembert',
+    'creer_graphique_ligne',
+    'creer_graphique_barres_groupees',
+    'creer_heatmap',
+    'creer_graphique_evolution',
+    'creer_graphique_variation',
+    'creer_graphique_comparaison',
+    'creer_graphique_distribution',
+    'vider_cache_figures'
+})
+
+
+def __getattr__(name):
+    """Résout à la demande les fonctions de utils.charts (PEP 562)."""
+    if name in _CHART_NAMES:
+        from utils import charts
+        return getattr(charts, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Version du module
 __version__ = '2.0'
@@ -119,9 +135,11 @@ __all__ = [
     'obtenir_statistiques_globales',
     'regrouper_par_mois',
     'comparer_periodes',
+    'sommer_categories_par_semaine',
     
     # Helpers
     'extraire_numero_semaine',
+    'extraire_numeros_semaines',
     'obtenir_derniere_semaine',
     'obtenir_semaine_precedente',
     'obtenir_info_semaine_calendrier',
@@ -129,6 +147,7 @@ __all__ = [
     'convert_df_to_csv',
     'convert_df_to_excel',
     'formater_nombre',
+    'fmt_fr',
     'obtenir_mois_francais',
     'formater_date_francais',
     'formater_periode_semaine',
@@ -159,5 +178,6 @@ __all__ = [
     'creer_graphique_evolution',
     'creer_graphique_variation',
     'creer_graphique_comparaison',
-    'creer_graphique_distribution'
+    'creer_graphique_distribution',
+    'vider_cache_figures'
 ]
\ No newline at end of file
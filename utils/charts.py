@@ -22,6 +22,7 @@ Fonctions disponibles :
 - creer_graphique_variation() : Barres de variation (+/-)
 - creer_graphique_comparaison() : Comparaison multi-critères
 - creer_graphique_distribution() : Distribution par catégories
+- vider_cache_figures() : Vide le cache des figures sérialisées
 
 Auteur: Fred - AIMS Cameroon / MINSANTE
 Date: Décembre 2025
@@ -31,30 +32,143 @@ Version: 2.0 (Optimisée)
 
 import plotly.graph_objects as go
 import plotly.express as px
+import plotly.io as pio
 from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
 from pathlib import Path
+from collections import OrderedDict
+import functools
+import hashlib
+import threading
 import sys
 
 # Import de la configuration
 sys.path.append(str(Path(__file__).parent.parent))
 
 from config import settings
+from utils.helpers import fmt_fr
+
+# ==============================================================================
+# CACHE DES FIGURES (JSON SÉRIALISÉ)
+# ==============================================================================
+
+# Figures déjà construites, sérialisées en JSON, par empreinte (données +
+# paramètres). LRU bornée, partagée entre les sessions (accès sous verrou).
+_FIGURES_JSON = OrderedDict()
+_FIGURES_JSON_VERROU = threading.Lock()
+_FIGURES_JSON_MAX = settings.CACHE_CONFIG['max_entries']
+
+def _empreinte(valeur):
+    """Octets représentant une valeur d'argument (contenu des données compris)."""
+    if isinstance(valeur, (pd.DataFrame, pd.Series)):
+        noms = tuple(valeur.columns) if isinstance(valeur, pd.DataFrame) else valeur.name
+        return (
+            pd.util.hash_pandas_object(valeur, index=True).values.tobytes()
+            + repr(noms).encode()
+        )
+    if isinstance(valeur, (np.ndarray, list, tuple)) and len(valeur) > 0:
+        try:
+            return pd.util.hash_pandas_object(pd.Series(valeur), index=False).values.tobytes()
+        except (TypeError, ValueError):
+            # Éléments non hachables par pandas (dict, listes imbriquées…) :
+            # repr complet (tolist() évite l'abréviation « ... » de NumPy)
+            if isinstance(valeur, np.ndarray):
+                valeur = valeur.tolist()
+    return repr(valeur).encode()
+
+def _memoriser_figure(fonction):
+    """
+    Décorateur : réutilise la figure déjà construite pour les mêmes entrées.
+    
+    La clé est un hachage blake2b du contenu des données et des paramètres :
+    une figure n'est construite et sérialisée qu'une fois ; les appels
+    suivants la reconstruisent depuis son JSON (nouvel objet à chaque appel,
+    modifiable par l'appelant sans toucher au cache).
+    """
+    @functools.wraps(fonction)
+    def wrapper(*args, **kwargs):
+        h = hashlib.blake2b(fonction.__name__.encode(), digest_size=16)
+        for valeur in args:
+            h.update(_empreinte(valeur))
+        for nom in sorted(kwargs):
+            h.update(nom.encode())
+            h.update(_empreinte(kwargs[nom]))
+        cle = h.digest()
+        
+        with _FIGURES_JSON_VERROU:
+            fig_json = _FIGURES_JSON.get(cle)
+            if fig_json is not None:
+                _FIGURES_JSON.move_to_end(cle)
+        
+        if fig_json is None:
+            fig_json = fonction(*args, **kwargs).to_json()
+            with _FIGURES_JSON_VERROU:
+                _FIGURES_JSON[cle] = fig_json
+                while len(_FIGURES_JSON) > _FIGURES_JSON_MAX:
+                    _FIGURES_JSON.popitem(last=False)
+        
+        return pio.from_json(fig_json)
+    
+    return wrapper
+
+def vider_cache_figures():
+    """Vide le cache des figures (ex. après l'import de nouvelles données)."""
+    with _FIGURES_JSON_VERROU:
+        _FIGURES_JSON.clear()
+
+# ==============================================================================
+# CHARTE GRAPHIQUE (LUE UNE FOIS DANS config.settings)
+# ==============================================================================
+
+# Ces réglages ne changent pas en cours d'exécution : résolus à l'import
+_VERT = settings.COULEURS_CAMEROUN['vert']
+_JAUNE = settings.COULEURS_CAMEROUN['jaune']
+_PALETTE = settings.COULEURS_GRAPHIQUES
+_TEMPLATE = settings.PLOTLY_TEMPLATE
+_POLICE = dict(family=settings.GRAPH_CONFIG['font_family'], size=settings.GRAPH_CONFIG['font_size'])
+_TAILLE_TITRE = settings.GRAPH_CONFIG['title_font_size']
+
+# ==============================================================================
+# MODÈLES DE TEXTE ET DE TOOLTIP (CONSTANTES)
+# ==============================================================================
+
+# Calculés une fois au chargement du module (séparateur de milliers : espace)
+_TEXT_ENTIER = '%{text:,}'.replace(',', ' ')
+_TEXT_VARIATION = '%{text:+,.0f}'.replace(',', ' ')
+_TEXT_CAMEMBERT = '%{label}<br>%{value:,}'.replace(',', ' ')
+_TEXT_CAMEMBERT_POURCENT = '%{label}<br>%{value:,}<br>(%{percent})'.replace(',', ' ')
+
+_HOVER_X_VALEUR = '<b>%{x}</b><br>Valeur: %{y:,}<extra></extra>'.replace(',', ' ')
+_HOVER_Y_VALEUR = '<b>%{y}</b><br>Valeur: %{x:,}<extra></extra>'.replace(',', ' ')
+_HOVER_CAMEMBERT = '<b>%{label}</b><br>Valeur: %{value:,}<br>Pourcentage: %{percent}<extra></extra>'.replace(',', ' ')
+_HOVER_HEATMAP = '%{x}<br>%{y}<br>Valeur: %{z:,}<extra></extra>'.replace(',', ' ')
+_HOVER_TENDANCE = 'Tendance: %{y:,.0f}<extra></extra>'.replace(',', ' ')
+_HOVER_VARIATION = '<b>%{x}</b><br>Variation: %{y:+,}<extra></extra>'.replace(',', ' ')
+
+# Fins de tooltip des séries nommées (préfixe '<b>...</b><br>' + nom ajouté à l'appel)
+_HOVER_SERIE_Y = ': %{y:,}<extra></extra>'.replace(',', ' ')
+_HOVER_SERIE_X = ': %{x:,}<extra></extra>'.replace(',', ' ')
+
+# Remplissage sous les courbes (vert Cameroun transparent)
+_FILL_VERT = 'rgba(0, 122, 51, 0.2)'
 
 # ==============================================================================
 # FONCTION 1 : GRAPHIQUE EN BARRES SIMPLE
 # ==============================================================================
 
+@_memoriser_figure
 def creer_graphique_barres(
-    data,
+    data=None,
     x_col=None,
     y_col=None,
     titre="Graphique en Barres",
     orientation='v',
     couleur=None,
     show_values=True,
-    height=500
+    height=500,
+    x=None,
+    y=None
 ):
     """
     Crée un graphique en barres simple (vertical ou horizontal).
@@ -70,6 +184,8 @@ def creer_graphique_barres(
         couleur (str, optional): Couleur des barres. Si None, utilise vert Cameroun
         show_values (bool): Afficher les valeurs sur les barres
         height (int): Hauteur du graphique en pixels
+        x (array-like, optional): Étiquettes passées directement (sans data)
+        y (array-like, optional): Valeurs passées directement (sans data)
     
     Returns:
         plotly.graph_objects.Figure: Graphique Plotly
@@ -78,43 +194,53 @@ def creer_graphique_barres(
         >>> data = {'CSU': 1200, 'Urgence': 800, 'Info': 600}
         >>> fig = creer_graphique_barres(data, titre="Top 3 Catégories")
         >>> fig.show()
+        >>> fig = creer_graphique_barres(x=df['Mois'].to_numpy(), y=df['Total'].to_numpy())
     """
-    # Convertir dict en DataFrame si nécessaire
-    if isinstance(data, dict):
-        df = pd.DataFrame(list(data.items()), columns=['Catégorie', 'Valeur'])
-        x_col = 'Catégorie'
-        y_col = 'Valeur'
+    if x is not None and y is not None:
+        # Tableaux fournis directement : aucune construction de DataFrame
+        x_col = x_col or 'Catégorie'
+        y_col = y_col or 'Valeur'
+        x_vals, y_vals = x, y
     else:
-        df = data.copy()
+        # Convertir dict en DataFrame si nécessaire
+        if isinstance(data, dict):
+            df = pd.DataFrame(list(data.items()), columns=['Catégorie', 'Valeur'])
+            x_col = 'Catégorie'
+            y_col = 'Valeur'
+        else:
+            df = data  # Lecture seule (aucune copie) : ne pas modifier data
+        
+        # Tableaux NumPy : Plotly les reprend sans copie (une Series serait convertie)
+        x_vals, y_vals = df[x_col].to_numpy(), df[y_col].to_numpy()
     
     # Couleur par défaut
     if couleur is None:
-        couleur = settings.COULEURS_CAMEROUN['vert']
+        couleur = _VERT
     
     # Créer le graphique
     if orientation == 'v':
         fig = go.Figure(data=[
             go.Bar(
-                x=df[x_col],
-                y=df[y_col],
+                x=x_vals,
+                y=y_vals,
                 marker_color=couleur,
-                text=df[y_col] if show_values else None,
+                text=y_vals if show_values else None,
                 textposition='outside',
-                texttemplate='%{text:,}'.replace(',', ' '),
-                hovertemplate='<b>%{x}</b><br>Valeur: %{y:,}<extra></extra>'.replace(',', ' ')
+                texttemplate=_TEXT_ENTIER,
+                hovertemplate=_HOVER_X_VALEUR
             )
         ])
     else:  # horizontal
         fig = go.Figure(data=[
             go.Bar(
-                x=df[y_col],
-                y=df[x_col],
+                x=y_vals,
+                y=x_vals,
                 marker_color=couleur,
                 orientation='h',
-                text=df[y_col] if show_values else None,
+                text=y_vals if show_values else None,
                 textposition='outside',
-                texttemplate='%{text:,}'.replace(',', ' '),
-                hovertemplate='<b>%{y}</b><br>Valeur: %{x:,}<extra></extra>'.replace(',', ' ')
+                texttemplate=_TEXT_ENTIER,
+                hovertemplate=_HOVER_Y_VALEUR
             )
         ])
     
@@ -124,11 +250,11 @@ def creer_graphique_barres(
         xaxis_title=x_col if orientation == 'v' else y_col,
         yaxis_title=y_col if orientation == 'v' else x_col,
         height=height,
-        template=settings.PLOTLY_TEMPLATE,
+        template=_TEMPLATE,
         showlegend=False,
         plot_bgcolor='white',
-        font=dict(family=settings.GRAPH_CONFIG['font_family'], size=settings.GRAPH_CONFIG['font_size']),
-        title_font_size=settings.GRAPH_CONFIG['title_font_size']
+        font=_POLICE,
+        title_font_size=_TAILLE_TITRE
     )
     
     return fig
@@ -137,6 +263,7 @@ def creer_graphique_barres(
 # FONCTION 2 : GRAPHIQUE CAMEMBERT (PIE/DONUT)
 # ==============================================================================
 
+@_memoriser_figure
 def creer_graphique_camembert(
     data,
     labels_col=None,
@@ -173,11 +300,11 @@ def creer_graphique_camembert(
         labels_col = 'Label'
         values_col = 'Valeur'
     else:
-        df = data.copy()
+        df = data  # Lecture seule (aucune copie) : ne pas modifier data
     
     # Couleurs par défaut
     if couleurs is None:
-        couleurs = settings.COULEURS_GRAPHIQUES
+        couleurs = _PALETTE
     
     # Type de graphique
     if type_graphique == 'donut' and hole == 0:
@@ -186,13 +313,13 @@ def creer_graphique_camembert(
     # Créer le graphique
     fig = go.Figure(data=[
         go.Pie(
-            labels=df[labels_col],
-            values=df[values_col],
+            labels=df[labels_col].to_numpy(),
+            values=df[values_col].to_numpy(),
             marker=dict(colors=couleurs),
             hole=hole,
             textposition='auto',
-            texttemplate='%{label}<br>%{value:,}<br>(%{percent})'.replace(',', ' ') if show_percentages else '%{label}<br>%{value:,}'.replace(',', ' '),
-            hovertemplate='<b>%{label}</b><br>Valeur: %{value:,}<br>Pourcentage: %{percent}<extra></extra>'.replace(',', ' ')
+            texttemplate=_TEXT_CAMEMBERT_POURCENT if show_percentages else _TEXT_CAMEMBERT,
+            hovertemplate=_HOVER_CAMEMBERT
         )
     ])
     
@@ -200,9 +327,9 @@ def creer_graphique_camembert(
     fig.update_layout(
         title=titre,
         height=500,
-        template=settings.PLOTLY_TEMPLATE,
-        font=dict(family=settings.GRAPH_CONFIG['font_family'], size=settings.GRAPH_CONFIG['font_size']),
-        title_font_size=settings.GRAPH_CONFIG['title_font_size']
+        template=_TEMPLATE,
+        font=_POLICE,
+        title_font_size=_TAILLE_TITRE
     )
     
     return fig
@@ -211,6 +338,7 @@ def creer_graphique_camembert(
 # FONCTION 3 : GRAPHIQUE EN LIGNE (ÉVOLUTION)
 # ==============================================================================
 
+@_memoriser_figure
 def creer_graphique_ligne(
     data,
     x_col,
@@ -242,11 +370,11 @@ def creer_graphique_ligne(
     Example:
         >>> fig = creer_graphique_ligne(df, 'Semaine', 'Total', titre="Évolution des appels")
     """
-    df = data.copy()
+    df = data  # Lecture seule (aucune copie) : ne pas modifier data
     
     # Couleur par défaut
     if couleur is None:
-        couleur = settings.COULEURS_CAMEROUN['vert']
+        couleur = _VERT
     
     # Créer le graphique
     mode = 'lines+markers' if show_markers else 'lines'
@@ -255,15 +383,15 @@ def creer_graphique_ligne(
     
     # Ligne principale
     fig.add_trace(go.Scatter(
-        x=df[x_col],
-        y=df[y_col],
+        x=df[x_col].to_numpy(),
+        y=df[y_col].to_numpy(),
         mode=mode,
         name='Valeurs',
         line=dict(color=couleur, width=3),
         marker=dict(size=8, color=couleur),
         fill='tozeroy' if fill_area else None,
-        fillcolor=f'rgba(0, 122, 51, 0.2)' if fill_area else None,
-        hovertemplate='<b>%{x}</b><br>Valeur: %{y:,}<extra></extra>'.replace(',', ' ')
+        fillcolor=_FILL_VERT if fill_area else None,
+        hovertemplate=_HOVER_X_VALEUR
     ))
     
     # Ligne de moyenne (optionnelle)
@@ -272,8 +400,8 @@ def creer_graphique_ligne(
         fig.add_hline(
             y=moyenne,
             line_dash="dash",
-            line_color=settings.COULEURS_CAMEROUN['jaune'],
-            annotation_text=f"Moyenne: {int(moyenne):,}".replace(',', ' '),
+            line_color=_JAUNE,
+            annotation_text=f"Moyenne: {fmt_fr(int(moyenne))}",
             annotation_position="right"
         )
     
@@ -283,10 +411,10 @@ def creer_graphique_ligne(
         xaxis_title=x_col,
         yaxis_title=y_col,
         height=height,
-        template=settings.PLOTLY_TEMPLATE,
+        template=_TEMPLATE,
         hovermode='x unified',
-        font=dict(family=settings.GRAPH_CONFIG['font_family'], size=settings.GRAPH_CONFIG['font_size']),
-        title_font_size=settings.GRAPH_CONFIG['title_font_size'],
+        font=_POLICE,
+        title_font_size=_TAILLE_TITRE,
         plot_bgcolor='white',
         xaxis=dict(showgrid=True, gridcolor='lightgray'),
         yaxis=dict(showgrid=True, gridcolor='lightgray')
@@ -298,6 +426,7 @@ def creer_graphique_ligne(
 # FONCTION 4 : GRAPHIQUE BARRES GROUPÉES (COMPARAISON)
 # ==============================================================================
 
+@_memoriser_figure
 def creer_graphique_barres_groupees(
     data,
     x_col,
@@ -328,11 +457,11 @@ def creer_graphique_barres_groupees(
         ...     titre="Comparaison S9 vs S10"
         ... )
     """
-    df = data.copy()
+    df = data  # Lecture seule (aucune copie) : ne pas modifier data
     
     # Couleurs par défaut
     if couleurs is None:
-        couleurs = settings.COULEURS_GRAPHIQUES
+        couleurs = _PALETTE
     
     fig = go.Figure()
     
@@ -343,25 +472,25 @@ def creer_graphique_barres_groupees(
         if orientation == 'v':
             fig.add_trace(go.Bar(
                 name=col,
-                x=df[x_col],
-                y=df[col],
+                x=df[x_col].to_numpy(),
+                y=df[col].to_numpy(),
                 marker_color=couleur,
-                text=df[col],
+                text=df[col].to_numpy(),
                 textposition='outside',
-                texttemplate='%{text:,}'.replace(',', ' '),
-                hovertemplate='<b>%{x}</b><br>' + col + ': %{y:,}<extra></extra>'.replace(',', ' ')
+                texttemplate=_TEXT_ENTIER,
+                hovertemplate='<b>%{x}</b><br>' + col + _HOVER_SERIE_Y
             ))
         else:
             fig.add_trace(go.Bar(
                 name=col,
-                x=df[col],
-                y=df[x_col],
+                x=df[col].to_numpy(),
+                y=df[x_col].to_numpy(),
                 marker_color=couleur,
                 orientation='h',
-                text=df[col],
+                text=df[col].to_numpy(),
                 textposition='outside',
-                texttemplate='%{text:,}'.replace(',', ' '),
-                hovertemplate='<b>%{y}</b><br>' + col + ': %{x:,}<extra></extra>'.replace(',', ' ')
+                texttemplate=_TEXT_ENTIER,
+                hovertemplate='<b>%{y}</b><br>' + col + _HOVER_SERIE_X
             ))
     
     # Mise en forme
@@ -370,10 +499,10 @@ def creer_graphique_barres_groupees(
         xaxis_title=x_col if orientation == 'v' else "Valeur",
         yaxis_title="Valeur" if orientation == 'v' else x_col,
         height=height,
-        template=settings.PLOTLY_TEMPLATE,
+        template=_TEMPLATE,
         barmode='group',
-        font=dict(family=settings.GRAPH_CONFIG['font_family'], size=settings.GRAPH_CONFIG['font_size']),
-        title_font_size=settings.GRAPH_CONFIG['title_font_size'],
+        font=_POLICE,
+        title_font_size=_TAILLE_TITRE,
         plot_bgcolor='white'
     )
     
@@ -383,6 +512,7 @@ def creer_graphique_barres_groupees(
 # FONCTION 5 : HEATMAP (CARTE DE CHALEUR)
 # ==============================================================================
 
+@_memoriser_figure
 def creer_heatmap(
     data,
     x_col,
@@ -417,12 +547,12 @@ def creer_heatmap(
     
     fig = go.Figure(data=go.Heatmap(
         z=df_pivot.values,
-        x=df_pivot.columns,
-        y=df_pivot.index,
+        x=df_pivot.columns.to_numpy(),
+        y=df_pivot.index.to_numpy(),
         colorscale=colorscale,
         text=df_pivot.values if show_values else None,
-        texttemplate='%{text:,}'.replace(',', ' ') if show_values else None,
-        hovertemplate='%{x}<br>%{y}<br>Valeur: %{z:,}<extra></extra>'.replace(',', ' ')
+        texttemplate=_TEXT_ENTIER if show_values else None,
+        hovertemplate=_HOVER_HEATMAP
     ))
     
     # Mise en forme
@@ -431,9 +561,9 @@ def creer_heatmap(
         xaxis_title=x_col,
         yaxis_title=y_col,
         height=height,
-        template=settings.PLOTLY_TEMPLATE,
-        font=dict(family=settings.GRAPH_CONFIG['font_family'], size=settings.GRAPH_CONFIG['font_size']),
-        title_font_size=settings.GRAPH_CONFIG['title_font_size']
+        template=_TEMPLATE,
+        font=_POLICE,
+        title_font_size=_TAILLE_TITRE
     )
     
     return fig
@@ -442,6 +572,7 @@ def creer_heatmap(
 # FONCTION 6 : GRAPHIQUE D'ÉVOLUTION AVANCÉ
 # ==============================================================================
 
+@_memoriser_figure
 def creer_graphique_evolution(
     data,
     x_col,
@@ -468,24 +599,28 @@ def creer_graphique_evolution(
     Returns:
         plotly.graph_objects.Figure: Graphique Plotly
     """
-    df = data.copy()
+    df = data  # Lecture seule (aucune copie) : ne pas modifier data
     
     if couleur is None:
-        couleur = settings.COULEURS_CAMEROUN['vert']
+        couleur = _VERT
+    
+    # Colonnes extraites une fois (tableaux contigus) : courbe et tendance
+    x_vals = df[x_col].to_numpy()
+    y_vals = df[y_col].to_numpy()
     
     fig = go.Figure()
     
     # Courbe principale
     fig.add_trace(go.Scatter(
-        x=df[x_col],
-        y=df[y_col],
+        x=x_vals,
+        y=y_vals,
         mode='lines+markers',
         name='Données',
         line=dict(color=couleur, width=3),
         marker=dict(size=8),
         fill='tozeroy',
-        fillcolor='rgba(0, 122, 51, 0.2)',
-        hovertemplate='<b>%{x}</b><br>Valeur: %{y:,}<extra></extra>'.replace(',', ' ')
+        fillcolor=_FILL_VERT,
+        hovertemplate=_HOVER_X_VALEUR
     ))
     
     # Ligne de moyenne
@@ -494,24 +629,24 @@ def creer_graphique_evolution(
         fig.add_hline(
             y=moyenne,
             line_dash="dash",
-            line_color=settings.COULEURS_CAMEROUN['jaune'],
-            annotation_text=f"Moyenne: {int(moyenne):,}".replace(',', ' '),
+            line_color=_JAUNE,
+            annotation_text=f"Moyenne: {fmt_fr(int(moyenne))}",
             annotation_position="right"
         )
     
     # Ligne de tendance (régression linéaire)
     if ajouter_tendance and len(df) > 1:
         x_numeric = np.arange(len(df))
-        coeffs = np.polyfit(x_numeric, df[y_col], 1)
+        coeffs = np.polyfit(x_numeric, y_vals, 1)
         tendance = coeffs[0] * x_numeric + coeffs[1]
         
         fig.add_trace(go.Scatter(
-            x=df[x_col],
+            x=x_vals,
             y=tendance,
             mode='lines',
             name='Tendance',
-            line=dict(color=settings.COULEURS_CAMEROUN['jaune'], width=2, dash='dash'),
-            hovertemplate='Tendance: %{y:,.0f}<extra></extra>'.replace(',', ' ')
+            line=dict(color=_JAUNE, width=2, dash='dash'),
+            hovertemplate=_HOVER_TENDANCE
         ))
     
     # Mise en forme
@@ -520,10 +655,10 @@ def creer_graphique_evolution(
         xaxis_title=x_col,
         yaxis_title=y_col,
         height=height,
-        template=settings.PLOTLY_TEMPLATE,
+        template=_TEMPLATE,
         hovermode='x unified',
-        font=dict(family=settings.GRAPH_CONFIG['font_family'], size=settings.GRAPH_CONFIG['font_size']),
-        title_font_size=settings.GRAPH_CONFIG['title_font_size'],
+        font=_POLICE,
+        title_font_size=_TAILLE_TITRE,
         plot_bgcolor='white'
     )
     
@@ -533,6 +668,7 @@ def creer_graphique_evolution(
 # FONCTION 7 : GRAPHIQUE DE VARIATION (+/-)
 # ==============================================================================
 
+@_memoriser_figure
 def creer_graphique_variation(
     data,
     x_col,
@@ -557,25 +693,26 @@ def creer_graphique_variation(
     Returns:
         plotly.graph_objects.Figure: Graphique Plotly
     """
-    df = data.copy()
+    df = data  # Lecture seule (aucune copie) : ne pas modifier data
     
     if couleur_positive is None:
         couleur_positive = '#28a745'
     if couleur_negative is None:
         couleur_negative = '#dc3545'
     
-    # Déterminer les couleurs selon le signe
-    couleurs = [couleur_positive if x > 0 else couleur_negative for x in df[y_col]]
+    # Déterminer les couleurs selon le signe (vectorisé ; NaN -> couleur négative)
+    valeurs = df[y_col].to_numpy()
+    couleurs = np.where(valeurs > 0, couleur_positive, couleur_negative).tolist()
     
     fig = go.Figure(data=[
         go.Bar(
-            x=df[x_col],
-            y=df[y_col],
+            x=df[x_col].to_numpy(),
+            y=valeurs,
             marker_color=couleurs,
-            text=df[y_col],
+            text=valeurs,
             textposition='outside',
-            texttemplate='%{text:+,.0f}'.replace(',', ' '),
-            hovertemplate='<b>%{x}</b><br>Variation: %{y:+,}<extra></extra>'.replace(',', ' ')
+            texttemplate=_TEXT_VARIATION,
+            hovertemplate=_HOVER_VARIATION
         )
     ])
     
@@ -588,10 +725,10 @@ def creer_graphique_variation(
         xaxis_title=x_col,
         yaxis_title="Variation",
         height=height,
-        template=settings.PLOTLY_TEMPLATE,
+        template=_TEMPLATE,
         showlegend=False,
-        font=dict(family=settings.GRAPH_CONFIG['font_family'], size=settings.GRAPH_CONFIG['font_size']),
-        title_font_size=settings.GRAPH_CONFIG['title_font_size'],
+        font=_POLICE,
+        title_font_size=_TAILLE_TITRE,
         plot_bgcolor='white'
     )
     
@@ -601,6 +738,7 @@ def creer_graphique_variation(
 # FONCTION 8 : GRAPHIQUE DE COMPARAISON MULTI-CRITÈRES
 # ==============================================================================
 
+@_memoriser_figure
 def creer_graphique_comparaison(
     data,
     categories,
@@ -623,10 +761,10 @@ def creer_graphique_comparaison(
     Returns:
         plotly.graph_objects.Figure: Graphique Plotly
     """
-    df = data.copy()
+    df = data  # Lecture seule (aucune copie) : ne pas modifier data
     fig = go.Figure()
     
-    couleurs = settings.COULEURS_GRAPHIQUES
+    couleurs = _PALETTE
     
     for i, (nom_serie, col_data) in enumerate(series_dict.items()):
         couleur = couleurs[i % len(couleurs)]
@@ -634,20 +772,20 @@ def creer_graphique_comparaison(
         if type_graphique == 'barres':
             fig.add_trace(go.Bar(
                 name=nom_serie,
-                x=df[categories],
-                y=df[col_data],
+                x=df[categories].to_numpy(),
+                y=df[col_data].to_numpy(),
                 marker_color=couleur,
-                hovertemplate='<b>%{x}</b><br>' + nom_serie + ': %{y:,}<extra></extra>'.replace(',', ' ')
+                hovertemplate='<b>%{x}</b><br>' + nom_serie + _HOVER_SERIE_Y
             ))
         else:  # lignes
             fig.add_trace(go.Scatter(
                 name=nom_serie,
-                x=df[categories],
-                y=df[col_data],
+                x=df[categories].to_numpy(),
+                y=df[col_data].to_numpy(),
                 mode='lines+markers',
                 line=dict(color=couleur, width=3),
                 marker=dict(size=8),
-                hovertemplate='<b>%{x}</b><br>' + nom_serie + ': %{y:,}<extra></extra>'.replace(',', ' ')
+                hovertemplate='<b>%{x}</b><br>' + nom_serie + _HOVER_SERIE_Y
             ))
     
     # Mise en forme
@@ -656,11 +794,11 @@ def creer_graphique_comparaison(
         xaxis_title=categories,
         yaxis_title="Valeur",
         height=height,
-        template=settings.PLOTLY_TEMPLATE,
+        template=_TEMPLATE,
         barmode='group' if type_graphique == 'barres' else None,
         hovermode='x unified',
-        font=dict(family=settings.GRAPH_CONFIG['font_family'], size=settings.GRAPH_CONFIG['font_size']),
-        title_font_size=settings.GRAPH_CONFIG['title_font_size'],
+        font=_POLICE,
+        title_font_size=_TAILLE_TITRE,
         plot_bgcolor='white'
     )
     
@@ -670,6 +808,7 @@ def creer_graphique_comparaison(
 # FONCTION 9 : GRAPHIQUE DE DISTRIBUTION
 # ==============================================================================
 
+@_memoriser_figure
 def creer_graphique_distribution(
     data,
     valeurs_col,
@@ -694,14 +833,14 @@ def creer_graphique_distribution(
     Returns:
         plotly.graph_objects.Figure: Graphique Plotly
     """
-    df = data.copy()
+    df = data  # Lecture seule (aucune copie) : ne pas modifier data
     
     if couleur is None:
-        couleur = settings.COULEURS_CAMEROUN['vert']
+        couleur = _VERT
     
     fig = go.Figure(data=[
         go.Histogram(
-            x=df[valeurs_col],
+            x=df[valeurs_col].to_numpy(),
             nbinsx=bins,
             marker_color=couleur,
             opacity=0.75,
@@ -715,7 +854,7 @@ def creer_graphique_distribution(
         fig.add_vline(
             x=moyenne,
             line_dash="dash",
-            line_color=settings.COULEURS_CAMEROUN['jaune'],
+            line_color=_JAUNE,
             line_width=3,
             annotation_text=f"Moyenne: {moyenne:.1f}",
             annotation_position="top"
@@ -727,10 +866,10 @@ def creer_graphique_distribution(
         xaxis_title=valeurs_col,
         yaxis_title="Fréquence",
         height=height,
-        template=settings.PLOTLY_TEMPLATE,
+        template=_TEMPLATE,
         showlegend=False,
-        font=dict(family=settings.GRAPH_CONFIG['font_family'], size=settings.GRAPH_CONFIG['font_size']),
-        title_font_size=settings.GRAPH_CONFIG['title_font_size'],
+        font=_POLICE,
+        title_font_size=_TAILLE_TITRE,
         plot_bgcolor='white'
     )
     
@@ -22,13 +22,120 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 from datetime import datetime
+import functools
+import hashlib
 import os
+from importlib.util import find_spec
 
 # Import de la configuration
 import sys
 sys.path.append(str(Path(__file__).parent.parent))
 
 from config import settings
+from utils.helpers import extraire_numeros_semaines
+
+# ==============================================================================
+# CACHE PARQUET DES FICHIERS EXCEL
+# ==============================================================================
+
+# Clé des métadonnées Parquet portant la signature du fichier source
+_CLE_SIGNATURE_SOURCE = b'signature_source'
+
+# pyarrow (requirements.txt) vérifié une seule fois : sans lui, le cache
+# Parquet est simplement désactivé et les fichiers Excel sont relus
+PARQUET_DISPONIBLE = find_spec('pyarrow') is not None
+if not PARQUET_DISPONIBLE:
+    print("⚠️ pyarrow introuvable : cache Parquet des fichiers Excel désactivé")
+
+def _chemin_cache_parquet(fichier_path):
+    """
+    Chemin de la copie Parquet associée à un fichier Excel source.
+    
+    Le nom combine le nom du fichier et une empreinte de son chemin absolu :
+    deux sources homonymes dans des dossiers différents ne partagent pas
+    la même copie.
+    """
+    chemin = Path(fichier_path).resolve()
+    empreinte = hashlib.blake2b(str(chemin).encode('utf-8'), digest_size=8).hexdigest()
+    return settings.CACHE_DIR / f"{chemin.stem}_{empreinte}.parquet"
+
+def _signature_source(fichier_path):
+    """Signature exacte du fichier source : date de modification (ns) et taille."""
+    infos = os.stat(fichier_path)
+    return f"{infos.st_mtime_ns}:{infos.st_size}".encode('ascii')
+
+def _lire_cache_parquet(fichier_path, colonnes=None):
+    """
+    Lit la copie Parquet d'un fichier Excel si elle est à jour.
+    
+    La copie n'est valide que si la signature enregistrée dans ses
+    métadonnées est identique à celle du fichier source : une sauvegarde
+    restaurée (date de modification plus ancienne) invalide donc la copie.
+    
+    Args:
+        fichier_path (str): Chemin du fichier Excel source
+        colonnes (list, optional): Colonnes à lire (projection faite par
+            pyarrow : les autres colonnes ne sont pas décodées)
+    
+    Returns:
+        pd.DataFrame ou None: None si absente, périmée (signature différente),
+        illisible ou si pyarrow est absent ; l'appelant relit alors l'Excel.
+    """
+    if not PARQUET_DISPONIBLE:
+        return None
+    
+    chemin_cache = _chemin_cache_parquet(fichier_path)
+    try:
+        if chemin_cache.exists():
+            import pyarrow.parquet as pq
+            
+            metadonnees = pq.read_schema(chemin_cache).metadata or {}
+            if metadonnees.get(_CLE_SIGNATURE_SOURCE) == _signature_source(fichier_path):
+                return pd.read_parquet(chemin_cache, columns=colonnes)
+    except Exception as e:
+        print(f"⚠️ Cache Parquet ignoré ({chemin_cache.name}) : {str(e)}")
+    return None
+
+def _ecrire_cache_parquet(df, fichier_path):
+    """Enregistre la copie Parquet d'un DataFrame chargé, signée par sa source (échec non bloquant)."""
+    if not PARQUET_DISPONIBLE:
+        return
+    
+    chemin_cache = _chemin_cache_parquet(fichier_path)
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        metadonnees = dict(table.schema.metadata or {})
+        metadonnees[_CLE_SIGNATURE_SOURCE] = _signature_source(fichier_path)
+        
+        chemin_cache.parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(table.replace_schema_metadata(metadonnees), chemin_cache, compression='zstd')
+    except Exception as e:
+        print(f"⚠️ Cache Parquet non écrit ({chemin_cache.name}) : {str(e)}")
+
+# ==============================================================================
+# LIBELLÉS DE SEMAINE DE REPLI (SANS CALENDRIER)
+# ==============================================================================
+
+def _libelles_semaine_iso(dates):
+    """
+    Libellés 'S{semaine ISO}_{année}' (ex. 'S5_2025') pour une Series de dates.
+    
+    Construits en tableaux NumPy (numéro et année en entiers, une seule
+    concaténation de chaînes), sans Series intermédiaires d'objets Python.
+    
+    Args:
+        dates (pd.Series): Dates (datetime64, sans NaT)
+    
+    Returns:
+        pd.Series: Libellés de semaine, même index que `dates`
+    """
+    semaines = dates.dt.isocalendar().week.to_numpy(dtype=np.int64).astype(str)
+    annees = dates.dt.year.to_numpy(dtype=np.int64).astype(str)
+    libelles = np.char.add(np.char.add('S', semaines), np.char.add('_', annees))
+    return pd.Series(libelles, index=dates.index, dtype=object)
 
 # ==============================================================================
 # FONCTION 1 : CHARGEMENT DES APPELS JOURNALIERS
@@ -48,6 +155,8 @@ def charger_donnees_appels(fichier_path=None):
             - Semaine épidémiologique (str)
             - TOTAL_APPELS_JOUR (int)
             - [17 catégories d'appels] (int)
+        Le DataFrame est partagé entre les appels (mis en mémoire par chemin
+        et date de modification) : il est en lecture seule.
     
     Raises:
         FileNotFoundError: Si le fichier n'existe pas
@@ -58,64 +167,16 @@ def charger_donnees_appels(fichier_path=None):
         if fichier_path is None:
             fichier_path = settings.CHEMINS_FICHIERS['appels']
         
-        # Vérifier l'existence du fichier
-        if not os.path.exists(fichier_path):
+        # Vérifier l'existence du fichier (un seul stat : existence + date de modification)
+        try:
+            mtime = os.path.getmtime(fichier_path)
+        except OSError:
             raise FileNotFoundError(
                 f"Le fichier des appels n'existe pas : {fichier_path}"
             )
         
-        # Charger le fichier Excel
-        df = pd.read_excel(
-            fichier_path,
-            sheet_name=settings.SHEET_APPELS,
-            engine='openpyxl'
-        )
-        
-        # Vérifier les colonnes requises
-        colonnes_requises = ['DATE'] + settings.CATEGORIES_APPELS
-        colonnes_manquantes = [col for col in colonnes_requises if col not in df.columns]
-        
-        if colonnes_manquantes:
-            raise ValueError(
-                f"Colonnes manquantes dans le fichier : {', '.join(colonnes_manquantes)}"
-            )
-        
-        # Convertir la colonne DATE en datetime
-        df['DATE'] = pd.to_datetime(df['DATE'], errors='coerce')
-        
-        # Supprimer les lignes avec des dates invalides
-        lignes_avant = len(df)
-        df = df.dropna(subset=['DATE'])
-        lignes_apres = len(df)
-        
-        if lignes_avant != lignes_apres:
-            print(f"⚠️ {lignes_avant - lignes_apres} lignes avec dates invalides ont été supprimées")
-        
-        # Vérifier la présence de la colonne 'Semaine épidémiologique'
-        if 'Semaine épidémiologique' not in df.columns:
-            print("⚠️ Colonne 'Semaine épidémiologique' manquante, elle sera ajoutée")
-            # Créer une semaine épidémiologique basique si absente
-            df['Semaine épidémiologique'] = 'S' + df['DATE'].dt.isocalendar().week.astype(str) + '_' + df['DATE'].dt.year.astype(str)
-        
-        # Remplacer les valeurs manquantes par 0 pour les catégories d'appels
-        for categorie in settings.CATEGORIES_APPELS:
-            if categorie in df.columns:
-                df[categorie] = df[categorie].fillna(0).astype(int)
-        
-        # Calculer le total des appels par jour si absent
-        if 'TOTAL_APPELS_JOUR' not in df.columns:
-            colonnes_categories = [col for col in settings.CATEGORIES_APPELS if col in df.columns]
-            df['TOTAL_APPELS_JOUR'] = df[colonnes_categories].sum(axis=1)
-        else:
-            df['TOTAL_APPELS_JOUR'] = df['TOTAL_APPELS_JOUR'].fillna(0).astype(int)
-        
-        # Trier par date
-        df = df.sort_values('DATE').reset_index(drop=True)
-        
-        print(f"✅ {len(df)} lignes chargées depuis {os.path.basename(fichier_path)}")
-        print(f"📅 Période : {df['DATE'].min().strftime('%d/%m/%Y')} - {df['DATE'].max().strftime('%d/%m/%Y')}")
-        
-        return df
+        # Fichier inchangé depuis le dernier chargement : DataFrame servi depuis la mémoire
+        return _lire_appels(str(fichier_path), mtime)
         
     except FileNotFoundError as e:
         print(f"❌ Erreur : {str(e)}")
@@ -127,6 +188,91 @@ def charger_donnees_appels(fichier_path=None):
         print(f"❌ Erreur inattendue lors du chargement : {str(e)}")
         raise
 
+# ==============================================================================
+# FONCTION 1 BIS : LECTURE DES APPELS (EN MÉMOIRE PAR CHEMIN + MTIME)
+# ==============================================================================
+
+@functools.lru_cache(maxsize=8)
+def _lire_appels(fichier_path, mtime):
+    """
+    Lit et prépare les appels journaliers (Parquet à jour, sinon Excel).
+    
+    Mis en mémoire par (chemin, date de modification) : un fichier inchangé
+    n'est ni relu ni reparsé ; une modification change la clé, l'ancienne
+    entrée sort d'elle-même de la LRU.
+    
+    Args:
+        fichier_path (str): Chemin du fichier Excel
+        mtime (float): Date de modification du fichier (clé de fraîcheur)
+    
+    Returns:
+        pd.DataFrame: Appels journaliers triés par DATE (lecture seule)
+    """
+    # Seules ces colonnes sont utilisées en aval : les autres ne sont pas lues
+    colonnes_utiles = ['DATE', 'Semaine épidémiologique', 'TOTAL_APPELS_JOUR'] + settings.CATEGORIES_APPELS
+    
+    # Copie Parquet à jour : lecture colonnaire, sans reparser l'Excel
+    df_cache = _lire_cache_parquet(fichier_path, colonnes=colonnes_utiles)
+    if df_cache is not None:
+        print(f"✅ {len(df_cache)} lignes chargées depuis le cache Parquet")
+        return df_cache
+    
+    # Charger le fichier Excel (colonnes utiles seulement)
+    df = pd.read_excel(
+        fichier_path,
+        sheet_name=settings.SHEET_APPELS,
+        usecols=lambda col: col in colonnes_utiles,
+        engine='openpyxl'
+    )
+    
+    # Vérifier les colonnes requises
+    colonnes_requises = ['DATE'] + settings.CATEGORIES_APPELS
+    colonnes_manquantes = [col for col in colonnes_requises if col not in df.columns]
+    
+    if colonnes_manquantes:
+        raise ValueError(
+            f"Colonnes manquantes dans le fichier : {', '.join(colonnes_manquantes)}"
+        )
+    
+    # Convertir la colonne DATE en datetime
+    df['DATE'] = pd.to_datetime(df['DATE'], errors='coerce')
+    
+    # Supprimer les lignes avec des dates invalides
+    lignes_avant = len(df)
+    df = df.dropna(subset=['DATE'])
+    lignes_apres = len(df)
+    
+    if lignes_avant != lignes_apres:
+        print(f"⚠️ {lignes_avant - lignes_apres} lignes avec dates invalides ont été supprimées")
+    
+    # Vérifier la présence de la colonne 'Semaine épidémiologique'
+    if 'Semaine épidémiologique' not in df.columns:
+        print("⚠️ Colonne 'Semaine épidémiologique' manquante, elle sera ajoutée")
+        # Créer une semaine épidémiologique basique si absente
+        df['Semaine épidémiologique'] = _libelles_semaine_iso(df['DATE'])
+    
+    # Remplacer les valeurs manquantes par 0 pour les catégories d'appels
+    # (un seul fillna + astype sur le bloc de colonnes, pas une colonne à la fois)
+    colonnes_categories = [col for col in settings.CATEGORIES_APPELS if col in df.columns]
+    df[colonnes_categories] = df[colonnes_categories].fillna(0).astype(np.int32)
+    
+    # Calculer le total des appels par jour si absent
+    if 'TOTAL_APPELS_JOUR' not in df.columns:
+        df['TOTAL_APPELS_JOUR'] = df[colonnes_categories].to_numpy().sum(axis=1, dtype=np.int32)
+    else:
+        df['TOTAL_APPELS_JOUR'] = df['TOTAL_APPELS_JOUR'].fillna(0).astype(np.int32)
+    
+    # Trier par date
+    df = df.sort_values('DATE').reset_index(drop=True)
+    
+    print(f"✅ {len(df)} lignes chargées depuis {os.path.basename(fichier_path)}")
+    print(f"📅 Période : {df['DATE'].min().strftime('%d/%m/%Y')} - {df['DATE'].max().strftime('%d/%m/%Y')}")
+    
+    # Copie Parquet pour les prochains chargements
+    _ecrire_cache_parquet(df, fichier_path)
+    
+    return df
+
 # ==============================================================================
 # FONCTION 2 : CHARGEMENT DU CALENDRIER ÉPIDÉMIOLOGIQUE
 # ==============================================================================
@@ -142,7 +288,7 @@ def charger_calendrier_epidemiologique(fichier_path=None):
     Returns:
         pd.DataFrame: DataFrame avec les colonnes :
             - DATE (datetime) : Chaque date de l'année
-            - Semaine épidémiologique (str) : Label S[num]_2025
+            - Semaine épidémiologique (category ordonnée) : Label S[num]_2025
     
     Raises:
         FileNotFoundError: Si le fichier n'existe pas
@@ -161,6 +307,12 @@ def charger_calendrier_epidemiologique(fichier_path=None):
         
         print(f"📅 Chargement calendrier : {os.path.basename(fichier_path)}")
         
+        # Copie Parquet à jour : calendrier déjà étendu, semaine déjà catégorielle
+        df_cache = _lire_cache_parquet(fichier_path)
+        if df_cache is not None:
+            print(f"✅ Calendrier chargé depuis le cache Parquet : {df_cache['Week_No'].nunique()} semaines")
+            return df_cache
+        
         # Charger le fichier avec skiprows
         df = pd.read_excel(
             fichier_path,
@@ -205,8 +357,20 @@ def charger_calendrier_epidemiologique(fichier_path=None):
         # Supprimer les doublons de dates (garder la première occurrence)
         df_calendrier_expanded = df_calendrier_expanded.drop_duplicates(subset=['DATE'], keep='first')
         
+        # Semaine en catégorielle ordonnée (codes entiers pour filtres/groupby,
+        # encodée en dictionnaire dans le Parquet)
+        semaines = pd.Series(df_calendrier_expanded['Semaine épidémiologique'].dropna().unique())
+        df_calendrier_expanded['Semaine épidémiologique'] = pd.Categorical(
+            df_calendrier_expanded['Semaine épidémiologique'],
+            categories=semaines.iloc[extraire_numeros_semaines(semaines).argsort(kind='stable')].tolist(),
+            ordered=True
+        )
+        
         print(f"✅ Calendrier chargé : {df['Week_No'].nunique()} semaines")
         
+        # Copie Parquet pour les prochains chargements
+        _ecrire_cache_parquet(df_calendrier_expanded, fichier_path)
+        
         return df_calendrier_expanded
         
     except FileNotFoundError as e:
@@ -220,21 +384,63 @@ def charger_calendrier_epidemiologique(fichier_path=None):
 # FONCTION 3 : CHARGEMENT COMPLET AVEC AGRÉGATION (VERSION CORRIGÉE)
 # ==============================================================================
 
-def charger_toutes_les_donnees():
+def _reduire_largeur_numerique(df, colonnes=None, entier_min=np.int32):
+    """
+    Réduit la largeur des colonnes numériques (en place).
+    
+    Entiers int64 → plus petit type entier suffisant, sans descendre sous
+    `entier_min` ; flottants float64 → float32 (compteurs d'appels, bien en
+    deçà de la précision de float32).
+    
+    Par défaut aucun entier ne descend sous int32 : une différence ou une
+    somme élément par élément de colonnes int8/int16 déborderait sans
+    erreur (ex. la colonne 'Variation' des tableaux de comparaison).
+    
+    Args:
+        df (pd.DataFrame): DataFrame à modifier
+        colonnes (list, optional): Colonnes à traiter (toutes si None)
+        entier_min (type, optional): Type entier minimal conservé
+    """
+    taille_min = np.dtype(entier_min).itemsize
+    for col in (df.columns if colonnes is None else colonnes):
+        if col not in df.columns:
+            continue
+        if pd.api.types.is_integer_dtype(df[col]):
+            reduite = pd.to_numeric(df[col], downcast='integer')
+            if reduite.dtype.itemsize < taille_min:
+                reduite = reduite.astype(entier_min)
+            df[col] = reduite
+        elif pd.api.types.is_float_dtype(df[col]):
+            df[col] = df[col].astype('float32')
+
+# DataFrames pouvant être demandés à charger_toutes_les_donnees()
+RESSOURCES_DISPONIBLES = ('appels', 'calendrier', 'hebdomadaire')
+
+def charger_toutes_les_donnees(ressources=None):
     """
     Charge toutes les données et effectue l'agrégation hebdomadaire.
     VERSION CORRIGÉE : Suppression des doublons avant agrégation.
     
+    Args:
+        ressources (tuple, optional): DataFrames à renvoyer parmi
+            RESSOURCES_DISPONIBLES (tous par défaut). Sans 'hebdomadaire',
+            l'agrégation et la vérification de cohérence sont sautées.
+    
     Returns:
         dict: Dictionnaire contenant :
-            - 'appels' (pd.DataFrame) : Données journalières
+            - 'appels' (pd.DataFrame) : Données journalières, triées par DATE
             - 'calendrier' (pd.DataFrame) : Calendrier épidémiologique
             - 'hebdomadaire' (pd.DataFrame) : Données agrégées par semaine
             - 'statistiques' (dict) : Statistiques globales
+            - 'semaines_asc' / 'semaines_desc' (tuple) : Semaines triées par numéro
+            - 'colonnes_numeriques' (dict) : Colonnes numériques par DataFrame
     
     Raises:
         Exception: Si une erreur se produit lors du chargement
     """
+    if ressources is None:
+        ressources = RESSOURCES_DISPONIBLES
+    
     try:
         print("🔄 Chargement des données en cours...")
         
@@ -254,13 +460,32 @@ def charger_toutes_les_donnees():
         )
         
         # Remplir les semaines manquantes si besoin
-        if df_appels['Semaine épidémiologique'].isna().any():
+        semaines_manquantes = df_appels['Semaine épidémiologique'].isna()
+        if semaines_manquantes.any():
             print("⚠️ Certaines dates n'ont pas de semaine dans le calendrier")
-            df_appels['Semaine épidémiologique'] = df_appels['Semaine épidémiologique'].fillna(
-                'S' + df_appels['DATE'].dt.isocalendar().week.astype(str) + '_' + 
-                df_appels['DATE'].dt.year.astype(str)
+            # (repasser en objet : les labels calculés ne sont pas des catégories ;
+            # libellés calculés pour les seules lignes sans semaine)
+            df_appels['Semaine épidémiologique'] = df_appels['Semaine épidémiologique'].astype(object).fillna(
+                _libelles_semaine_iso(df_appels.loc[semaines_manquantes, 'DATE'])
             )
         
+        # Semaine en catégorielle ordonnée (codes entiers pour filtres/groupby)
+        # (numéros extraits en une passe vectorisée, tri stable sur ces entiers)
+        semaines_uniques = pd.Series(df_appels['Semaine épidémiologique'].unique())
+        categories_semaines = semaines_uniques.iloc[
+            extraire_numeros_semaines(semaines_uniques).argsort(kind='stable')
+        ].tolist()
+        df_appels['Semaine épidémiologique'] = pd.Categorical(
+            df_appels['Semaine épidémiologique'],
+            categories=categories_semaines,
+            ordered=True
+        )
+        
+        # (le calendrier est déjà catégoriel ordonné, avec ses propres semaines)
+        
+        # Comptes journaliers déjà en int32 au chargement ; calendrier int64 → int32
+        _reduire_largeur_numerique(df_calendrier)
+        
         # 4. CORRECTION : Supprimer les doublons de dates avant agrégation
         nb_lignes_avant = len(df_appels)
         df_appels_unique = df_appels.drop_duplicates(subset=['DATE'], keep='first').copy()
@@ -269,66 +494,25 @@ def charger_toutes_les_donnees():
         if nb_lignes_avant != nb_lignes_apres:
             print(f"⚠️ {nb_lignes_avant - nb_lignes_apres} doublons de dates supprimés")
         
-        # 5. Agrégation hebdomadaire (sur données sans doublons)
-        print("📊 Agrégation des données par semaine...")
-        
-        # Préparer le dictionnaire d'agrégation
-        agg_dict = {}
-        for categorie in settings.CATEGORIES_APPELS:
-            if categorie in df_appels_unique.columns:
-                col_semaine = categorie.replace('_JOUR', '_SEMAINE')
-                agg_dict[categorie] = 'sum'
-        
-        # Ajouter les agrégations pour les dates
-        agg_dict['DATE'] = ['min', 'max', 'count']
-        agg_dict['TOTAL_APPELS_JOUR'] = 'sum'
-        
-        # Grouper par semaine
-        df_hebdo = df_appels_unique.groupby('Semaine épidémiologique').agg(agg_dict).reset_index()
-        
-        # Aplatir les colonnes multi-index
-        df_hebdo.columns = ['_'.join(col).strip('_') if isinstance(col, tuple) else col 
-                            for col in df_hebdo.columns.values]
-        
-        # Renommer les colonnes
-        df_hebdo = df_hebdo.rename(columns={
-            'DATE_min': 'date_debut',
-            'DATE_max': 'date_fin',
-            'DATE_count': 'nb_jours',
-            'TOTAL_APPELS_JOUR_sum': 'TOTAL_APPELS_SEMAINE'
-        })
-        
-        # Renommer les catégories en _SEMAINE
-        for categorie in settings.CATEGORIES_APPELS:
-            if categorie in df_hebdo.columns:
-                col_semaine = categorie.replace('_JOUR', '_SEMAINE')
-                df_hebdo = df_hebdo.rename(columns={categorie: col_semaine})
-        
-        print(f"✅ Agrégation hebdomadaire : {len(df_hebdo)} semaines")
-        print(f"📊 Total général : {df_hebdo['TOTAL_APPELS_SEMAINE'].sum():,.0f} appels")
-        
-        # 6. Vérification de la cohérence (VERSION CORRIGÉE)
-        print("🔍 Vérification de la cohérence des données...")
+        # 5-6. Agrégation hebdomadaire et cohérence (seulement si demandée)
+        if 'hebdomadaire' in ressources:
+            df_hebdo = _agreger_hebdomadaire(df_appels_unique)
+            nb_semaines = len(df_hebdo)
+            moyenne_semaine = float(df_hebdo['TOTAL_APPELS_SEMAINE'].mean()) if nb_semaines > 0 else 0
+        else:
+            df_hebdo = None
+            nb_semaines = int(df_appels_unique['Semaine épidémiologique'].nunique())
+            moyenne_semaine = float(df_appels_unique['TOTAL_APPELS_JOUR'].sum()) / nb_semaines if nb_semaines > 0 else 0
         
         total_journalier = df_appels_unique['TOTAL_APPELS_JOUR'].sum()
-        total_hebdomadaire = df_hebdo['TOTAL_APPELS_SEMAINE'].sum()
-        
-        difference = abs(total_journalier - total_hebdomadaire)
-        pourcentage_diff = (difference / total_journalier * 100) if total_journalier > 0 else 0
-        
-        if pourcentage_diff > 1:  # Tolérance de 1%
-            print("⚠️ Avertissement : Incohérences détectées")
-            print(f"  - Différence entre totaux journaliers ({total_journalier:,.0f}) et hebdomadaires ({total_hebdomadaire:,.0f}) : {pourcentage_diff:.2f}%")
-        else:
-            print(f"✅ Données cohérentes (différence : {pourcentage_diff:.2f}%)")
         
         # 7. Statistiques globales
         statistiques = {
             'nb_jours': len(df_appels_unique),
-            'nb_semaines': len(df_hebdo),
+            'nb_semaines': nb_semaines,
             'total_appels': int(total_journalier),
             'moyenne_jour': float(df_appels_unique['TOTAL_APPELS_JOUR'].mean()),
-            'moyenne_semaine': float(df_hebdo['TOTAL_APPELS_SEMAINE'].mean()) if len(df_hebdo) > 0 else 0,
+            'moyenne_semaine': moyenne_semaine,
             'date_min': df_appels_unique['DATE'].min(),
             'date_max': df_appels_unique['DATE'].max()
         }
@@ -336,12 +520,28 @@ def charger_toutes_les_donnees():
         print(f"✅ Chargement terminé !")
         print(f"📊 {statistiques['nb_jours']} jours | {statistiques['nb_semaines']} semaines | {statistiques['total_appels']:,} appels")
         
-        return {
+        donnees = {
             'appels': df_appels,  # Retourner le DataFrame ORIGINAL (avec potentiels doublons pour analyse)
             'calendrier': df_calendrier,
             'hebdomadaire': df_hebdo,
-            'statistiques': statistiques
+            'statistiques': statistiques,
+            # Semaines triées une fois pour toutes (pour les listes déroulantes)
+            'semaines_asc': tuple(categories_semaines),
+            'semaines_desc': tuple(reversed(categories_semaines)),
+            # Colonnes numériques (dtypes figés après chargement)
+            'colonnes_numeriques': {
+                'appels': df_appels.select_dtypes(include=np.number).columns.tolist()
+            }
         }
+        if df_hebdo is not None:
+            donnees['colonnes_numeriques']['hebdomadaire'] = df_hebdo.select_dtypes(include=np.number).columns.tolist()
+        
+        # Ne renvoyer que les DataFrames demandés (les clés dérivées restent)
+        for ressource in RESSOURCES_DISPONIBLES:
+            if ressource not in ressources:
+                donnees.pop(ressource)
+        
+        return donnees
         
     except Exception as e:
         print(f"❌ Erreur lors du chargement complet : {str(e)}")
@@ -349,6 +549,79 @@ def charger_toutes_les_donnees():
         traceback.print_exc()
         raise
 
+# ==============================================================================
+# FONCTION 3 BIS : AGRÉGATION HEBDOMADAIRE
+# ==============================================================================
+
+def _agreger_hebdomadaire(df_appels_unique):
+    """
+    Agrège les appels journaliers (sans doublons) par semaine épidémiologique
+    et vérifie la cohérence des totaux.
+    
+    Args:
+        df_appels_unique (pd.DataFrame): Données journalières dédoublonnées
+    
+    Returns:
+        pd.DataFrame: Données agrégées par semaine
+    """
+    # 5. Agrégation hebdomadaire (sur données sans doublons)
+    print("📊 Agrégation des données par semaine...")
+    
+    # Préparer le dictionnaire d'agrégation
+    agg_dict = {}
+    for categorie in settings.CATEGORIES_APPELS:
+        if categorie in df_appels_unique.columns:
+            col_semaine = categorie.replace('_JOUR', '_SEMAINE')
+            agg_dict[categorie] = 'sum'
+    
+    # Ajouter les agrégations pour les dates
+    agg_dict['DATE'] = ['min', 'max', 'count']
+    agg_dict['TOTAL_APPELS_JOUR'] = 'sum'
+    
+    # Grouper par semaine
+    df_hebdo = df_appels_unique.groupby('Semaine épidémiologique', observed=True).agg(agg_dict).reset_index()
+    
+    # Aplatir les colonnes multi-index
+    df_hebdo.columns = ['_'.join(col).strip('_') if isinstance(col, tuple) else col 
+                        for col in df_hebdo.columns.values]
+    
+    # Renommer les colonnes
+    df_hebdo = df_hebdo.rename(columns={
+        'DATE_min': 'date_debut',
+        'DATE_max': 'date_fin',
+        'DATE_count': 'nb_jours',
+        'TOTAL_APPELS_JOUR_sum': 'TOTAL_APPELS_SEMAINE'
+    })
+    
+    # Renommer les catégories en _SEMAINE
+    for categorie in settings.CATEGORIES_APPELS:
+        if categorie in df_hebdo.columns:
+            col_semaine = categorie.replace('_JOUR', '_SEMAINE')
+            df_hebdo = df_hebdo.rename(columns={categorie: col_semaine})
+    
+    # Sommes hebdomadaires (et nb_jours) : int64 → int32, pas en deçà
+    _reduire_largeur_numerique(df_hebdo)
+    
+    print(f"✅ Agrégation hebdomadaire : {len(df_hebdo)} semaines")
+    print(f"📊 Total général : {df_hebdo['TOTAL_APPELS_SEMAINE'].sum():,.0f} appels")
+    
+    # 6. Vérification de la cohérence (VERSION CORRIGÉE)
+    print("🔍 Vérification de la cohérence des données...")
+    
+    total_journalier = df_appels_unique['TOTAL_APPELS_JOUR'].sum()
+    total_hebdomadaire = df_hebdo['TOTAL_APPELS_SEMAINE'].sum()
+    
+    difference = abs(total_journalier - total_hebdomadaire)
+    pourcentage_diff = (difference / total_journalier * 100) if total_journalier > 0 else 0
+    
+    if pourcentage_diff > 1:  # Tolérance de 1%
+        print("⚠️ Avertissement : Incohérences détectées")
+        print(f"  - Différence entre totaux journaliers ({total_journalier:,.0f}) et hebdomadaires ({total_hebdomadaire:,.0f}) : {pourcentage_diff:.2f}%")
+    else:
+        print(f"✅ Données cohérentes (différence : {pourcentage_diff:.2f}%)")
+    
+    return df_hebdo
+
 # ==============================================================================
 # FONCTION 4 : VÉRIFICATION DE LA COHÉRENCE DES DONNÉES
 # ==============================================================================
@@ -18,6 +18,7 @@ Fonctions principales :
 - regrouper_par_mois() : Conversion semaines → mois
 - calculer_top_categories() : Top N des catégories
 - comparer_periodes() : Comparaison multi-périodes [CORRIGÉE]
+- sommer_categories_par_semaine() : Matrice semaines × catégories (NumPy)
 
 Auteur: Fred - AIMS Cameroon / MINSANTE
 Date: 17 Décembre 2025
@@ -34,7 +35,7 @@ import sys
 sys.path.append(str(Path(__file__).parent.parent))
 
 from config import settings
-from utils.helpers import extraire_numero_semaine
+from utils.helpers import extraire_numeros_semaines
 
 # ==============================================================================
 # FONCTION 1 : AGRÉGATION HEBDOMADAIRE
@@ -82,7 +83,7 @@ def calculer_totaux_hebdomadaires(df_appels):
             raise ValueError("Aucune catégorie d'appels trouvée dans le DataFrame")
         
         # Grouper par semaine et sommer
-        df_hebdo = df_appels.groupby('Semaine épidémiologique')[colonnes_categories].sum().reset_index()
+        df_hebdo = df_appels.groupby('Semaine épidémiologique', observed=True)[colonnes_categories].sum().reset_index()
         
         # Renommer les colonnes : _JOUR → _SEMAINE
         colonnes_renommees = {
@@ -96,7 +97,7 @@ def calculer_totaux_hebdomadaires(df_appels):
         df_hebdo['TOTAL_APPELS_SEMAINE'] = df_hebdo[colonnes_semaine].sum(axis=1)
         
         # Trier par numéro de semaine
-        df_hebdo['_sort_key'] = df_hebdo['Semaine épidémiologique'].apply(extraire_numero_semaine)
+        df_hebdo['_sort_key'] = extraire_numeros_semaines(df_hebdo['Semaine épidémiologique'])
         df_hebdo = df_hebdo.sort_values('_sort_key').drop('_sort_key', axis=1).reset_index(drop=True)
         
         print(f"✅ Agrégation hebdomadaire : {len(df_hebdo)} semaines")
@@ -491,7 +492,7 @@ def regrouper_par_mois(df_hebdo):
         df = df_hebdo.copy()
         
         # Extraire le numéro de semaine
-        df['num_semaine'] = df['Semaine épidémiologique'].apply(extraire_numero_semaine)
+        df['num_semaine'] = extraire_numeros_semaines(df['Semaine épidémiologique'])
         
         # Fonction de conversion semaine → mois
         def semaine_to_mois(num_semaine):
@@ -671,6 +672,52 @@ def comparer_periodes(df_appels, liste_semaines):
         print(f"❌ Erreur lors de la comparaison : {str(e)}")
         raise
 
+# ==============================================================================
+# FONCTION 9 : MATRICE SEMAINES × CATÉGORIES (NUMPY)
+# ==============================================================================
+
+def sommer_categories_par_semaine(df_appels, colonnes=None):
+    """
+    Somme les catégories d'appels par semaine en un seul passage NumPy.
+    
+    Les codes entiers de la colonne catégorielle 'Semaine épidémiologique'
+    servent d'indices de ligne : toutes les catégories sont accumulées en
+    une seule opération (np.add.at), sans filtrer le DataFrame par semaine.
+    
+    Args:
+        df_appels (pd.DataFrame): Données journalières
+        colonnes (list, optional): Colonnes à sommer.
+            Si None, toutes les catégories présentes de settings.CATEGORIES_APPELS
+    
+    Returns:
+        pd.DataFrame: Totaux (int64), index = semaines, colonnes = catégories
+    
+    Example:
+        >>> matrice = sommer_categories_par_semaine(df_appels)
+        >>> matrice.loc['S10_2025', 'CSU_JOUR']
+        12
+    """
+    try:
+        if colonnes is None:
+            colonnes = [col for col in settings.CATEGORIES_APPELS if col in df_appels.columns]
+        
+        semaines = df_appels['Semaine épidémiologique']
+        if not isinstance(semaines.dtype, pd.CategoricalDtype):
+            semaines = semaines.astype('category')
+        
+        codes = semaines.cat.codes.to_numpy()
+        valides = codes >= 0  # -1 = semaine manquante
+        valeurs = df_appels[colonnes].to_numpy(dtype=np.int64)
+        
+        totaux = np.zeros((len(semaines.cat.categories), len(colonnes)), dtype=np.int64)
+        np.add.at(totaux, codes[valides], valeurs[valides])
+        
+        return pd.DataFrame(totaux, index=semaines.cat.categories, columns=colonnes)
+        
+    except Exception as e:
+        print(f"❌ Erreur lors de la somme par semaine : {str(e)}")
+        raise
+
 # ==============================================================================
 # FIN DU MODULE
 # ==============================================================================
\ No newline at end of file
@@ -6,6 +6,7 @@ Ce module centralise les fonctions utilitaires répétées dans l'application.
 
 Fonctions principales :
 - extraire_numero_semaine() : Extraction numéro depuis 'S10_2025'
+- extraire_numeros_semaines() : Même extraction, vectorisée sur une Series
 - obtenir_derniere_semaine() : Dernière semaine disponible
 - obtenir_semaine_precedente() : Semaine précédente
 - obtenir_info_semaine_calendrier() : Info détaillée d'une semaine
@@ -13,6 +14,7 @@ Fonctions principales :
 - convert_df_to_csv() : Export CSV
 - convert_df_to_excel() : Export Excel
 - formater_nombre() : Format avec espaces milliers
+- fmt_fr() : Format rapide d'un entier pour les métriques
 - obtenir_mois_francais() : Dictionnaire mois en français
 - formater_date_francais() : Format date français
 - formater_periode_semaine() : Format période
@@ -71,6 +73,36 @@ def extraire_numero_semaine(semaine_label):
     except (ValueError, IndexError, AttributeError):
         return 0
 
+# ==============================================================================
+# FONCTION 1 BIS : EXTRACTION VECTORISÉE DES NUMÉROS DE SEMAINE
+# ==============================================================================
+
+def extraire_numeros_semaines(semaines):
+    """
+    Version vectorisée de extraire_numero_semaine() pour une colonne entière.
+    
+    Une seule expression régulière appliquée par pandas (.str.extract) au
+    lieu d'un appel Python par élément (apply, clé de sorted).
+    
+    Args:
+        semaines (pd.Series): Labels de semaines (ex: 'S10_2025')
+    
+    Returns:
+        pd.Series: Numéros de semaine (int16), 0 si le libellé ne correspond
+            pas au format [S|s]<1 à 4 chiffres>_<année> (ou est manquant)
+    
+    Example:
+        >>> extraire_numeros_semaines(pd.Series(['S10_2025', 'S5_2025', 'invalid']))
+        0    10
+        1     5
+        2     0
+        dtype: int16
+    """
+    # Au plus 4 chiffres : tout numéro extrait tient dans un int16
+    numeros = semaines.astype('string').str.extract(r'^[Ss]?(\d{1,4})_', expand=False)
+    # Libellés non conformes (NA après extract) : 0 explicite avant conversion
+    return numeros.fillna('0').astype('int16')
+
 # ==============================================================================
 # FONCTION 2 : OBTENIR LA DERNIÈRE SEMAINE
 # ==============================================================================
@@ -392,6 +424,36 @@ def formater_nombre(nombre, decimales=0, separateur=' '):
     except (ValueError, TypeError):
         return str(nombre)
 
+# ==============================================================================
+# FONCTION 8 BIS : FORMATAGE RAPIDE D'UN ENTIER (MÉTRIQUES)
+# ==============================================================================
+
+# Table de traduction construite une seule fois : virgule -> espace
+_TABLE_MILLIERS_FR = {ord(','): ' '}
+
+def fmt_fr(n):
+    """
+    Formate un nombre arrondi à l'unité, avec des espaces comme séparateur
+    de milliers.
+    
+    Version allégée de formater_nombre() pour les métriques affichées à
+    chaque rerun : un seul format() puis str.translate(), sans gestion des
+    NaN. Les flottants (Python ou NumPy, ex. une moyenne) sont arrondis.
+    
+    Args:
+        n (int | float): Nombre à formater (entiers NumPy acceptés)
+    
+    Returns:
+        str: Entier formaté
+    
+    Example:
+        >>> fmt_fr(1500)
+        '1 500'
+        >>> fmt_fr(1234.6)
+        '1 235'
+    """
+    return format(int(round(n)), ',d').translate(_TABLE_MILLIERS_FR)
+
 # ==============================================================================
 # FONCTION 9 : OBTENIR MOIS EN FRANÇAIS
 # ==============================================================================
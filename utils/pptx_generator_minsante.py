@@ -570,35 +570,36 @@ def generer_rapport_minsante(df_appels, df_calendrier, semaine, output_path):
     # Préparer données graphiques
     # ✅ CORRECTION : Utiliser les VRAIES clés de settings.REGROUPEMENTS
     
-    # Graphique 1 : Renseignements Santé
-    renseignements_data = {}
-    if 'Renseignements Santé' in settings.REGROUPEMENTS:
-        for cat in settings.REGROUPEMENTS['Renseignements Santé']:
-            if cat in df_semaine.columns:
-                val = int(df_semaine[cat].sum())
+    # Les slides s'ajoutent dans l'ordre à une même Presentation (python-pptx
+    # n'est pas thread-safe) : seule la préparation des données est mutualisée.
+    # Une seule somme par colonne pour les trois camemberts.
+    colonnes_categories = list(dict.fromkeys(
+        cat
+        for groupe in ('Renseignements Santé', 'Assistances Médicales', 'Signaux')
+        for cat in settings.REGROUPEMENTS.get(groupe, [])
+        if cat in df_semaine.columns
+    ))
+    sommes_categories = df_semaine[colonnes_categories].sum()
+    
+    def repartition(groupe):
+        """Dictionnaire {libellé: total} des catégories non nulles du groupe."""
+        donnees = {}
+        for cat in settings.REGROUPEMENTS.get(groupe, []):
+            if cat in sommes_categories.index:
+                val = int(sommes_categories[cat])
                 if val > 0:
                     label = settings.LABELS_CATEGORIES.get(cat, cat)
-                    renseignements_data[label] = val
+                    donnees[label] = val
+        return donnees
+    
+    # Graphique 1 : Renseignements Santé
+    renseignements_data = repartition('Renseignements Santé')
     
     # Graphique 2 : Assistances Médicales
-    assistance_data = {}
-    if 'Assistances Médicales' in settings.REGROUPEMENTS:
-        for cat in settings.REGROUPEMENTS['Assistances Médicales']:
-            if cat in df_semaine.columns:
-                val = int(df_semaine[cat].sum())
-                if val > 0:
-                    label = settings.LABELS_CATEGORIES.get(cat, cat)
-                    assistance_data[label] = val
+    assistance_data = repartition('Assistances Médicales')
     
     # Graphique 3 : Signaux
-    signaux_data = {}
-    if 'Signaux' in settings.REGROUPEMENTS:
-        for cat in settings.REGROUPEMENTS['Signaux']:
-            if cat in df_semaine.columns:
-                val = int(df_semaine[cat].sum())
-                if val > 0:
-                    label = settings.LABELS_CATEGORIES.get(cat, cat)
-                    signaux_data[label] = val
+    signaux_data = repartition('Signaux')
     
     # Créer générateur
     gen = MinsantePPTXGenerator()